@@ -20,6 +20,7 @@ from scipy.optimize import curve_fit
 import numpy as np
 from qiskit import QiskitError
 from ..verification.tomography import marginal_counts
+from ..utils import ResultIndex
 
 
 class BaseFitter:
@@ -58,16 +59,12 @@ class BaseFitter:
 
         self._circuit_names = circuit_names
 
-        self._backend_result_list = []
+        self._result_index = ResultIndex()
         autofit = False
 
         if backend_result is not None:
             autofit = True
-            if isinstance(backend_result, list):
-                for result in backend_result:
-                    self._backend_result_list.append(result)
-            else:
-                self._backend_result_list.append(backend_result)
+            self._result_index.add_results(backend_result)
 
         self._description = description
         self._expected_state = expected_state
@@ -200,11 +197,7 @@ class BaseFitter:
             refit: Refit the data
         """
 
-        if isinstance(results, list):
-            for result in results:
-                self._backend_result_list.append(result)
-        else:
-            self._backend_result_list.append(results)
+        self._result_index.add_results(results)
 
         if recalc:
             self._calc_data()  # computes self._ydata
@@ -227,15 +220,7 @@ class BaseFitter:
         for _, serieslbl in enumerate(self._series):
             for circ, _ in enumerate(self._xdata):
                 circname = self._circuit_names[circ] + serieslbl
-                count_list = []
-                for result in self._backend_result_list:
-                    try:
-                        count_list.append(result.get_counts(circname))
-                    except (QiskitError, KeyError):
-                        pass
-
-                circ_counts[circname] = \
-                    build_counts_dict_from_list(count_list)
+                circ_counts[circname] = self._result_index.counts(circname)
 
         self._ydata = {}
         for _, serieslbl in enumerate(self._series):
@@ -373,7 +358,7 @@ class IQFitter(BaseFitter):
         shots_list = {}
         meas_ret = ''
 
-        for single_result in self._backend_result_list:
+        for single_result in self._result_index.results:
             # go through each of the schedules in this run
             for result in single_result.results:
                 sname = result.header.name
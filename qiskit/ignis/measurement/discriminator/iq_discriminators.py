@@ -23,6 +23,7 @@ from qiskit.ignis.measurement.discriminator.discriminators import \
 from qiskit.pulse import PulseError
 from qiskit.result import Result
 from qiskit.pulse.schedule import Schedule
+from qiskit.ignis.utils import ResultIndex
 try:
     from matplotlib import pyplot as plt
     HAS_MATPLOTLIB = True
@@ -83,21 +84,16 @@ class IQDiscriminationFitter(BaseDiscriminationFitter):
         if schedules is None:
             schedules = self._get_schedules(results)
 
+        result_index = ResultIndex(results)
         for schedule in schedules:
-            iq_data = None
-            if isinstance(results, list):
-                for result in results:
-                    try:
-                        iq_data = result.get_memory(schedule)
-                    except QiskitError:
-                        pass
-            else:
-                iq_data = results.get_memory(schedule)
+            if isinstance(schedule, Schedule):
+                schedule = schedule.name
 
-            if iq_data is None:
+            memory_list = result_index.memory_list(schedule)
+            if not memory_list:
                 raise PulseError('Could not find IQ data for %s' % schedule)
 
-            xdata.extend(self.format_iq_data(iq_data))
+            xdata.extend(self.format_iq_data(memory_list[-1]))
 
         return self._scale_data(xdata)
 
@@ -119,22 +115,16 @@ class IQDiscriminationFitter(BaseDiscriminationFitter):
         if schedules is None:
             schedules = self._get_schedules(results)
 
+        result_index = ResultIndex(results)
         for schedule in schedules:
             if isinstance(schedule, Schedule):
                 shed_name = schedule.name
             else:
                 shed_name = schedule
 
-            if isinstance(results, Result):
-                results = [results]
-
-            for result in results:
-                try:
-                    iq_data = result.get_memory(schedule)
-                    n_shots = iq_data.shape[0]
-                    ydata.extend([self._expected_state[shed_name]]*n_shots)
-                except QiskitError:
-                    pass
+            for iq_data in result_index.memory_list(shed_name):
+                n_shots = iq_data.shape[0]
+                ydata.extend([self._expected_state[shed_name]]*n_shots)
 
         return ydata
 
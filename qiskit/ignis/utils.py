@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Utilities shared by the ignis fitters
+"""
+
+from qiskit import QiskitError
+
+
+class ResultIndex:
+    """
+    Index of the experiments of a list of results by experiment name.
+
+    The fitters look up the data of each of their circuits in every result
+    they were given. The index maps each experiment name to the results
+    containing it once, when the results are added, so that the data of a
+    circuit is found without searching the results or raising an exception
+    for each result that does not contain it.
+
+    As with `Result.get_counts`, only the first experiment of a given name
+    of each result is used.
+    """
+
+    def __init__(self, results=None):
+        """
+        Args:
+            results (Result or list): results to index (optional).
+        """
+        self._results = []
+        # experiment name -> list of (result, experiment index)
+        self._locations = {}
+        # experiment name -> merged counts
+        self._counts = {}
+        if results is not None:
+            self.add_results(results)
+
+    @property
+    def results(self):
+        """Return the indexed results."""
+        return self._results
+
+    def add_results(self, results):
+        """
+        Add results to the index.
+
+        Args:
+            results (Result or list): a result or list of results.
+        """
+        if not isinstance(results, list):
+            results = [results]
+        for result in results:
+            self._results.append(result)
+            seen = set()
+            for exp_index, experiment in enumerate(result.results):
+                name = getattr(getattr(experiment, 'header', None), 'name',
+                               '')
+                if name in seen:
+                    continue
+                seen.add(name)
+                self._locations.setdefault(name, []).append(
+                    (result, exp_index))
+                self._counts.pop(name, None)
+
+    def names(self):
+        """Return the experiment names in the order they were added."""
+        return list(self._locations)
+
+    def __contains__(self, name):
+        return name in self._locations
+
+    def locations(self, name):
+        """
+        Return the locations of an experiment.
+
+        Args:
+            name (str): the experiment name.
+
+        Returns:
+            list: (result, experiment index) pairs of each result containing
+            the experiment, in the order the results were added.
+        """
+        return self._locations.get(name, [])
+
+    def counts_list(self, name):
+        """
+        Return the counts of an experiment in each result.
+
+        Args:
+            name (str): the experiment name.
+
+        Returns:
+            list: the counts of each result containing the experiment with
+            count data.
+        """
+        count_list = []
+        for result, exp_index in self.locations(name):
+            try:
+                count_list.append(result.get_counts(exp_index))
+            except (QiskitError, KeyError):
+                pass
+        return count_list
+
+    def counts(self, name):
+        """
+        Return the counts of an experiment merged over all the results.
+
+        Args:
+            name (str): the experiment name.
+
+        Returns:
+            dict: the merged counts, which are empty if no result contains
+            counts of the experiment.
+        """
+        if name not in self._counts:
+            count_list = self.counts_list(name)
+            if len(count_list) == 1:
+                self._counts[name] = count_list[0]
+            else:
+                merged = {}
+                for counts in count_list:
+                    for key, val in counts.items():
+                        merged[key] = merged.get(key, 0) + val
+                self._counts[name] = merged
+        return self._counts[name]
+
+    def memory_list(self, name):
+        """
+        Return the memory of an experiment in each result.
+
+        Args:
+            name (str): the experiment name.
+
+        Returns:
+            list: the memory of each result containing the experiment with
+            memory data.
+        """
+        memory_list = []
+        for result, exp_index in self.locations(name):
+            try:
+                memory_list.append(result.get_memory(exp_index))
+            except QiskitError:
+                pass
+        return memory_list
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Classical shadow circuit generation.
+"""
+
+import numpy as np
+
+from qiskit import QiskitError
+from ..tomography.basis import state_tomography_circuits
+from ..tomography.basis.circuits import _format_registers
+
+
+def classical_shadow_circuits(circuit, measured_qubits, num_settings,
+                              seed=None):
+    """
+    Return a list of classical shadow measurement circuits.
+
+    Each circuit measures every qubit in an independently and uniformly
+    chosen single-qubit Pauli basis, using the measurement circuits of the
+    `PauliBasis` tomography basis.
+
+    Args:
+        circuit (QuantumCircuit): the state preparation circuit.
+        measured_qubits (QuantumRegister): the qubits to be measured.
+            This can also be a list of whole QuantumRegisters or
+            individual QuantumRegister qubit tuples.
+        num_settings (int): the number of random measurement settings.
+        seed (int or None): seed for the random choice of measurement
+            settings (Default: None).
+
+    Returns:
+        A list of QuantumCircuit objects containing the original circuit
+        with random Pauli measurements appended at the end.
+
+    Additional Information:
+        The returned circuits are named by the tuple `(j, labels)` of the
+        setting index and the measurement label of each measured qubit, so
+        that repeated settings are kept as distinct circuits. The circuits
+        should be executed with `memory=True` so that the individual shots
+        can be processed by the `ClassicalShadowFitter`.
+    """
+    if isinstance(measured_qubits, list):
+        num_qubits = len(_format_registers(*measured_qubits))
+    else:
+        num_qubits = len(_format_registers(measured_qubits))
+    labels = random_measurement_labels(num_qubits, num_settings, seed=seed)
+    circuits = state_tomography_circuits(circuit, measured_qubits,
+                                         meas_labels=labels,
+                                         meas_basis='Pauli')
+    for j, (circ, label) in enumerate(zip(circuits, labels)):
+        circ.name = str((j, label))
+    return circuits
+
+
+def random_measurement_labels(num_qubits, num_settings, seed=None):
+    """
+    Return uniformly random n-qubit Pauli measurement labels.
+
+    Args:
+        num_qubits (int): the number of measured qubits.
+        num_settings (int): the number of measurement settings.
+        seed (int or None): seed for the random number generator
+            (Default: None).
+
+    Returns:
+        list(tuple): a list of `num_settings` measurement label tuples.
+
+    Raises:
+        QiskitError: if the number of settings is not positive.
+    """
+    if num_settings < 1:
+        raise QiskitError("The number of settings must be positive.")
+    rng = np.random.RandomState(seed)
+    paulis = ('X', 'Y', 'Z')
+    settings = rng.randint(len(paulis), size=(num_settings, num_qubits))
+    return [tuple(paulis[i] for i in row) for row in settings]
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Classical shadow estimation of Pauli observables.
+"""
+
+from ast import literal_eval
+import numpy as np
+
+from qiskit import QiskitError
+from qiskit import QuantumCircuit
+
+
+class ClassicalShadowFitter:
+    """
+    Streaming median-of-means estimator of Pauli expectation values
+    from random Pauli measurement snapshots.
+    """
+
+    def __init__(self, observables, result=None, circuits=None,
+                 num_groups=10):
+        """
+        Args:
+            observables (list): the Pauli observables to estimate, given as
+                label strings such as 'XIZ' (where the rightmost character
+                acts on the first measured qubit) or `Pauli` objects.
+            result (Result): a Qiskit Result object obtained from executing
+                classical shadow circuits with `memory=True`.
+            circuits (list): a list of circuits or circuit names to extract
+                the per-shot memory from the result object.
+            num_groups (int): the number of groups for the median-of-means
+                estimator (Default: 10).
+
+        Raises:
+            QiskitError: if the observables act on different numbers of
+                qubits.
+        """
+        labels = [obs if isinstance(obs, str) else obs.to_label()
+                  for obs in observables]
+        if len({len(label) for label in labels}) != 1:
+            raise QiskitError("Observables must act on the same qubits.")
+        self._labels = labels
+        self._num_qubits = len(labels[0])
+
+        # Pauli codes per measured qubit: X=0, Y=1, Z=2 and I=-1
+        codes = {'I': -1, 'X': 0, 'Y': 1, 'Z': 2}
+        self._ops = np.array([[codes[p] for p in reversed(label)]
+                              for label in labels], dtype=int)
+        self._support = (self._ops >= 0).astype(int)
+        self._scale = 3.0 ** np.sum(self._support, axis=1)
+
+        self._num_groups = num_groups
+        self._sums = np.zeros((num_groups, len(labels)))
+        self._shots = np.zeros(num_groups, dtype=int)
+        self._num_snapshots = 0
+
+        if result is not None and circuits is not None:
+            self.add_data(result, circuits)
+
+    @property
+    def observables(self):
+        """Return the labels of the estimated observables."""
+        return self._labels
+
+    @property
+    def num_snapshots(self):
+        """Return the number of processed snapshots."""
+        return self._num_snapshots
+
+    def add_data(self, result, circuits):
+        """
+        Add the snapshots of a result to the running estimates.
+
+        The snapshots are reduced to per-group sums for every observable
+        and are not stored, so data may be added in arbitrarily many
+        batches.
+
+        Args:
+            result (Result): a Qiskit Result object obtained from executing
+                classical shadow circuits with `memory=True`.
+            circuits (list): a list of circuits or circuit names to extract
+                the per-shot memory from the result object.
+
+        Raises:
+            QiskitError: if a measurement setting does not match the
+                number of qubits of the observables.
+        """
+        codes = {'X': 0, 'Y': 1, 'Z': 2}
+        mask = 2 ** self._num_qubits - 1
+        shifts = np.arange(self._num_qubits)
+        for circ in circuits:
+            if isinstance(circ, QuantumCircuit):
+                name = circ.name
+            else:
+                name = circ
+            _, label = literal_eval(name)
+            if len(label) != self._num_qubits:
+                raise QiskitError(
+                    "Setting {} does not match {} qubit observables".format(
+                        label, self._num_qubits))
+            setting = np.array([codes[p] for p in label], dtype=int)
+            outcomes = np.array([int(mem.replace(' ', ''), 2) & mask
+                                 for mem in result.get_memory(circ)],
+                                dtype=int)
+            bits = (outcomes[:, None] >> shifts) & 1
+            self._add_snapshots(setting, bits)
+
+    def _add_snapshots(self, setting, bits):
+        """Accumulate the snapshots of a single measurement setting."""
+        num_shots = len(bits)
+        groups = (self._num_snapshots + np.arange(num_shots)) % \
+            self._num_groups
+        self._shots += np.bincount(groups, minlength=self._num_groups)
+        self._num_snapshots += num_shots
+
+        # Only observables diagonal in the measured basis contribute
+        match = np.all((self._ops == setting) | (self._ops < 0), axis=1)
+        idx = np.flatnonzero(match)
+        if idx.size == 0:
+            return
+        parity = bits.dot(self._support[idx].T) % 2
+        values = self._scale[idx] * (1 - 2 * parity)
+        sums = np.zeros((self._num_groups, idx.size))
+        np.add.at(sums, groups, values)
+        self._sums[:, idx] += sums
+
+    def group_means(self):
+        """
+        Return the mean estimate of each observable in each group.
+
+        Returns:
+            np.array: array of shape (num_groups, num_observables) for the
+            groups which contain snapshots.
+        """
+        filled = self._shots > 0
+        return self._sums[filled] / self._shots[filled, None]
+
+    def fit(self):
+        """
+        Return the median-of-means estimates of the observables.
+
+        Returns:
+            dict: the estimated expectation value of each observable keyed
+            by its label.
+
+        Raises:
+            QiskitError: if no data has been added.
+        """
+        if self._num_snapshots == 0:
+            raise QiskitError("No snapshots have been added.")
+        estimates = np.median(self.group_means(), axis=0)
+        return dict(zip(self._labels, estimates))
@@ -20,3 +20,4 @@ Quantum volume module
 # Quantum volume functions
 from .circuits import qv_circuits
 from .fitters import QVFitter
+from .statevector import qv_ideal_probabilities
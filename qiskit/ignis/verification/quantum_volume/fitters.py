@@ -22,7 +22,8 @@ randomized model circuits", arXiv:1811.12926
 import math
 import numpy as np
 from qiskit import QiskitError
-from ...characterization.fitters import build_counts_dict_from_list
+from ...utils import ResultIndex
+from .statevector import qv_ideal_probabilities
 
 try:
     from matplotlib import pyplot as plt
@@ -48,12 +49,14 @@ class QVFitter:
         self._depths = [len(l) for l in qubit_lists]
         self._ntrials = 0
 
-        self._result_list = []
+        self._result_index = ResultIndex()
         self._heavy_output_counts = {}
         self._circ_shots = {}
         self._heavy_output_prob_ideal = {}
         self._ydata = []
-        self._heavy_outputs = {}
+        # boolean masks of the heavy outputs of each circuit, indexed by
+        # the outputs as integers
+        self._heavy_masks = {}
         self.add_statevectors(statevector_result)
         self.add_data(backend_result)
 
@@ -70,12 +73,27 @@ class QVFitter:
     @property
     def results(self):
         """Return all the results."""
-        return self._result_list
+        return self._result_index.results
 
     @property
     def heavy_outputs(self):
-        """Return the ideal heavy outputs dictionary."""
-        return self._heavy_outputs
+        """Return the ideal heavy outputs dictionary.
+
+        The bit strings of the heavy outputs are formatted from their masks
+        on each call.
+        """
+        heavy_outputs = {}
+        for circname, mask in self._heavy_masks.items():
+            format_spec = "{0:0%db}" % int(np.log2(len(mask)))
+            heavy_outputs[circname] = [format_spec.format(b)
+                                       for b in np.flatnonzero(mask)]
+        return heavy_outputs
+
+    @property
+    def heavy_masks(self):
+        """Return the boolean masks of the ideal heavy outputs, indexed by
+        the outputs as integers."""
+        return self._heavy_masks
 
     @property
     def heavy_output_counts(self):
@@ -113,30 +131,42 @@ class QVFitter:
 
                 circname = qvcirc.header.name
 
-                # get the depth/width from the circuit name
-                # qv_depth_%d_trial_%d
-                depth = int(circname.split('_')[2])
+                # convert the result into a probability vector
+                qstate = result.get_statevector(circname)
+                self._add_ideal_probabilities(
+                    circname, np.real(np.multiply(qstate, qstate.conjugate())))
 
-                if circname in self._heavy_outputs:
-                    raise QiskitError("Already added the ideal result "
-                                      "for circuit %s" % circname)
+    def add_ideal_circuits(self, circuits, num_processes=1):
+        """
+        Add the ideal circuits and convert to the heavy outputs.
 
-                # convert the result into probability dictionary
-                qstate = result.get_statevector(circname)
-                pvector = np.multiply(qstate, qstate.conjugate())
-                format_spec = "{0:0%db}" % depth
-                pmap = {format_spec.format(b):
-                        float(np.real(pvector[b]))
-                        for b in range(2**depth)}
-                median_prob = self._median_probabilities([pmap])
-                self._heavy_outputs[qvcirc.header.name] = \
-                    self._heavy_strings(pmap, median_prob[0])
+        The ideal output probabilities are computed from the unitaries of
+        the circuits with `qv_ideal_probabilities`, instead of running them
+        on the 'statevector_simulator' for `add_statevectors`.
 
-                # calculate the heavy output probability
-                self._heavy_output_prob_ideal[circname] = \
-                    self._subset_probability(
-                        self._heavy_outputs[circname],
-                        pmap)
+        Args:
+            circuits: the circuits without measurements (the second list
+                returned by `qv_circuits`).
+            num_processes: the number of processes to compute the ideal
+                probabilities of the circuits in parallel (default is 1).
+        """
+        probabilities = qv_ideal_probabilities(circuits, num_processes)
+        for circname, probs in probabilities.items():
+            self._add_ideal_probabilities(circname, probs)
+
+    def _add_ideal_probabilities(self, circname, probabilities):
+        """Add the heavy outputs of the ideal probability vector of a
+        circuit."""
+        if circname in self._heavy_masks:
+            raise QiskitError("Already added the ideal result "
+                              "for circuit %s" % circname)
+
+        mask = self._heavy_mask(probabilities)
+        self._heavy_masks[circname] = mask
+
+        # calculate the heavy output probability
+        self._heavy_output_prob_ideal[circname] = \
+            float(np.sum(probabilities[mask]))
 
     def add_data(self, new_backend_result, rerun_fit=True):
         """
@@ -158,7 +188,7 @@ class QVFitter:
             new_backend_result = [new_backend_result]
 
         for result in new_backend_result:
-            self._result_list.append(result)
+            self._result_index.add_results(result)
 
             # update the number of trials *if* new ones
             # added.
@@ -192,24 +222,15 @@ class QVFitter:
                 circ_name = 'qv_depth_%d_trial_%d' % (depth, trialidx)
 
                 # get the counts form ALL executed circuits
-                count_list = []
-                for result in self._result_list:
-                    try:
-                        count_list.append(result.get_counts(circ_name))
-                    except (QiskitError, KeyError):
-                        pass
-
-                circ_counts[circ_name] = \
-                    build_counts_dict_from_list(count_list)
+                circ_counts[circ_name] = self._result_index.counts(circ_name)
 
                 self._circ_shots[circ_name] = \
                     sum(circ_counts[circ_name].values())
 
                 # calculate the heavy output probability
                 self._heavy_output_counts[circ_name] = \
-                    self._subset_probability(
-                        self._heavy_outputs[circ_name],
-                        circ_counts[circ_name])
+                    self._heavy_count(self._heavy_masks[circ_name],
+                                      circ_counts[circ_name])
 
     def calc_statistics(self):
         """
@@ -334,50 +355,36 @@ class QVFitter:
 
         return qv_list
 
-    def _heavy_strings(self, ideal_distribution, ideal_median):
-        """Return the set of heavy output strings.
+    def _heavy_mask(self, probabilities):
+        """Return the mask of the heavy outputs.
 
         Args:
-            ideal_distribution: dict of ideal output distribution
-                where keys are bit strings (as strings) and values are
-                probabilities of observing those strings
-            ideal_median = median probability across all outputs
+            probabilities: array of the ideal probability of each output,
+                indexed by the outputs as integers.
 
         Returns:
-            the set of heavy output strings, i.e. those strings
+            the boolean mask of the heavy outputs, i.e. those outputs
             whose ideal probability of occurrence exceeds the median.
         """
-        return list(filter(lambda x: ideal_distribution[x] > ideal_median,
-                           list(ideal_distribution.keys())))
-
-    def _median_probabilities(self, distributions):
-        """Return a list of median probabilities.
-
-        Args:
-            distributions: list of dicts mapping binary strings
-                (as strings) to probabilities.
-
-        Returns:
-            a list of median probabilities.
-        """
-        medians = []
-        for dist in distributions:
-            values = np.array(list(dist.values()))
-            medians.append(float(np.real(np.median(values))))
-
-        return medians
+        return probabilities > np.median(probabilities)
 
-    def _subset_probability(self, strings, distribution):
-        """Return the probability of a subset of outcomes.
+    def _heavy_count(self, mask, counts):
+        """Return the number of counts of the heavy outputs.
 
         Args:
-            strings: list of bit strings (as strings)
-            distribution: dict where keys are bit strings (as strings)
-                and values are probabilities of observing those strings
+            mask: boolean mask of the heavy outputs, indexed by the outputs
+                as integers.
+            counts: dict where keys are bit strings (as strings) and values
+                are counts of observing those strings
 
         Returns:
-            the probability of the subset of strings, i.e. the sum
-            of the probabilities of each string as given by the
-            distribution.
+            the sum of the counts of the heavy outputs.
         """
-        return sum([distribution.get(value, 0) for value in strings])
+        if not counts:
+            return 0
+        outputs = np.array([int(key.replace(' ', ''), 2) for key in counts])
+        values = np.fromiter(counts.values(), dtype=int, count=len(counts))
+        # outputs with more bits than the mask are not heavy outputs
+        heavy = outputs < len(mask)
+        heavy[heavy] = mask[outputs[heavy]]
+        return int(np.sum(values[heavy]))
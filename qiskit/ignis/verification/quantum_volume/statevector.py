@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Ideal output probabilities of quantum volume circuits.
+
+The statevector of each circuit is computed with NumPy by contracting the
+state tensor with the SU(4) unitaries stored in the circuit, so that the
+heavy outputs do not need a run of the circuits on a statevector
+simulator.
+"""
+
+import numpy as np
+from qiskit import QiskitError
+from qiskit.tools import parallel_map
+
+
+def qv_layers(circuit):
+    """
+    Return the gates of a quantum volume circuit as matrices.
+
+    Args:
+        circuit: a circuit without measurements, such as the ideal circuits
+            returned by `qv_circuits`.
+
+    Returns:
+        A pair of the number of qubits of the circuit and the list of the
+        (matrix, qubits) pairs of its gates in order.
+
+    Raises:
+        QiskitError: if the circuit has an instruction which is not a gate
+            with a matrix, such as a measurement.
+    """
+    layers = []
+    for inst, qargs, _ in circuit.data:
+        if inst.name == 'barrier':
+            continue
+        try:
+            matrix = inst.to_matrix()
+        except Exception:  # pylint: disable=broad-except
+            raise QiskitError("Cannot compute the ideal probabilities of "
+                              "circuit %s with instruction %s" %
+                              (circuit.name, inst.name))
+        layers.append((np.asarray(matrix, dtype=complex),
+                       [circuit.qubits.index(qubit) for qubit in qargs]))
+    return len(circuit.qubits), layers
+
+
+def qv_statevector(num_qubits, layers):
+    """
+    Apply gates to the all-zero state.
+
+    The state is kept as a tensor with one axis per qubit, the last axis
+    being qubit 0, and each k-qubit gate is applied by contracting its
+    matrix, reshaped as a tensor with 2k axes, with the axes of its qubits.
+
+    Args:
+        num_qubits: the number of qubits.
+        layers: the list of (matrix, qubits) pairs of the gates, as returned
+            by `qv_layers`.
+
+    Returns:
+        The statevector, indexed by the outputs as integers with qubit 0 as
+        the least significant bit.
+    """
+    state = np.zeros(2 ** num_qubits, dtype=complex)
+    state[0] = 1
+    state = state.reshape((2,) * num_qubits)
+    for matrix, qubits in layers:
+        num_gate_qubits = len(qubits)
+        # the matrix axes of the qubits are in the reverse order
+        axes = [num_qubits - 1 - qubit for qubit in reversed(qubits)]
+        gate = matrix.reshape((2,) * (2 * num_gate_qubits))
+        state = np.tensordot(gate, state,
+                             axes=(range(num_gate_qubits, 2 * num_gate_qubits),
+                                   axes))
+        state = np.moveaxis(state, range(num_gate_qubits), axes)
+    return state.reshape(-1)
+
+
+def _circuit_probabilities(task):
+    """Return the ideal output probabilities of the gates of a circuit."""
+    num_qubits, layers = task
+    state = qv_statevector(num_qubits, layers)
+    return np.real(np.multiply(state, state.conjugate()))
+
+
+def qv_ideal_probabilities(circuits, num_processes=1):
+    """
+    Return the ideal output probabilities of quantum volume circuits.
+
+    Args:
+        circuits: a list of circuits without measurements, or a list of
+            lists of circuits (one for each trial) as returned by
+            `qv_circuits`.
+        num_processes: the number of processes to compute the
+            statevectors of the circuits in parallel (default is 1).
+
+    Returns:
+        A dictionary of the ideal probability vector of each circuit by
+        circuit name.
+    """
+    trial_circuits = circuits
+    circuits = []
+    for trial in trial_circuits:
+        if isinstance(trial, list):
+            circuits.extend(trial)
+        else:
+            circuits.append(trial)
+    tasks = [qv_layers(circ) for circ in circuits]
+    if num_processes > 1:
+        probabilities = parallel_map(_circuit_probabilities, tasks,
+                                     num_processes=num_processes)
+    else:
+        probabilities = [_circuit_probabilities(task) for task in tasks]
+    return {circ.name: probs for circ, probs in zip(circuits, probabilities)}
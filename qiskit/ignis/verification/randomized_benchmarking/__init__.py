@@ -19,8 +19,13 @@ Randomized Benchmarking module
 
 # Randomized Benchmarking functions
 from .Clifford import Clifford
+from .packed_clifford import PackedClifford
+from .batched_clifford import BatchedClifford
 from .basic_utils import BasicUtils
 from .clifford_utils import CliffordUtils
+from .symplectic_utils import SymplecticCliffordUtils
 from .circuits import randomized_benchmarking_seq
 from .fitters import RBFitter, InterleavedRBFitter, PurityRBFitter
+from .batched_fit import fit_rb_decays
+from .adaptive import AdaptiveRB
 from . import rb_utils
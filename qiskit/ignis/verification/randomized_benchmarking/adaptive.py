@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Adaptive randomized benchmarking.
+"""
+
+import numpy as np
+from qiskit import execute
+from .circuits import randomized_benchmarking_seq, handle_length_multiplier
+from .fitters import RBFitter
+from .batched_fit import fit_rb_decays, rb_decay_guess
+
+
+class AdaptiveRB:
+    """
+    Adaptive randomized benchmarking driver.
+
+    The RB sequences are run in batches of seeds. After each batch the
+    survival probabilities of all the seeds run so far are fitted together,
+    and the lengths and number of seeds of the next batch are chosen to
+    minimize the predicted uncertainty of the decay of the pattern furthest
+    from the target, until the error per Clifford of every pattern reaches
+    the target uncertainty or the seed budget is spent.
+
+    The lengths of a batch are picked greedily from the candidate lengths,
+    each one minimizing the variance of the decay parameter alpha predicted
+    by the Fisher information of the fit, with a variance of the survival
+    probabilities estimated from the residuals of the fit. The number of
+    seeds is the smallest one for which the predicted uncertainty of the
+    error per Clifford reaches the target.
+    """
+
+    def __init__(self, backend, rb_pattern=None, length_vector=None,
+                 length_multiplier=1, candidate_lengths=None, nseeds=3,
+                 max_seeds=50, max_batch_seeds=10, target_rel_err=0.1,
+                 target_epc_err=None, shots=1024, rand_seed=None,
+                 rb_opts=None, run_config=None):
+        """
+        Args:
+            backend: the backend to run the circuits on with
+                `qiskit.execute`.
+            rb_pattern: the pattern for the rb sequences (default is [[0]]).
+            length_vector: the lengths of the first batch (default is
+                [1, 10, 20, 50, 100]).
+            length_multiplier: the length multiplier of each pattern, as in
+                `randomized_benchmarking_seq`.
+            candidate_lengths: the lengths from which the lengths of the
+                next batches are chosen (default is 30 lengths spaced
+                geometrically up to 10 times the largest length of
+                length_vector).
+            nseeds: the number of seeds of the first batch.
+            max_seeds: the total number of seeds to run at most.
+            max_batch_seeds: the number of seeds of a batch at most.
+            target_rel_err: the target uncertainty of the error per
+                Clifford of each pattern, relative to the error per
+                Clifford.
+            target_epc_err: the target absolute uncertainty of the error per
+                Clifford of each pattern. If given, it is used instead of
+                target_rel_err.
+            shots: the number of shots of each circuit.
+            rand_seed: the master seed of the random sequences, as in
+                `randomized_benchmarking_seq`.
+            rb_opts: other arguments of `randomized_benchmarking_seq`, such
+                as group_gates or basis_gates.
+            run_config: other arguments of `qiskit.execute`, such as
+                noise_model or basis_gates.
+        """
+        if rb_pattern is None:
+            rb_pattern = [[0]]
+        if length_vector is None:
+            length_vector = [1, 10, 20, 50, 100]
+        if candidate_lengths is None:
+            candidate_lengths = np.unique(np.round(np.geomspace(
+                1, 10 * max(length_vector), 30)).astype(int))
+
+        self._backend = backend
+        self._rb_pattern = rb_pattern
+        self._length_vector = list(length_vector)
+        self._length_multiplier = handle_length_multiplier(
+            length_multiplier, len(rb_pattern))
+        self._candidate_lengths = np.asarray(candidate_lengths)
+        self._nseeds = nseeds
+        self._max_seeds = max_seeds
+        self._max_batch_seeds = max_batch_seeds
+        self._target_rel_err = target_rel_err
+        self._target_epc_err = target_epc_err
+        self._shots = shots
+        self._rand_seed = rand_seed
+        self._rb_opts = rb_opts or {}
+        self._run_config = run_config or {}
+
+        self._num_qubits = np.array([len(qubits) for qubits in rb_pattern])
+        # lengths and survival probabilities of all the seeds of each
+        # pattern
+        self._xdata = np.zeros((len(rb_pattern), 0))
+        self._ydata = np.zeros((len(rb_pattern), 0))
+        self._batches = []
+        self._fit = [{} for e in rb_pattern]
+        self._params = None
+
+    @property
+    def fit(self):
+        """Return the fit of each pattern, with the fields of the fit
+        dictionaries of `RBFitter`."""
+        return self._fit
+
+    @property
+    def batches(self):
+        """Return the batches run so far, as a list of dictionaries with
+        fields ``lengths``, ``nseeds`` and ``fitter`` (the `RBFitter` of
+        the batch)."""
+        return self._batches
+
+    @property
+    def seeds(self):
+        """Return the number of seeds run so far."""
+        return sum(batch['nseeds'] for batch in self._batches)
+
+    @property
+    def converged(self):
+        """Return whether every pattern reached the target uncertainty."""
+        return bool(self._batches) and np.all(self._target_ratios() <= 1)
+
+    def run(self, max_batches=None):
+        """
+        Run batches until the target uncertainty is reached.
+
+        Args:
+            max_batches: the number of batches to run at most (default is
+                no limit other than max_seeds).
+
+        Returns:
+            The list of fit dictionaries of the patterns.
+        """
+        num_batches = 0
+        while not self.converged and self.seeds < self._max_seeds:
+            if max_batches is not None and num_batches >= max_batches:
+                break
+            self.run_batch()
+            num_batches += 1
+        return self._fit
+
+    def run_batch(self, lengths=None, nseeds=None):
+        """
+        Run a batch of seeds and update the fit.
+
+        Args:
+            lengths: the lengths of the batch (default is the lengths of the
+                first batch, and then the lengths chosen by `next_batch`).
+            nseeds: the number of seeds of the batch (default as lengths).
+        """
+        if lengths is None or nseeds is None:
+            next_lengths, next_nseeds = self.next_batch()
+            lengths = next_lengths if lengths is None else lengths
+            nseeds = next_nseeds if nseeds is None else nseeds
+        lengths = sorted(int(length) for length in lengths)
+
+        rb_circs, xdata = randomized_benchmarking_seq(
+            nseeds=nseeds, length_vector=lengths,
+            rb_pattern=self._rb_pattern,
+            length_multiplier=self._length_multiplier,
+            seed_offset=self.seeds, rand_seed=self._rand_seed,
+            **self._rb_opts)
+        circuits = [circ for seed_circs in rb_circs for circ in seed_circs]
+        result = execute(circuits, self._backend, shots=self._shots,
+                         **self._run_config).result()
+
+        fitter = RBFitter(None, xdata, self._rb_pattern)
+        fitter.add_data(result, rerun_fit=False)
+        fitter.calc_data()
+        raw_data = np.array(fitter.raw_data)
+        self._xdata = np.concatenate(
+            [self._xdata, np.tile(xdata, nseeds)], axis=1)
+        self._ydata = np.concatenate(
+            [self._ydata, raw_data.reshape(len(self._rb_pattern), -1)],
+            axis=1)
+        self._batches.append({'lengths': lengths, 'nseeds': nseeds,
+                              'fitter': fitter})
+        self._fit_data()
+
+    def next_batch(self):
+        """
+        Choose the lengths and number of seeds of the next batch.
+
+        Returns:
+            A pair of the list of lengths and the number of seeds.
+        """
+        remaining = self._max_seeds - self.seeds
+        if not self._batches:
+            return self._length_vector, max(min(self._nseeds, remaining), 1)
+
+        # design the batch for the pattern furthest from the target
+        patt_ind = int(np.argmax(self._target_ratios()))
+        params = self._params[patt_ind]
+        mult = self._length_multiplier[patt_ind]
+        jac = _decay_jacobian(self._xdata[patt_ind], params)
+        resid = (params[0] * params[1] ** self._xdata[patt_ind] +
+                 params[2] - self._ydata[patt_ind])
+        variance = max(np.sum(resid ** 2) / max(len(resid) - 3, 1), 1e-12)
+        info = jac.T.dot(jac) / variance
+        cand_jac = _decay_jacobian(mult * self._candidate_lengths, params)
+        cand_info = np.einsum('ci,cj->cij', cand_jac, cand_jac) / variance
+
+        # greedily pick the lengths which most reduce the variance of
+        # alpha for one more seed
+        num_lengths = min(len(self._length_vector),
+                          len(self._candidate_lengths))
+        chosen = []
+        batch_info = np.zeros((3, 3))
+        for _ in range(num_lengths):
+            var = _alpha_variance(info + batch_info + cand_info)
+            var[chosen] = np.inf
+            best = int(np.argmin(var))
+            chosen.append(best)
+            batch_info += cand_info[best]
+
+        # the smallest number of seeds reaching the target
+        nseeds = max(min(self._max_batch_seeds, remaining), 1)
+        for num in range(1, nseeds + 1):
+            var = _alpha_variance((info + num * batch_info)[None])[0]
+            if self._epc_err(patt_ind, params[1], np.sqrt(var)) <= \
+                    self._target(patt_ind, params[1]):
+                nseeds = num
+                break
+        return sorted(self._candidate_lengths[chosen].tolist()), nseeds
+
+    def _fit_data(self):
+        """Fit the survival probabilities of all the seeds run so far."""
+        if self._params is None:
+            self._params = rb_decay_guess(self._xdata, self._ydata,
+                                          num_qubits=self._num_qubits)
+        self._params, pcov = fit_rb_decays(self._xdata, self._ydata,
+                                           p0=self._params)
+        for patt_ind, params in enumerate(self._params):
+            params_err = np.sqrt(np.diag(pcov[patt_ind]))
+            nrb = 2 ** self._num_qubits[patt_ind]
+            self._fit[patt_ind] = {
+                'params': params.copy(), 'params_err': params_err,
+                'epc': (nrb-1)/nrb*(1-params[1]),
+                'epc_err': self._epc_err(patt_ind, params[1],
+                                         params_err[1])}
+
+    def _epc_err(self, patt_ind, alpha, alpha_err):
+        """Return the error per Clifford uncertainty as in RBFitter."""
+        nrb = 2 ** self._num_qubits[patt_ind]
+        return (nrb-1)/nrb*alpha_err/alpha
+
+    def _target(self, patt_ind, alpha):
+        """Return the target uncertainty of the error per Clifford."""
+        if self._target_epc_err is not None:
+            return self._target_epc_err
+        nrb = 2 ** self._num_qubits[patt_ind]
+        return self._target_rel_err * (nrb-1)/nrb*(1-alpha)
+
+    def _target_ratios(self):
+        """Return the ratio of the uncertainty of the error per Clifford of
+        each pattern to its target."""
+        return np.array([
+            fit['epc_err'] / max(self._target(patt_ind, fit['params'][1]),
+                                 1e-15)
+            for patt_ind, fit in enumerate(self._fit)])
+
+
+def _decay_jacobian(xdata, params):
+    """Return the Jacobian of a * alpha^x + b at lengths x."""
+    amp, alpha, _ = params
+    return np.stack([alpha ** xdata, amp * xdata * alpha ** (xdata - 1),
+                     np.ones(len(xdata))], axis=1)
+
+
+def _alpha_variance(info):
+    """Return the variance of alpha for a stack of information matrices."""
+    return np.linalg.pinv(info)[:, 1, 1]
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+    Batched Clifford Operator class
+"""
+
+import numpy as np
+from .clifford_utils import _TABLE_GATES
+
+
+class BatchedClifford:
+
+    """
+    Stack of n-qubit Clifford tables updated together.
+
+    The symplectic tables and phases of a batch of Cliffords are stored as
+    boolean arrays of shape (batch, 2n, 2n) and (batch, 2n), with the same
+    layout as the table and phases of a `Clifford` object. Each gate is
+    applied to a subset of the batch with a few array operations, so that
+    a layer of different Cliffords on every batch element costs a number of
+    array operations which does not depend on the batch size.
+    """
+
+    def __init__(self, num_qubits, batch_size):
+        """Initialize a batch of identity Cliffords.
+
+        Args:
+            num_qubits: number of qubits of each Clifford.
+            batch_size: number of Cliffords of the batch.
+        """
+        self._num_qubits = num_qubits
+        zeros = np.zeros((num_qubits, num_qubits), dtype=bool)
+        iden = np.eye(num_qubits, dtype=bool)
+        table = np.block([[zeros, iden], [iden, zeros]])
+        self._table = np.tile(table, (batch_size, 1, 1))
+        self._phases = np.zeros((batch_size, 2 * num_qubits), dtype=bool)
+
+    # ---------------------------------------------------------------------
+    # Data accessors
+    # ---------------------------------------------------------------------
+
+    @property
+    def num_qubits(self):
+        """Return the number of qubits of the Cliffords."""
+        return self._num_qubits
+
+    @property
+    def batch_size(self):
+        """Return the number of Cliffords of the batch."""
+        return len(self._table)
+
+    @property
+    def table(self):
+        """Return the Clifford tables."""
+        return self._table
+
+    @property
+    def phases(self):
+        """Return the Clifford phases."""
+        return self._phases
+
+    def copy(self):
+        """Return a copy of the batch."""
+        # pylint: disable=protected-access
+        ret = BatchedClifford(self._num_qubits, 0)
+        ret._table = self._table.copy()
+        ret._phases = self._phases.copy()
+        return ret
+
+    # ---------------------------------------------------------------------
+    # Unique Clifford index
+    # ---------------------------------------------------------------------
+    def index(self):
+        """
+        Returns the unique indices of the Cliffords.
+
+        Returns:
+            A list of the index (integer) of each Clifford, equal to the
+            index of the corresponding `Clifford` object.
+        """
+        bits = np.concatenate(
+            [self._table.reshape(self.batch_size, -1), self._phases], axis=1)
+        num_bits = np.shape(bits)[1]
+        if num_bits < 63:
+            weights = 1 << np.arange(num_bits - 1, -1, -1, dtype=np.int64)
+            return [int(key) for key in bits.dot(weights)]
+        # The indices do not fit in 64 bits
+        return [int(''.join('1' if bit else '0' for bit in row), 2)
+                for row in bits]
+
+    # ---------------------------------------------------------------------
+    # Gate list composition
+    # ---------------------------------------------------------------------
+    def compose_codes(self, codes, batch=None):
+        """
+        Apply gate lists given as arrays of gate codes.
+
+        Args:
+            codes: an integer array of shape (len(batch), num_gates) of the
+                gate codes of the Clifford table file applied to each
+                Clifford in order, with code 0 for no gate.
+            batch: the indices of the Cliffords to update (default is the
+                whole batch).
+        """
+        if batch is None:
+            batch = np.arange(self.batch_size)
+        codes = np.asarray(codes)
+        for slot in range(codes.shape[1]):
+            column = codes[:, slot]
+            for code in np.unique(column):
+                if code == 0:
+                    continue
+                split = _TABLE_GATES[code - 1].split()
+                qubits = [int(q) for q in split[1:]]
+                getattr(self, split[0])(*qubits,
+                                        batch=batch[column == code])
+
+    # ---------------------------------------------------------------------
+    # Canonical gate operations
+    # ---------------------------------------------------------------------
+    def _cols(self, qubit, batch):
+        """Return copies of the Z and X columns of a qubit of the batch."""
+        col_z = self._table[batch, :, qubit]
+        col_x = self._table[batch, :, self._num_qubits + qubit]
+        if isinstance(batch, slice):
+            # basic indexing returns views of the table
+            return col_z.copy(), col_x.copy()
+        return col_z, col_x
+
+    def x(self, qubit, batch=slice(None)):
+        """Apply a Pauli "x" gate to a qubit"""
+        self._phases[batch] ^= self._table[batch, :, qubit]
+
+    def y(self, qubit, batch=slice(None)):
+        """Apply an Pauli "y" gate to a qubit"""
+        col_z, col_x = self._cols(qubit, batch)
+        self._phases[batch] ^= col_z ^ col_x
+
+    def z(self, qubit, batch=slice(None)):
+        """Apply an Pauli "z" gate to qubit"""
+        self._phases[batch] ^= self._table[batch, :, self._num_qubits + qubit]
+
+    def h(self, qubit, batch=slice(None)):
+        """Apply an Hadamard "h" gate to qubit"""
+        col_z, col_x = self._cols(qubit, batch)
+        self._phases[batch] ^= col_z & col_x
+        self._table[batch, :, qubit] = col_x
+        self._table[batch, :, self._num_qubits + qubit] = col_z
+
+    def s(self, qubit, batch=slice(None)):
+        """Apply an phase "s" gate to qubit"""
+        col_z, col_x = self._cols(qubit, batch)
+        self._phases[batch] ^= col_z & col_x
+        self._table[batch, :, qubit] = col_z ^ col_x
+
+    def sdg(self, qubit, batch=slice(None)):
+        """Apply an adjoint phase "sdg" gate to qubit"""
+        col_z, col_x = self._cols(qubit, batch)
+        self._phases[batch] ^= col_x & ~col_z
+        self._table[batch, :, qubit] = col_z ^ col_x
+
+    def v(self, qubit, batch=slice(None)):
+        """Apply v gate sd.h"""
+        col_z, col_x = self._cols(qubit, batch)
+        self._table[batch, :, qubit] = col_x
+        self._table[batch, :, self._num_qubits + qubit] = col_z ^ col_x
+
+    def w(self, qubit, batch=slice(None)):
+        """Apply w gate v.v"""
+        col_z, col_x = self._cols(qubit, batch)
+        self._table[batch, :, qubit] = col_z ^ col_x
+        self._table[batch, :, self._num_qubits + qubit] = col_z
+
+    def cx(self, qubit_ctrl, qubit_trgt, batch=slice(None)):
+        """Apply a Controlled-NOT "cx" gate"""
+        iz_c, ix_c = self._cols(qubit_ctrl, batch)
+        iz_t, ix_t = self._cols(qubit_trgt, batch)
+        # Compute phase
+        self._phases[batch] ^= iz_t & ix_c & ~(ix_t ^ iz_c)
+        # Update stabilizers
+        self._table[batch, :, self._num_qubits + qubit_trgt] = ix_t ^ ix_c
+        self._table[batch, :, qubit_ctrl] = iz_c ^ iz_t
+
+    def cz(self, qubit_ctrl, qubit_trgt, batch=slice(None)):
+        """Apply a Controlled-z "cx" gate"""
+        self.h(qubit_trgt, batch)
+        self.cx(qubit_ctrl, qubit_trgt, batch)
+        self.h(qubit_trgt, batch)
+
+    def swap(self, qubit0, qubit1, batch=slice(None)):
+        """Apply SWAP gate between two qubits"""
+        self.cx(qubit0, qubit1, batch)
+        self.cx(qubit1, qubit0, batch)
+        self.cx(qubit0, qubit1, batch)
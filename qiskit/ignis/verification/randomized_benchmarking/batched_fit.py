@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Batched fitting of randomized benchmarking decays.
+"""
+
+import numpy as np
+
+
+def rb_decay_guess(xdata, ydata, sigma=None, num_qubits=1):
+    """
+    Log-linear guesses of the parameters of a batch of RB decays.
+
+    The offset b is guessed as 1/2^n, and log(a) and log(alpha) are the
+    weighted least-squares line through the points (x, log(y - b)).
+
+    Args:
+        xdata: array of shape (batch, m) of the Clifford lengths.
+        ydata: array of shape (batch, m) of the mean survival probabilities.
+        sigma: array of shape (batch, m) of the standard deviations of
+            ydata (default is the same weight for all the points).
+        num_qubits: the number of qubits of each decay, an integer or an
+            array of shape (batch,).
+
+    Returns:
+        An array of shape (batch, 3) of the guesses of (a, alpha, b), in
+        [0, 1].
+    """
+    xdata = np.asarray(xdata, dtype=float)
+    ydata = np.asarray(ydata, dtype=float)
+    offset = 1 / 2 ** np.broadcast_to(num_qubits, ydata.shape[:1])
+    diff = np.maximum(ydata - offset[:, None], 1e-6)
+    if sigma is None:
+        weights = np.ones_like(ydata)
+    else:
+        # the standard deviation of log(y - b)
+        weights = (diff / np.asarray(sigma, dtype=float)) ** 2
+    logy = np.log(diff)
+    sw = np.sum(weights, axis=1)
+    mean_x = np.sum(weights * xdata, axis=1) / sw
+    mean_y = np.sum(weights * logy, axis=1) / sw
+    var_x = np.sum(weights * (xdata - mean_x[:, None]) ** 2, axis=1)
+    cov_xy = np.sum(weights * (xdata - mean_x[:, None]) *
+                    (logy - mean_y[:, None]), axis=1)
+    slope = np.where(var_x > 0, cov_xy / np.where(var_x > 0, var_x, 1), 0)
+    alpha = np.clip(np.exp(slope), 1e-3, 1 - 1e-6)
+    amp = np.clip(np.exp(mean_y - slope * mean_x), 1e-3, 1)
+    return np.stack([amp, alpha, offset], axis=1)
+
+
+def _rb_decay(xdata, params):
+    """Return the decays and their Jacobians of a batch of parameters."""
+    amp = params[:, 0:1]
+    alpha = params[:, 1:2]
+    power = alpha ** xdata
+    model = amp * power + params[:, 2:3]
+    jac = np.stack([power,
+                    amp * xdata * alpha ** (xdata - 1),
+                    np.ones_like(power)], axis=2)
+    return model, jac
+
+
+def fit_rb_decays(xdata, ydata, sigma=None, p0=None, num_qubits=1,
+                  max_iter=200, tol=1e-12):
+    """
+    Fit a batch of RB decays to a * alpha^x + b.
+
+    All the decays are fitted together with a vectorized Levenberg-Marquardt
+    iteration over the stacked data, where the parameters are kept in the
+    bounds [0, 1] as in `RBFitter.fit_data_pattern`. The step of each decay
+    is accepted or rejected independently, and the iteration stops when no
+    decay improves by more than tol.
+
+    Args:
+        xdata: array of shape (batch, m) or (m,) of the Clifford lengths.
+        ydata: array of shape (batch, m) of the mean survival probabilities.
+        sigma: array of shape (batch, m) of the standard deviations of
+            ydata (default is the same weight for all the points).
+        p0: array of shape (batch, 3) of the initial parameters (default
+            is the log-linear guess of `rb_decay_guess`).
+        num_qubits: the number of qubits of each decay, an integer or an
+            array of shape (batch,), used by the default guess.
+        max_iter: the maximum number of iterations.
+        tol: the relative decrease of the cost below which a decay has
+            converged.
+
+    Returns:
+        A pair (params, pcov) of the arrays of shape (batch, 3) and
+        (batch, 3, 3) of the parameters (a, alpha, b) and their covariances,
+        which are scaled by the reduced chi-square as in `curve_fit`.
+    """
+    ydata = np.asarray(ydata, dtype=float)
+    xdata = np.broadcast_to(np.asarray(xdata, dtype=float), ydata.shape)
+    if sigma is None:
+        sigma = np.ones_like(ydata)
+    sigma = np.asarray(sigma, dtype=float)
+    if p0 is None:
+        params = rb_decay_guess(xdata, ydata, sigma, num_qubits)
+    else:
+        params = np.clip(np.array(p0, dtype=float), 0, 1)
+
+    model, jac = _rb_decay(xdata, params)
+    resid = (model - ydata) / sigma
+    cost = np.sum(resid ** 2, axis=1)
+    damping = np.full(len(ydata), 1e-3)
+    active = np.ones(len(ydata), dtype=bool)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        wjac = jac[active] / sigma[active, :, None]
+        jtj = np.einsum('bmi,bmj->bij', wjac, wjac)
+        grad = np.einsum('bmi,bm->bi', wjac, resid[active])
+        diag = np.einsum('bii->bi', jtj)
+        lhs = jtj + (damping[active, None] *
+                     np.maximum(diag, 1e-12))[:, :, None] * np.eye(3)
+        step = np.linalg.solve(lhs, -grad[:, :, None])[:, :, 0]
+
+        trial = np.clip(params[active] + step, 0, 1)
+        trial_model, trial_jac = _rb_decay(xdata[active], trial)
+        trial_resid = (trial_model - ydata[active]) / sigma[active]
+        trial_cost = np.sum(trial_resid ** 2, axis=1)
+
+        better = trial_cost < cost[active]
+        improved = np.flatnonzero(active)[better]
+        params[improved] = trial[better]
+        jac[improved] = trial_jac[better]
+        resid[improved] = trial_resid[better]
+        converged = np.zeros(len(ydata), dtype=bool)
+        converged[improved] = (cost[improved] - trial_cost[better] <=
+                               tol * np.maximum(cost[improved], tol))
+        cost[improved] = trial_cost[better]
+        damping[improved] /= 10
+
+        rejected = np.flatnonzero(active)[~better]
+        damping[rejected] *= 10
+        # a step which cannot decrease the cost at a large damping has
+        # converged to a minimum at the bounds
+        converged[rejected] = damping[rejected] > 1e10
+        active &= ~converged
+
+    wjac = jac / sigma[:, :, None]
+    pcov = np.linalg.pinv(np.einsum('bmi,bmj->bij', wjac, wjac))
+    dof = ydata.shape[1] - 3
+    if dof > 0:
+        pcov *= (cost / dof)[:, None, None]
+    else:
+        pcov.fill(np.inf)
+    return params, pcov
@@ -20,11 +20,42 @@ Generates randomized benchmarking sequences
 """
 
 import copy
+import functools
 import numpy as np
 import qiskit
-
-from .Clifford import Clifford
+from qiskit.tools import parallel_map
+from qiskit.circuit import ParameterExpression
+from qiskit.circuit.measure import Measure
+from qiskit.extensions.standard.barrier import Barrier
+from qiskit.extensions.standard import (HGate, SGate, SdgGate, XGate, YGate,
+                                        ZGate, CnotGate, U1Gate, U2Gate,
+                                        U3Gate)
+from qiskit.quantum_info.synthesis import euler_angles_1q
+
+from .packed_clifford import PackedClifford
 from .clifford_utils import CliffordUtils as clutils
+from .symplectic_utils import SymplecticCliffordUtils
+
+# Gate classes of the gate list operations. The 'v' and 'w' gates are
+# not QuantumCircuit gates and are decomposed into their gates.
+_GATE_CLASSES = {'h': (HGate,), 's': (SGate,), 'sdg': (SdgGate,),
+                 'x': (XGate,), 'y': (YGate,), 'z': (ZGate,),
+                 'cx': (CnotGate,), 'v': (SdgGate, HGate),
+                 'w': (HGate, SGate)}
+
+# Number of elements of the Clifford group of each number of qubits
+_GROUP_SIZES = {1: 24, 2: 11520}
+
+# Cache of the gate lists of the group elements
+_ELMNT_GATES = {}
+
+# Cache of the unitaries of the single-qubit gates of the gate lists
+_GATE_MATRICES = {}
+
+# Gate lists of the rx(pi/2) and ry(pi/2) rotations of purity rb, up to a
+# global phase
+_RX_GATES = ['h 0', 's 0', 'h 0']
+_RY_GATES = ['h 0', 'x 0']
 
 
 def handle_length_multiplier(length_multiplier, len_pattern,
@@ -127,7 +158,10 @@ def randomized_benchmarking_seq(nseeds=1, length_vector=None,
                                 align_cliffs=False,
                                 interleaved_gates=None,
                                 is_purity=False,
-                                group_gates=None):
+                                group_gates=None,
+                                rand_seed=None,
+                                num_processes=1,
+                                basis_gates=None):
     """Get a generic randomized benchmarking sequence
 
     Args:
@@ -156,7 +190,34 @@ def randomized_benchmarking_seq(nseeds=1, length_vector=None,
             The length of the list would equal the length of the rb_pattern.
         is_purity: True only for purity rb (default is False)
         group_gates: On which group (or gate set) we perform RB
-            (default is the Clifford group)
+            (default is the Clifford group). 'Clifford' uses the tables of
+            the 1 and 2 qubit Clifford groups, while 'symplectic' samples
+            Cliffords of any number of qubits as random symplectic matrices
+            and synthesizes their inverses without tables.
+        rand_seed: Master seed of the random sequences. If given, each seed
+            draws from its own random stream determined by rand_seed and
+            its index including seed_offset, so that the sequences of a
+            seed do not depend on the other seeds or on num_processes.
+            If None the global numpy random number generator is used
+            (default is None).
+        num_processes: Number of processes to generate the circuits of the
+            seeds in parallel. The random group elements are drawn and
+            tracked in the calling process, so the circuits do not depend
+            on num_processes (default is 1).
+        basis_gates: The gates in which each group element is emitted. If
+            None the elements are emitted as h, s, sdg, x, y, z and cx gates.
+            If a list of basis gate names such as ['u1', 'u2', 'u3', 'cx'],
+            the single-qubit gates of each element are merged into one u1,
+            u2 or u3 gate per qubit between cx gates. If a dict, it is a
+            decomposition table mapping each gate name of the gate lists
+            ('h', 's', 'sdg', 'v', 'w', 'x', 'y', 'z' and 'cx') to a list of
+            (instruction, qubits) pairs, where qubits are the indices of
+            the instruction qubits in the qubits of the gate. The
+            instructions of the table cannot have unbound parameters. The
+            purity rotations are emitted in the same way. Since the qubits of
+            rb_pattern are the physical qubits of the circuits, circuits in
+            the basis of a backend can be assembled without transpiling
+            them (default is None).
 
     Returns:
         A tuple of different fields depending on inputs. The different fields
@@ -177,18 +238,15 @@ def randomized_benchmarking_seq(nseeds=1, length_vector=None,
 
     """
     # Set modules (default is Clifford)
-    if group_gates is None or 'Clifford' or 'clifford':
-        Gutils = clutils()
-        Ggroup = Clifford
-    else:
-        raise ValueError("Unknown group or set of gates.")
+    Gutils = _group_utils(group_gates)
+    _check_basis_gates(basis_gates)
 
     if rb_pattern is None:
         rb_pattern = [[0]]
     if length_vector is None:
         length_vector = [1, 10, 20]
 
-    qlist_flat, n_q_max, max_dim = check_pattern(rb_pattern, is_purity)
+    _, _, max_dim = check_pattern(rb_pattern, is_purity)
     length_multiplier = handle_length_multiplier(length_multiplier,
                                                  len(rb_pattern),
                                                  is_purity)
@@ -198,192 +256,751 @@ def randomized_benchmarking_seq(nseeds=1, length_vector=None,
     xdata = calc_xdata(length_vector, length_multiplier)
 
     pattern_sizes = [len(pat) for pat in rb_pattern]
-    max_nrb = np.max(pattern_sizes)
-
-    # load group tables
-    group_tables = [[] for _ in range(max_nrb)]
-    for rb_num in range(max_nrb):
-        group_tables[rb_num] = Gutils.load_tables(rb_num+1)
-
-    # initialization: rb sequences
-    circuits = [[] for e in range(nseeds)]
-    # initialization: interleaved rb sequences
-    circuits_interleaved = [[] for e in range(nseeds)]
-    # initialization: purity rb sequences
-    circuits_purity = [[[] for d in range(npurity)]
-                       for e in range(nseeds)]
-
-    # go through for each seed
-    for seed in range(nseeds):
-        qr = qiskit.QuantumRegister(n_q_max+1, 'qr')
-        cr = qiskit.ClassicalRegister(len(qlist_flat), 'cr')
-        general_circ = qiskit.QuantumCircuit(qr, cr)
-        interleaved_circ = qiskit.QuantumCircuit(qr, cr)
-
-        # make sequences for each of the separate sequences in
-        # rb_pattern
-        Elmnts = []
-        for rb_q_num in pattern_sizes:
-            Elmnts.append(Ggroup(rb_q_num))
-        # Sequences for interleaved rb sequences
-            Elmnts_interleaved = []
-        for rb_q_num in pattern_sizes:
-            Elmnts_interleaved.append(Ggroup(rb_q_num))
-
-        # go through and add elements to RB sequences
+
+    elmnt_indices, inverse_gatelists = _random_elmnts(
+        nseeds, pattern_sizes, length_vector, length_multiplier,
+        seed_offset, rand_seed, Gutils)
+    inverse_gates = inverse_gatelists(elmnt_indices, pattern_sizes,
+                                      length_vector, length_multiplier,
+                                      Gutils)
+    if interleaved_gates is not None:
+        inverse_interleaved_gates = inverse_gatelists(
+            elmnt_indices, pattern_sizes, length_vector, length_multiplier,
+            Gutils, interleaved_gates)
+    else:
+        inverse_interleaved_gates = nseeds * [None]
+
+    tasks = list(zip(range(nseeds), elmnt_indices, inverse_gates,
+                     inverse_interleaved_gates))
+    task_kwargs = {'rb_pattern': rb_pattern,
+                   'length_vector': length_vector,
+                   'length_multiplier': length_multiplier,
+                   'seed_offset': seed_offset,
+                   'align_cliffs': align_cliffs,
+                   'interleaved_gates': interleaved_gates,
+                   'is_purity': is_purity,
+                   'basis_gates': basis_gates}
+    if num_processes > 1:
+        seed_circuits = parallel_map(_rb_seed_circuits, tasks,
+                                     task_kwargs=task_kwargs,
+                                     num_processes=num_processes)
+    else:
+        # instruction templates of gate lists on the pattern qubits
+        templates = {}
+        seed_circuits = [_rb_seed_circuits(task, templates=templates,
+                                           **task_kwargs)
+                         for task in tasks]
+
+    # rb sequences (separate list for each seed)
+    circuits = [seed_circ[0] for seed_circ in seed_circuits]
+    # interleaved rb sequences
+    circuits_interleaved = [seed_circ[1] for seed_circ in seed_circuits]
+    # purity rb sequences
+    circuits_purity = [seed_circ[2] for seed_circ in seed_circuits]
+
+    # output of interleaved rb
+    if interleaved_gates is not None:
+        return circuits, xdata, circuits_interleaved
+    # output of purity rb
+    if is_purity:
+        return circuits_purity, xdata, npurity
+    # output of standard (simultaneous) rb
+    return circuits, xdata
+
+
+def _group_utils(group_gates):
+    """Return the group utils object of group_gates."""
+    if group_gates is None or group_gates in ('Clifford', 'clifford'):
+        return clutils()
+    if group_gates in ('Symplectic', 'symplectic'):
+        return SymplecticCliffordUtils()
+    raise ValueError("Unknown group or set of gates.")
+
+
+def _random_elmnts(nseeds, pattern_sizes, length_vector, length_multiplier,
+                   seed_offset, rand_seed, Gutils):
+    """
+    Draw the random group elements of the rb sequences of all the seeds.
+
+    Returns:
+        A pair of the group elements of each seed, as returned by
+        `_random_elmnt_indices` (or `_random_elmnt_gatelists` for the
+        symplectic group), and the function computing the inverse gate
+        lists of the sequences of these elements.
+    """
+    if isinstance(Gutils, SymplecticCliffordUtils):
+        # draw the random group elements of all the seeds as gate lists
+        # and track them as Clifford tables
+        elmnt_indices = [
+            _random_elmnt_gatelists(seed, pattern_sizes, length_vector[-1],
+                                    length_multiplier, seed_offset,
+                                    rand_seed, Gutils)
+            for seed in range(nseeds)]
+        return elmnt_indices, _tracked_inverse_gatelists
+    # draw the random group elements of all the seeds
+    elmnt_indices = np.array([
+        _random_elmnt_indices(seed, pattern_sizes, length_vector[-1],
+                              length_multiplier, seed_offset, rand_seed)
+        for seed in range(nseeds)])
+    # track the group elements of all the seeds and patterns together
+    return elmnt_indices, _inverse_gatelists
+
+
+def _seed_rng(seed, seed_offset, rand_seed):
+    """Return the random number generator of a seed."""
+    if rand_seed is None:
+        return np.random
+    # independent stream of the seed, reproducible regardless of the
+    # order or the process in which the seeds are generated
+    return np.random.RandomState([rand_seed, seed + seed_offset])
+
+
+def _random_elmnt_indices(seed, pattern_sizes, num_elmnts, length_multiplier,
+                          seed_offset, rand_seed):
+    """
+    Draw the random group elements of a seed.
+
+    The elements are drawn in the order of the rb sequences, element by
+    element, then pattern by pattern, then for each length multiplier.
+
+    Args:
+        seed: the index of the seed.
+        pattern_sizes: the number of qubits of each pattern.
+        num_elmnts: the number of elements of the longest sequence.
+        length_multiplier: the length multiplier of each pattern.
+        seed_offset: the offset of the seed.
+        rand_seed: the master seed of the random sequences, or None to use
+            the global numpy random number generator.
+
+    Returns:
+        An integer array of shape (num_elmnts, sum(length_multiplier)) of
+        the indices of the group elements of each pattern and multiplier.
+
+    Raises:
+        ValueError: if a pattern has more than 2 qubits.
+    """
+    rng = _seed_rng(seed, seed_offset, rand_seed)
+    sizes = []
+    for rb_q_num, mult in zip(pattern_sizes, length_multiplier):
+        if rb_q_num not in _GROUP_SIZES:
+            raise ValueError("The number of qubits should be only 1 or 2")
+        sizes += mult * [_GROUP_SIZES[rb_q_num]]
+    if len(set(sizes)) == 1:
+        # consecutive draws of the same range equal a single array draw
+        return rng.randint(0, sizes[0], size=(num_elmnts, len(sizes)))
+    return np.array([[rng.randint(0, size) for size in sizes]
+                     for _ in range(num_elmnts)])
+
+
+def _random_elmnt_gatelists(seed, pattern_sizes, num_elmnts,
+                            length_multiplier, seed_offset, rand_seed, Gutils):
+    """
+    Draw the random group elements of a seed as gate lists.
+
+    The elements are drawn in the same order as `_random_elmnt_indices`.
+
+    Args:
+        seed: the index of the seed.
+        pattern_sizes: the number of qubits of each pattern.
+        num_elmnts: the number of elements of the longest sequence.
+        length_multiplier: the length multiplier of each pattern.
+        seed_offset: the offset of the seed.
+        rand_seed: the master seed of the random sequences, or None to use
+            the global numpy random number generator.
+        Gutils: the group utils object.
+
+    Returns:
+        An object array of shape (num_elmnts, sum(length_multiplier)) of
+        the gate lists of the group elements of each pattern and multiplier.
+    """
+    rng = _seed_rng(seed, seed_offset, rand_seed)
+    sizes = []
+    for rb_q_num, mult in zip(pattern_sizes, length_multiplier):
+        sizes += mult * [rb_q_num]
+    ret = np.empty((num_elmnts, len(sizes)), dtype=object)
+    for elmnts_index in range(num_elmnts):
+        for col, rb_q_num in enumerate(sizes):
+            ret[elmnts_index, col] = Gutils.random_gates(rb_q_num, rng)
+    return ret
+
+
+def _elmnt_gates(rb_q_num, idx, Gutils):
+    """Return the cached gate list of a group element."""
+    key = (rb_q_num, int(idx))
+    if key not in _ELMNT_GATES:
+        if rb_q_num == 1:
+            _ELMNT_GATES[key] = Gutils.clifford1_gates(key[1])
+        else:
+            _ELMNT_GATES[key] = Gutils.clifford2_gates(key[1])
+    return _ELMNT_GATES[key]
+
+
+def _inverse_gatelists(elmnt_indices, pattern_sizes, length_vector,
+                       length_multiplier, Gutils, interleaved_gates=None):
+    """
+    Compute the inverse gate lists of the rb sequences of all the seeds.
+
+    The group elements are tracked by their canonical indices, composing a
+    layer of elements of every seed and pattern of the same number of
+    qubits at once with the group product tables, so that no Clifford
+    table is simulated while the sequences are generated.
+
+    Args:
+        elmnt_indices: an integer array of shape
+            (nseeds, num_elmnts, sum(length_multiplier)) of the indices of
+            the group elements returned by `_random_elmnt_indices`.
+        pattern_sizes: the number of qubits of each pattern.
+        length_vector: the vector of sequence lengths.
+        length_multiplier: the length multiplier of each pattern.
+        Gutils: the group utils object.
+        interleaved_gates: the interleaved gates of each pattern, or None
+            for standard rb sequences.
+
+    Returns:
+        A list over the seeds of lists over the sequence lengths of lists
+        of the inverse gate lists of each pattern.
+    """
+    nseeds = len(elmnt_indices)
+    offsets = np.cumsum([0] + list(length_multiplier))
+    ret = [[[None] * len(pattern_sizes) for _ in length_vector]
+           for _ in range(nseeds)]
+
+    for rb_q_num in set(pattern_sizes):
+        patterns = [pat for pat, size in enumerate(pattern_sizes)
+                    if size == rb_q_num]
+        # index of the group element of each seed and pattern
+        elmnts = np.zeros((nseeds, len(patterns)), dtype=int)
+        if interleaved_gates is not None:
+            interleaved_indices = np.array(
+                [Gutils.index_from_gates(rb_q_num, interleaved_gates[pat])
+                 for pat in patterns])
+
         length_index = 0
         for elmnts_index in range(length_vector[-1]):
-            for (rb_pattern_index, rb_q_num) in enumerate(pattern_sizes):
-                for _ in range(length_multiplier[rb_pattern_index]):
-
-                    new_elmnt_gatelist = Gutils.random_gates(
-                        rb_q_num)
-                    Elmnts[rb_pattern_index] = Gutils.compose_gates(
-                        Elmnts[rb_pattern_index], new_elmnt_gatelist)
-                    general_circ += replace_q_indices(
-                        get_quantum_circuit(new_elmnt_gatelist,
-                                            rb_q_num),
-                        rb_pattern[rb_pattern_index], qr)
-
-                    # add a barrier
-                    general_circ.barrier(
-                        *[qr[x] for x in rb_pattern[rb_pattern_index]])
-
-                    # interleaved rb sequences
-                    if interleaved_gates is not None:
-                        Elmnts_interleaved[rb_pattern_index] = \
-                            Gutils.compose_gates(
-                                Elmnts_interleaved[rb_pattern_index],
-                                new_elmnt_gatelist)
-                        Elmnts_interleaved[rb_pattern_index] = \
-                            Gutils.compose_gates(
-                                Elmnts_interleaved[rb_pattern_index],
-                                interleaved_gates[rb_pattern_index])
-                        interleaved_circ += replace_q_indices(
-                            get_quantum_circuit(new_elmnt_gatelist,
-                                                rb_q_num),
-                            rb_pattern[rb_pattern_index], qr)
-                        # add a barrier - interleaved rb
-                        interleaved_circ.barrier(
-                            *[qr[x] for x in rb_pattern[rb_pattern_index]])
-                        interleaved_circ += replace_q_indices(
-                            get_quantum_circuit(interleaved_gates
-                                                [rb_pattern_index],
-                                                rb_q_num),
-                            rb_pattern[rb_pattern_index], qr)
-                        # add a barrier - interleaved rb
-                        interleaved_circ.barrier(
-                            *[qr[x] for x in rb_pattern[rb_pattern_index]])
-
-            if align_cliffs:
-                # if align at a barrier across all patterns
-                general_circ.barrier(
-                    *[qr[x] for x in qlist_flat])
-                # align for interleaved rb
+            for mult in range(max(length_multiplier[pat]
+                                  for pat in patterns)):
+                active = [j for j, pat in enumerate(patterns)
+                          if mult < length_multiplier[pat]]
+                elmnt_cols = [offsets[patterns[j]] + mult for j in active]
+                elmnts[:, active] = Gutils.compose_indices(
+                    rb_q_num, elmnts[:, active],
+                    elmnt_indices[:, elmnts_index, elmnt_cols])
                 if interleaved_gates is not None:
-                    interleaved_circ.barrier(
-                        *[qr[x] for x in qlist_flat])
+                    elmnts[:, active] = Gutils.compose_indices(
+                        rb_q_num, elmnts[:, active],
+                        interleaved_indices[active])
 
-            # if the number of elements matches one of the sequence lengths
-            # then calculate the inverse and produce the circuit
             if (elmnts_index+1) == length_vector[length_index]:
-                # circ for rb:
-                circ = qiskit.QuantumCircuit(qr, cr)
-                circ += general_circ
-                # circ_interleaved for interleaved rb:
-                circ_interleaved = qiskit.QuantumCircuit(qr, cr)
-                circ_interleaved += interleaved_circ
-
-                for (rb_pattern_index, rb_q_num) in enumerate(pattern_sizes):
-                    inv_key = Gutils.find_key(Elmnts[rb_pattern_index])
-                    inv_circuit = Gutils.find_inverse_gates(
-                        rb_q_num,
-                        group_tables[rb_q_num-1][inv_key])
-                    circ += replace_q_indices(
-                        get_quantum_circuit(inv_circuit, rb_q_num),
-                        rb_pattern[rb_pattern_index], qr)
-                    # calculate the inverse and produce the circuit
-                    # for interleaved rb
+                for seed in range(nseeds):
+                    for j, pat in enumerate(patterns):
+                        ret[seed][length_index][pat] = \
+                            Gutils.find_inverse_gates(
+                                rb_q_num,
+                                _elmnt_gates(rb_q_num, elmnts[seed, j],
+                                             Gutils))
+                length_index += 1
+    return ret
+
+
+def _tracked_inverse_gatelists(elmnts, pattern_sizes, length_vector,
+                               length_multiplier, Gutils,
+                               interleaved_gates=None):
+    """
+    Compute the inverse gate lists of rb sequences of gate list elements.
+
+    The group elements of each seed and pattern are tracked as a
+    `PackedClifford` and the inverse of each sequence is synthesized from
+    its Clifford table, so that no group table is needed.
+
+    Args:
+        elmnts: a list over the seeds of the arrays of gate lists returned
+            by `_random_elmnt_gatelists`.
+        pattern_sizes: the number of qubits of each pattern.
+        length_vector: the vector of sequence lengths.
+        length_multiplier: the length multiplier of each pattern.
+        Gutils: the group utils object.
+        interleaved_gates: the interleaved gates of each pattern, or None
+            for standard rb sequences.
+
+    Returns:
+        A list over the seeds of lists over the sequence lengths of lists
+        of the inverse gate lists of each pattern.
+    """
+    offsets = np.cumsum([0] + list(length_multiplier))
+    ret = []
+    for seed_elmnts in elmnts:
+        seed_ret = []
+        cliffs = [PackedClifford(rb_q_num) for rb_q_num in pattern_sizes]
+        length_index = 0
+        for elmnts_index in range(length_vector[-1]):
+            for pat, cliff in enumerate(cliffs):
+                for mult in range(length_multiplier[pat]):
+                    Gutils.compose_gates(
+                        cliff, seed_elmnts[elmnts_index, offsets[pat] + mult])
                     if interleaved_gates is not None:
-                        inv_key = Gutils.find_key(Elmnts_interleaved
-                                                  [rb_pattern_index])
-                        inv_circuit = Gutils.find_inverse_gates(
-                            rb_q_num,
-                            group_tables[rb_q_num - 1][inv_key])
-                        circ_interleaved += replace_q_indices(
-                            get_quantum_circuit(inv_circuit, rb_q_num),
-                            rb_pattern[rb_pattern_index], qr)
-
-                # Circuits for purity rb
-                if is_purity:
-                    circ_purity = [[] for d in range(npurity)]
-                    for d in range(npurity):
-                        circ_purity[d] = qiskit.QuantumCircuit(qr, cr)
-                        circ_purity[d] += circ
-                        circ_purity[d].name = 'rb_purity_'
-                        ind_d = d
-                        purity_qubit_num = 0
-                        while True:
-                            # Per each qubit:
-                            # do nothing or rx(pi/2) or ry(pi/2)
-                            purity_qubit_rot = np.mod(ind_d, 3)
-                            ind_d = np.floor_divide(ind_d, 3)
-                            if purity_qubit_rot == 0:  # do nothing
-                                circ_purity[d].name += 'Z'
-                            if purity_qubit_rot == 1:  # add rx(pi/2)
-                                for pat in rb_pattern:
+                        Gutils.compose_gates(cliff, interleaved_gates[pat])
+            if (elmnts_index+1) == length_vector[length_index]:
+                seed_ret.append([
+                    Gutils.clifford_inverse_gates(cliff.to_clifford())
+                    for cliff in cliffs])
+                length_index += 1
+        ret.append(seed_ret)
+    return ret
+
+
+def _rb_seed_circuits(task, rb_pattern, length_vector, length_multiplier,
+                      seed_offset, align_cliffs, interleaved_gates, is_purity,
+                      basis_gates=None, templates=None):
+    """
+    Generate the rb sequences of a single seed.
+
+    Args:
+        task: a tuple of the index of the seed, the indices of its group
+            elements returned by `_random_elmnt_indices` (or the gate lists
+            returned by `_random_elmnt_gatelists`), and the inverse
+            gate lists of its rb sequences and of its interleaved rb
+            sequences returned by `_inverse_gatelists`.
+        rb_pattern: the RB pattern.
+        length_vector: the vector of sequence lengths.
+        length_multiplier: the length multiplier of each pattern.
+        seed_offset: the offset of the seed in the circuit names.
+        align_cliffs: add a barrier across all the pattern qubits.
+        interleaved_gates: the interleaved gates or None.
+        is_purity: True only for purity rb.
+        basis_gates: the basis gates or decomposition table of the group
+            elements, or None.
+        templates: a dict of cached instruction templates (optional).
+
+    Returns:
+        A tuple of the lists of circuits of the rb sequences, of the
+        interleaved rb sequences and of the purity rb sequences.
+    """
+    seed, elmnt_indices, inverse_gates, inverse_interleaved_gates = task
+    Gutils = clutils()
+    qlist_flat, n_q_max, max_dim = check_pattern(rb_pattern, is_purity)
+    pattern_sizes = [len(pat) for pat in rb_pattern]
+    offsets = np.cumsum([0] + list(length_multiplier))
+    npurity = 3**max_dim
+    if templates is None:
+        templates = {}
+
+    circuits = []
+    circuits_interleaved = []
+    circuits_purity = [[] for d in range(npurity)]
+
+    qr = qiskit.QuantumRegister(n_q_max+1, 'qr')
+    cr = qiskit.ClassicalRegister(len(qlist_flat), 'cr')
+    general_circ = qiskit.QuantumCircuit(qr, cr)
+    interleaved_circ = qiskit.QuantumCircuit(qr, cr)
+
+    # go through and add elements to RB sequences
+    length_index = 0
+    for elmnts_index in range(length_vector[-1]):
+        for (rb_pattern_index, rb_q_num) in enumerate(pattern_sizes):
+            for mult in range(length_multiplier[rb_pattern_index]):
+
+                new_elmnt_gatelist = elmnt_indices[
+                    elmnts_index, offsets[rb_pattern_index] + mult]
+                if elmnt_indices.dtype != object:
+                    new_elmnt_gatelist = _elmnt_gates(
+                        rb_q_num, new_elmnt_gatelist, Gutils)
+                elmnt_template = _gatelist_template(
+                    new_elmnt_gatelist, rb_pattern[rb_pattern_index],
+                    qr, templates, basis_gates)
+                _append_template(general_circ, elmnt_template)
+
+                # add a barrier
+                _append_barrier(general_circ,
+                                rb_pattern[rb_pattern_index], qr, templates)
+
+                # interleaved rb sequences
+                if interleaved_gates is not None:
+                    _append_template(interleaved_circ, elmnt_template)
+                    # add a barrier - interleaved rb
+                    _append_barrier(interleaved_circ,
+                                    rb_pattern[rb_pattern_index], qr,
+                                    templates)
+                    _append_template(interleaved_circ, _gatelist_template(
+                        interleaved_gates[rb_pattern_index],
+                        rb_pattern[rb_pattern_index], qr, templates,
+                        basis_gates))
+                    # add a barrier - interleaved rb
+                    _append_barrier(interleaved_circ,
+                                    rb_pattern[rb_pattern_index], qr,
+                                    templates)
+
+        if align_cliffs:
+            # if align at a barrier across all patterns
+            _append_barrier(general_circ, qlist_flat, qr, templates)
+            # align for interleaved rb
+            if interleaved_gates is not None:
+                _append_barrier(interleaved_circ, qlist_flat, qr, templates)
+
+        # if the number of elements matches one of the sequence lengths
+        # then calculate the inverse and produce the circuit
+        if (elmnts_index+1) == length_vector[length_index]:
+            # circ for rb:
+            circ = _copy_prefix(general_circ, qr, cr)
+            # circ_interleaved for interleaved rb:
+            if interleaved_gates is not None:
+                circ_interleaved = _copy_prefix(interleaved_circ, qr, cr)
+
+            for rb_pattern_index in range(len(pattern_sizes)):
+                inv_circuit = inverse_gates[length_index][rb_pattern_index]
+                _append_template(circ, _gatelist_template(
+                    inv_circuit, rb_pattern[rb_pattern_index], qr,
+                    templates, basis_gates))
+                # the inverse circuit for interleaved rb
+                if interleaved_gates is not None:
+                    inv_circuit = inverse_interleaved_gates[
+                        length_index][rb_pattern_index]
+                    _append_template(circ_interleaved, _gatelist_template(
+                        inv_circuit, rb_pattern[rb_pattern_index], qr,
+                        templates, basis_gates))
+
+            # Circuits for purity rb
+            if is_purity:
+                circ_purity = [[] for d in range(npurity)]
+                for d in range(npurity):
+                    circ_purity[d] = _copy_prefix(circ, qr, cr)
+                    circ_purity[d].name = 'rb_purity_'
+                    ind_d = d
+                    purity_qubit_num = 0
+                    while True:
+                        # Per each qubit:
+                        # do nothing or rx(pi/2) or ry(pi/2)
+                        purity_qubit_rot = np.mod(ind_d, 3)
+                        ind_d = np.floor_divide(ind_d, 3)
+                        if purity_qubit_rot == 0:  # do nothing
+                            circ_purity[d].name += 'Z'
+                        if purity_qubit_rot == 1:  # add rx(pi/2)
+                            for pat in rb_pattern:
+                                if basis_gates is None:
                                     circ_purity[d].rx(np.pi / 2,
                                                       qr[pat[
                                                           purity_qubit_num]])
-                                circ_purity[d].name += 'X'
-                            if purity_qubit_rot == 2:  # add ry(pi/2)
-                                for pat in rb_pattern:
+                                else:
+                                    _append_template(
+                                        circ_purity[d], _gatelist_template(
+                                            _RX_GATES,
+                                            [pat[purity_qubit_num]], qr,
+                                            templates, basis_gates))
+                            circ_purity[d].name += 'X'
+                        if purity_qubit_rot == 2:  # add ry(pi/2)
+                            for pat in rb_pattern:
+                                if basis_gates is None:
                                     circ_purity[d].ry(np.pi / 2,
                                                       qr[pat[
                                                           purity_qubit_num]])
-                                circ_purity[d].name += 'Y'
-                            purity_qubit_num = purity_qubit_num + 1
-                            if ind_d == 0:
-                                break
-                        # padding the circuit name with Z's so that
-                        # all circuits will have names of the same length
-                        for _ in range(max_dim - purity_qubit_num):
-                            circ_purity[d].name += 'Z'
-                        # add measurement for purity rb
-                        for qind, qb in enumerate(qlist_flat):
-                            circ_purity[d].measure(qr[qb], cr[qind])
-                        circ_purity[d].name += '_length_%d_seed_%d' \
-                                               % (length_index,
+                                else:
+                                    _append_template(
+                                        circ_purity[d], _gatelist_template(
+                                            _RY_GATES,
+                                            [pat[purity_qubit_num]], qr,
+                                            templates, basis_gates))
+                            circ_purity[d].name += 'Y'
+                        purity_qubit_num = purity_qubit_num + 1
+                        if ind_d == 0:
+                            break
+                    # padding the circuit name with Z's so that
+                    # all circuits will have names of the same length
+                    for _ in range(max_dim - purity_qubit_num):
+                        circ_purity[d].name += 'Z'
+                    # add measurement for purity rb
+                    _append_measure(circ_purity[d], qlist_flat, qr, cr,
+                                    templates)
+                    circ_purity[d].name += '_length_%d_seed_%d' \
+                                           % (length_index,
+                                              seed + seed_offset)
+
+            # add measurement for standard rb
+            # qubits measure to the c registers as
+            # they appear in the pattern
+            _append_measure(circ, qlist_flat, qr, cr, templates)
+            circ.name = 'rb_length_%d_seed_%d' % (length_index,
                                                   seed + seed_offset)
-
-                # add measurement for standard rb
-                # qubits measure to the c registers as
-                # they appear in the pattern
-                for qind, qb in enumerate(qlist_flat):
-                    circ.measure(qr[qb], cr[qind])
-                    # add measurement for interleaved rb
-                    circ_interleaved.measure(qr[qb], cr[qind])
-
-                circ.name = 'rb_length_%d_seed_%d' % (length_index,
-                                                      seed + seed_offset)
+            circuits.append(circ)
+            # add measurement for interleaved rb
+            if interleaved_gates is not None:
+                _append_measure(circ_interleaved, qlist_flat, qr, cr,
+                                templates)
                 circ_interleaved.name = 'rb_interleaved_length_%d_seed_%d' \
                                         % (length_index, seed + seed_offset)
+                circuits_interleaved.append(circ_interleaved)
+            if is_purity:
+                for d in range(npurity):
+                    circuits_purity[d].append(circ_purity[d])
+            length_index += 1
 
-                circuits[seed].append(circ)
-                circuits_interleaved[seed].append(circ_interleaved)
-                if is_purity:
-                    for d in range(npurity):
-                        circuits_purity[seed][d].append(circ_purity[d])
-                length_index += 1
+    return circuits, circuits_interleaved, circuits_purity
 
-    # output of interleaved rb
-    if interleaved_gates is not None:
-        return circuits, xdata, circuits_interleaved
-    # output of purity rb
-    if is_purity:
-        return circuits_purity, xdata, npurity
-    # output of standard (simultaneous) rb
-    return circuits, xdata
+
+def _gatelist_template(gatelist, q_nums, qr, templates, basis_gates=None):
+    """
+    Return the cached instruction template of a gate list.
+
+    The template is a list of (gate factory, qubits) pairs of the gate list
+    in the basis gates with qubit i of the gate list replaced by qubit
+    q_nums[i] of qr, and is computed only once for each gate list and qubit
+    mapping.
+    """
+    key = (tuple(gatelist), tuple(q_nums))
+    if key not in templates:
+        if basis_gates is None:
+            native = []
+            for op in gatelist:
+                split = op.split()
+                qubits = [int(x) for x in split[1:]]
+                native += [(gate, qubits) for gate in _GATE_CLASSES[split[0]]]
+        else:
+            native = _native_gates(gatelist, basis_gates)
+        templates[key] = [(gate, [qr[q_nums[q]] for q in qubits])
+                          for gate, qubits in native]
+    return templates[key]
+
+
+def _sequence_gate_counts(basis, qubits, nseeds=1, length_vector=None,
+                          rb_pattern=None, length_multiplier=1,
+                          seed_offset=0, align_cliffs=False,
+                          interleaved_gates=None, is_purity=False,
+                          group_gates=None, rand_seed=None, num_processes=1,
+                          basis_gates=None):
+    """
+    Count the gates of the rb sequences without generating their circuits.
+
+    The group elements and inverses of the sequences are drawn as in
+    `randomized_benchmarking_seq` with the same arguments, and the gates of
+    the instruction template of each distinct element are counted once and
+    weighted by the number of sequences containing the element.
+
+    Args:
+        basis: the names of the gates to count.
+        qubits: the qubits to count over.
+        nseeds, length_vector, rb_pattern, length_multiplier, seed_offset,
+        group_gates, rand_seed, basis_gates: as in
+            `randomized_benchmarking_seq`.
+        align_cliffs, num_processes: as in `randomized_benchmarking_seq`,
+            and ignored since they do not change the gates.
+        interleaved_gates, is_purity: as in `randomized_benchmarking_seq`.
+            Only standard rb sequences are supported.
+
+    Returns:
+        An integer array of shape (len(qubits), len(basis)) of the number
+        of gates of the rb sequences of all the seeds.
+
+    Raises:
+        ValueError: if rand_seed is None, since the sequences would not be
+            the ones of the generated circuits, or for interleaved or
+            purity rb sequences.
+    """
+    # pylint: disable=unused-argument
+    if rand_seed is None:
+        raise ValueError("The gates of the rb sequences can only be counted "
+                         "without their circuits for a given rand_seed")
+    if interleaved_gates is not None or is_purity:
+        raise ValueError("The gates of interleaved or purity rb sequences "
+                         "can only be counted from their circuits")
+    _check_basis_gates(basis_gates)
+    Gutils = _group_utils(group_gates)
+    if rb_pattern is None:
+        rb_pattern = [[0]]
+    if length_vector is None:
+        length_vector = [1, 10, 20]
+    _, n_q_max, _ = check_pattern(rb_pattern)
+    length_multiplier = handle_length_multiplier(length_multiplier,
+                                                 len(rb_pattern))
+    pattern_sizes = [len(pat) for pat in rb_pattern]
+    elmnt_indices, inverse_gatelists = _random_elmnts(
+        nseeds, pattern_sizes, length_vector, length_multiplier,
+        seed_offset, rand_seed, Gutils)
+    inverse_gates = inverse_gatelists(elmnt_indices, pattern_sizes,
+                                      length_vector, length_multiplier,
+                                      Gutils)
+
+    qr = qiskit.QuantumRegister(int(n_q_max+1), 'qr')
+    templates = {}
+    basis_ind = {name: ind for ind, name in enumerate(basis)}
+    qubit_ind = {qubit: ind for ind, qubit in enumerate(qubits)}
+    ngates = np.zeros((len(qubits), len(basis)), dtype=int)
+
+    def add_gatelist(gatelist, pat, weight):
+        for gate, qargs in _gatelist_template(
+                gatelist, rb_pattern[pat], qr, templates, basis_gates):
+            name = gate().name
+            if name in basis_ind:
+                for qubit in qargs:
+                    if qubit.index in qubit_ind:
+                        ngates[qubit_ind[qubit.index],
+                               basis_ind[name]] += weight
+
+    # the element elmnts_index is in the sequences longer than it
+    weights = len(length_vector) - np.searchsorted(
+        length_vector, np.arange(length_vector[-1]), side='right')
+    offsets = np.cumsum([0] + list(length_multiplier))
+    for pat, rb_q_num in enumerate(pattern_sizes):
+        cols = slice(offsets[pat], offsets[pat+1])
+        if isinstance(elmnt_indices, np.ndarray):
+            elmnts, inverse = np.unique(elmnt_indices[:, :, cols],
+                                        return_inverse=True)
+            elmnt_weights = np.bincount(
+                inverse.ravel(),
+                np.broadcast_to(weights[None, :, None],
+                                elmnt_indices[:, :, cols].shape).ravel())
+            for idx, weight in zip(elmnts, elmnt_weights):
+                add_gatelist(_elmnt_gates(rb_q_num, idx, Gutils), pat,
+                             int(weight))
+        else:
+            for seed_elmnts in elmnt_indices:
+                for elmnts_index, weight in enumerate(weights):
+                    for gatelist in seed_elmnts[elmnts_index, cols]:
+                        add_gatelist(gatelist, pat, int(weight))
+        for seed_inverses in inverse_gates:
+            for length_inverses in seed_inverses:
+                add_gatelist(length_inverses[pat], pat, 1)
+    return ngates
+
+
+def _check_basis_gates(basis_gates):
+    """Raise a ValueError for a decomposition table with unbound
+    parameters, since its instructions are added to the circuit data
+    without updating the parameter table of the circuits."""
+    if not isinstance(basis_gates, dict):
+        return
+    for name, gates in basis_gates.items():
+        for gate, _ in gates:
+            if any(isinstance(param, ParameterExpression)
+                   for param in gate.params):
+                raise ValueError("The decomposition of the %s gate has "
+                                 "unbound parameters" % name)
+
+
+def _native_gates(gatelist, basis_gates):
+    """
+    Decompose a gate list in basis gates.
+
+    Args:
+        gatelist: a gate list.
+        basis_gates: a list of basis gate names or a decomposition table
+            (see `randomized_benchmarking_seq`).
+
+    Returns:
+        A list of (gate factory, qubits) pairs, where the gate factory
+        returns a new instruction and qubits are qubits of the gate list.
+
+    Raises:
+        ValueError: if the basis gates have no cx or u3 gate.
+    """
+    native = []
+    if isinstance(basis_gates, dict):
+        for op in gatelist:
+            split = op.split()
+            qubits = [int(x) for x in split[1:]]
+            native += [(functools.partial(copy.deepcopy, gate),
+                        [qubits[j] for j in gate_qubits])
+                       for gate, gate_qubits in basis_gates[split[0]]]
+        return native
+
+    if 'cx' not in basis_gates or 'u3' not in basis_gates:
+        raise ValueError("The basis gates should include cx and u3 gates")
+    # unitaries of the runs of single-qubit gates on each qubit
+    runs = {}
+
+    def flush(qubit):
+        if qubit in runs:
+            native.extend((gate, [qubit]) for gate in
+                          _u_gates(runs.pop(qubit), basis_gates))
+
+    for op in gatelist:
+        split = op.split()
+        qubits = [int(x) for x in split[1:]]
+        if split[0] == 'cx':
+            for qubit in qubits:
+                flush(qubit)
+            native.append((CnotGate, qubits))
+        else:
+            runs[qubits[0]] = _gate_matrix(split[0]).dot(
+                runs.get(qubits[0], np.eye(2)))
+    for qubit in sorted(runs):
+        flush(qubit)
+    return native
+
+
+def _gate_matrix(name):
+    """Return the unitary of a single-qubit gate of the gate lists."""
+    if name not in _GATE_MATRICES:
+        unitary = np.eye(2)
+        for gate in _GATE_CLASSES[name]:
+            unitary = gate().to_matrix().dot(unitary)
+        _GATE_MATRICES[name] = unitary
+    return _GATE_MATRICES[name]
+
+
+def _u_gates(unitary, basis_gates):
+    """
+    Return the gate factories of a single-qubit unitary in the u basis.
+
+    The unitary is emitted as one u1, u2 or u3 gate, using the gate with
+    the fewest pulses in the basis gates, or as no gate for the identity.
+    """
+    theta, phi, lam = euler_angles_1q(unitary)
+    if np.isclose(np.sin(theta / 2), 0):
+        # diagonal unitary
+        angle = np.angle(np.exp(1j * (phi + lam)))
+        if np.isclose(angle, 0):
+            return []
+        if 'u1' in basis_gates:
+            return [functools.partial(U1Gate, angle)]
+    elif np.isclose(theta, np.pi / 2) and 'u2' in basis_gates:
+        return [functools.partial(U2Gate, phi, lam)]
+    return [functools.partial(U3Gate, theta, phi, lam)]
+
+
+# The instructions below are added to the circuit data directly: the qubits
+# of the templates are qubits of the circuit registers and the gate
+# parameters are numbers, so the argument checks and the parameter table
+# update of QuantumCircuit.append are not needed.
+
+def _append_template(circuit, template):
+    """Append new gate instances of an instruction template in place."""
+    # pylint: disable=protected-access
+    data = circuit._data
+    for gate, qargs in template:
+        data.append((gate(), list(qargs), []))
+
+
+def _append_barrier(circuit, q_nums, qr, templates):
+    """Append a barrier on the qubits q_nums of qr in place."""
+    # pylint: disable=protected-access
+    key = ('barrier', tuple(q_nums))
+    if key not in templates:
+        templates[key] = [qr[x] for x in q_nums]
+    qargs = templates[key]
+    circuit._data.append((Barrier(len(qargs)), list(qargs), []))
+
+
+def _append_measure(circuit, q_nums, qr, cr, templates):
+    """Measure the qubits q_nums of qr to the bits of cr in place."""
+    # pylint: disable=protected-access
+    key = ('measure', tuple(q_nums))
+    if key not in templates:
+        templates[key] = [(qr[qb], cr[qind]) for qind, qb in enumerate(q_nums)]
+    data = circuit._data
+    for qubit, clbit in templates[key]:
+        data.append((Measure(), [qubit], [clbit]))
+
+
+def _copy_prefix(circuit, qr, cr):
+    """
+    Return a new circuit on qr and cr with the instructions of circuit.
+
+    The instruction list is copied directly rather than appending and
+    validating the instructions one at a time. The instructions are shared
+    with the input circuit, as with `QuantumCircuit.extend`.
+    """
+    # pylint: disable=protected-access
+    new_circuit = qiskit.QuantumCircuit(qr, cr)
+    new_circuit._data = circuit._data.copy()
+    return new_circuit
 
 
 def replace_q_indices(circuit, q_nums, qr):
@@ -436,7 +1053,6 @@ def get_quantum_circuit(gatelist, num_qubits):
 
         qubits = [qr[int(x)] for x in split[1:]]
         for sub_op in op_names:
-            operation = eval('qiskit.QuantumCircuit.' + sub_op)
-            operation(qc, *qubits)
+            qc.append(_GATE_CLASSES[sub_op][0](), qubits)
 
     return qc
@@ -14,8 +14,11 @@
 
 """Advanced Clifford operations needed for randomized benchmarking."""
 
+import os
+from collections.abc import Mapping
 import numpy as np
 from .Clifford import Clifford
+from .packed_clifford import PackedClifford
 from .basic_utils import BasicUtils
 
 try:
@@ -23,6 +26,187 @@ try:
 except ImportError:
     import pickle
 
+# Packaged table of the 2-qubit Clifford gates
+CLIFFORD2_TABLE_FILE = os.path.join(os.path.dirname(__file__),
+                                    'cliffords2.npy')
+
+# Gate codes of the Clifford table file. Code j > 0 is the gate
+# _TABLE_GATES[j - 1] and code 0 pads the gate lists to equal length.
+_TABLE_GATES = ['%s %d' % (gate, q)
+                for gate in ('h', 's', 'sdg', 'v', 'w', 'x', 'y', 'z')
+                for q in (0, 1)] + ['cx 0 1', 'cx 1 0']
+
+
+# Cache of the gate names and qubits of the gate list operations
+_PARSED_GATES = {}
+
+
+class CliffordTable(Mapping):
+    """
+    Read-only table of Clifford gate lists keyed by the Clifford index.
+
+    The table is stored as a numpy array file of the sorted Clifford
+    indices and their gate codes, which is memory mapped the first time
+    the table is accessed. The mapped pages are shared by all the
+    processes using the table.
+    """
+
+    def __init__(self, filename=CLIFFORD2_TABLE_FILE):
+        """
+        Args:
+            filename: the table file written by `CliffordTable.save`.
+        """
+        self._filename = filename
+        self._array = None
+        self._cache = {}
+
+    def __getstate__(self):
+        # the table is mapped again by each process
+        return {'_filename': self._filename, '_array': None, '_cache': {}}
+
+    @property
+    def array(self):
+        """Return the memory mapped table array."""
+        if self._array is None:
+            self._array = np.load(self._filename, mmap_mode='r')
+        return self._array
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            keys = self.array['key']
+            pos = np.searchsorted(keys, key)
+            if pos == len(keys) or keys[pos] != key:
+                raise KeyError(key)
+            self._cache[key] = [_TABLE_GATES[code - 1]
+                                for code in self.array['gates'][pos]
+                                if code > 0]
+        return list(self._cache[key])
+
+    def __iter__(self):
+        return (int(key) for key in self.array['key'])
+
+    def __len__(self):
+        return len(self.array)
+
+    @staticmethod
+    def save(filename, gates_table):
+        """
+        Write a table of Clifford gate lists to a file.
+
+        Args:
+            filename: the table file name.
+            gates_table: a dict of gate lists keyed by the Clifford index,
+                such as the output of `CliffordUtils.clifford2_gates_table`.
+        """
+        keys = sorted(gates_table)
+        num_gates = max(len(gates) for gates in gates_table.values())
+        dtype = [('key', '<u4'), ('gates', 'u1', (num_gates,))]
+        array = np.zeros(len(keys), dtype=dtype)
+        for pos, key in enumerate(keys):
+            gates = gates_table[key]
+            array['key'][pos] = key
+            array['gates'][pos, :len(gates)] = [
+                _TABLE_GATES.index(gate) + 1 for gate in gates]
+        np.save(filename, array)
+
+
+# Cache of the index tables of the 1 and 2 qubit Clifford groups
+_GROUP_TABLES = {}
+
+
+def _gate_codes(gatelists):
+    """Return the gate codes of gate lists padded to equal length."""
+    codes = np.zeros((len(gatelists), max(len(g) for g in gatelists)),
+                     dtype=int)
+    for row, gatelist in enumerate(gatelists):
+        codes[row, :len(gatelist)] = [_TABLE_GATES.index(gate) + 1
+                                      for gate in gatelist]
+    return codes
+
+
+def _group_tables(num_qubits):
+    """
+    Return the index tables of the 1 or 2 qubit Clifford group.
+
+    The Cliffords are labeled by the canonical index of the gate lists of
+    `CliffordUtils.clifford1_gates` and `CliffordUtils.clifford2_gates`.
+    The tables are computed once per process by simulating the gate lists
+    of the group elements in batches.
+
+    A 2-qubit index is 16 * symp + pauli for the gates of the symplectic
+    part symp followed by the Pauli gates pauli, where the Pauli index bits
+    are the X and Z parts of each qubit so that the product of Paulis is
+    the XOR of their indices (up to a phase). The product of Cliffords
+    (S1, P1) then (S2, P2) is S1 S2 P1' P2 where P1' is P1 conjugated by S2
+    and S1 S2 is a canonical symplectic part followed by a Pauli, so the
+    group product factors into a 720 x 720 table of symplectic products and
+    a 16 x 720 table of Pauli conjugations.
+    """
+    if num_qubits in _GROUP_TABLES:
+        return _GROUP_TABLES[num_qubits]
+    # pylint: disable=cyclic-import
+    from .batched_clifford import BatchedClifford
+
+    utils = CliffordUtils()
+    if num_qubits == 1:
+        size = 24
+        gates = utils.clifford1_gates
+    elif num_qubits == 2:
+        size = 11520
+        gates = utils.clifford2_gates
+    else:
+        raise ValueError("The number of qubits should be only 1 or 2")
+
+    def clifford_keys(*gatelists):
+        """Return the keys of the products of rows of gate lists."""
+        batch = BatchedClifford(num_qubits, len(gatelists[0]))
+        for gatelist in gatelists:
+            batch.compose_codes(_gate_codes(gatelist))
+        return np.array(batch.index())
+
+    # canonical index of the Clifford keys
+    keys = clifford_keys([gates(idx) for idx in range(size)])
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+
+    def canonical(keys):
+        return order[np.searchsorted(sorted_keys, keys)]
+
+    tables = {}
+    if num_qubits == 1:
+        gatelists = [gates(idx) for idx in range(size)]
+        product = canonical(clifford_keys(
+            [gatelists[a] for a in range(size) for _ in range(size)],
+            [gatelists[b] for _ in range(size) for b in range(size)]))
+        tables['product'] = product.reshape(size, size)
+        tables['inverse'] = np.argmax(tables['product'] == 0, axis=1)
+    else:
+        num_symp = size // 16
+        symp_gates = [gates(16 * symp) for symp in range(num_symp)]
+        pauli_gates = [gates(pauli) for pauli in range(16)]
+        product = np.zeros((num_symp, num_symp), dtype=int)
+        # products of all symplectic parts with each symplectic part
+        reps = BatchedClifford(num_qubits, num_symp)
+        reps.compose_codes(_gate_codes(symp_gates))
+        for symp in range(num_symp):
+            batch = reps.copy()
+            if symp_gates[symp]:
+                batch.compose_codes(np.tile(_gate_codes([symp_gates[symp]]),
+                                            (num_symp, 1)))
+            product[:, symp] = canonical(batch.index())
+        conj = canonical(clifford_keys(
+            [pauli_gates[pauli] for pauli in range(16)
+             for _ in range(num_symp)],
+            [symp_gates[symp] for _ in range(16)
+             for symp in range(num_symp)])) % 16
+        tables['product'] = product
+        tables['conjugate'] = conj.reshape(16, num_symp)
+        tables['inverse'] = np.argmax(product // 16 == 0, axis=1)
+    tables['keys'] = sorted_keys
+    tables['order'] = order
+    _GROUP_TABLES[num_qubits] = tables
+    return tables
+
 
 class CliffordUtils(BasicUtils):
     """Class for util functions for the Clifford group."""
@@ -81,28 +265,15 @@ class CliffordUtils(BasicUtils):
         """
 
         for op in gatelist:
-            split = op.split()
-            q1 = int(split[1])
-            if split[0] == 'v':
-                cliff.v(q1)
-            elif split[0] == 'w':
-                cliff.w(q1)
-            elif split[0] == 'x':
-                cliff.x(q1)
-            elif split[0] == 'y':
-                cliff.y(q1)
-            elif split[0] == 'z':
-                cliff.z(q1)
-            elif split[0] == 'cx':
-                cliff.cx(q1, int(split[2]))
-            elif split[0] == 'h':
-                cliff.h(q1)
-            elif split[0] == 's':
-                cliff.s(q1)
-            elif split[0] == 'sdg':
-                cliff.sdg(q1)
-            else:
-                raise ValueError("Unknown gate type: ", op)
+            parsed = _PARSED_GATES.get(op)
+            if parsed is None:
+                split = op.split()
+                if split[0] not in ('v', 'w', 'x', 'y', 'z', 'cx', 'h', 's',
+                                    'sdg'):
+                    raise ValueError("Unknown gate type: ", op)
+                parsed = (split[0], tuple(int(q) for q in split[1:]))
+                _PARSED_GATES[op] = parsed
+            getattr(cliff, parsed[0])(*parsed[1])
 
         self._elmnt = cliff
         return cliff
@@ -285,7 +456,7 @@ class CliffordUtils(BasicUtils):
         cliffords2 = {}
         for i in range(11520):
             circ = self.clifford2_gates(i)
-            key = self.clifford_from_gates(2, circ).index()
+            key = self.compose_gates(PackedClifford(2), circ).index()
             cliffords2[key] = circ
         return cliffords2
 
@@ -302,7 +473,7 @@ class CliffordUtils(BasicUtils):
         cliffords1 = {}
         for i in range(24):
             circ = self.clifford1_gates(i)
-            key = self.clifford_from_gates(1, circ).index()
+            key = self.compose_gates(PackedClifford(1), circ).index()
             cliffords1[key] = circ
         return cliffords1
 
@@ -361,21 +532,12 @@ class CliffordUtils(BasicUtils):
             clifford_tables = self.clifford1_gates_table()
 
         elif num_qubits == 2:
-            # 2Q Cliffords
-            # Try to load the table in from file. If it doesn't exist then make
-            # the file
-            try:
-                clifford_tables = self.load_clifford_table(
-                    picklefile='cliffords%d.pickle' % num_qubits)
-            except OSError:
-                # table doesn't exist, so save it
-                # this will save time next run
-                print('Making the n=%d Clifford Table' % num_qubits)
-                self.pickle_clifford_table(
-                    picklefile='cliffords%d.pickle' % num_qubits,
-                    num_qubits=num_qubits)
-                clifford_tables = self.load_clifford_table(
-                    picklefile='cliffords%d.pickle' % num_qubits)
+            # 2Q Cliffords, memory map the packaged table. If it is
+            # missing then make the table in memory
+            if os.path.exists(CLIFFORD2_TABLE_FILE):
+                clifford_tables = CliffordTable(CLIFFORD2_TABLE_FILE)
+            else:
+                clifford_tables = self.clifford2_gates_table()
         else:
             raise ValueError("The number of qubits should be only 1 or 2")
 
@@ -384,21 +546,25 @@ class CliffordUtils(BasicUtils):
     # --------------------------------------------------------
     # Main function that generates a random clifford gate
     # --------------------------------------------------------
-    def random_gates(self, num_qubits):
+    def random_gates(self, num_qubits, rng=None):
         """
         Pick a random Clifford gate.
 
         Args:
             num_qubits: dimension of the Clifford.
+            rng: a np.random.RandomState to draw the Clifford from
+                (default is the global numpy random number generator).
 
         Returns:
             A 1 or 2 qubit Clifford gate.
         """
 
+        if rng is None:
+            rng = np.random
         if num_qubits == 1:
-            cliff_gatelist = self.clifford1_gates(np.random.randint(0, 24))
+            cliff_gatelist = self.clifford1_gates(rng.randint(0, 24))
         elif num_qubits == 2:
-            cliff_gatelist = self.clifford2_gates(np.random.randint(0, 11520))
+            cliff_gatelist = self.clifford2_gates(rng.randint(0, 11520))
         else:
             raise ValueError("The number of qubits should be only 1 or 2")
 
@@ -433,6 +599,72 @@ class CliffordUtils(BasicUtils):
             return inv_gatelist
         raise ValueError("The number of qubits should be only 1 or 2")
 
+    # --------------------------------------------------------
+    # Clifford group algebra on canonical indices
+    # --------------------------------------------------------
+    def index_from_gates(self, num_qubits, gatelist):
+        """
+        Find the canonical index of a Clifford gate list.
+
+        Args:
+            num_qubits: the dimension of the Clifford (1 or 2).
+            gatelist: a Clifford gate list.
+
+        Returns:
+            The index idx of the Clifford such that clifford1_gates(idx) or
+            clifford2_gates(idx) implements the same Clifford.
+        """
+        tables = _group_tables(num_qubits)
+        key = self.compose_gates(PackedClifford(num_qubits),
+                                 gatelist).index()
+        return int(tables['order'][np.searchsorted(tables['keys'], key)])
+
+    def compose_indices(self, num_qubits, idx1, idx2):
+        """
+        Compose Cliffords given by their canonical indices.
+
+        Args:
+            num_qubits: the dimension of the Cliffords (1 or 2).
+            idx1: the index of the first Clifford, or an array of indices.
+            idx2: the index of the Clifford applied after idx1, or an
+                array of indices.
+
+        Returns:
+            The canonical index (or array of indices) of the Clifford of
+            the gates of idx1 followed by the gates of idx2.
+        """
+        tables = _group_tables(num_qubits)
+        idx1, idx2 = np.asarray(idx1), np.asarray(idx2)
+        if num_qubits == 1:
+            ret = tables['product'][idx1, idx2]
+        else:
+            product = tables['product'][idx1 // 16, idx2 // 16]
+            ret = 16 * (product // 16) + (
+                (product % 16) ^ tables['conjugate'][idx1 % 16, idx2 // 16]
+                ^ (idx2 % 16))
+        return int(ret) if ret.ndim == 0 else ret
+
+    def inverse_index(self, num_qubits, idx):
+        """
+        Find the canonical index of the inverse of a Clifford.
+
+        Args:
+            num_qubits: the dimension of the Clifford (1 or 2).
+            idx: the index of the Clifford, or an array of indices.
+
+        Returns:
+            The canonical index (or array of indices) of the inverse.
+        """
+        tables = _group_tables(num_qubits)
+        idx = np.asarray(idx)
+        if num_qubits == 1:
+            ret = tables['inverse'][idx]
+        else:
+            symp = tables['inverse'][idx // 16]
+            ret = 16 * symp + ((tables['product'][idx // 16, symp] % 16) ^
+                               tables['conjugate'][idx % 16, symp])
+        return int(ret) if ret.ndim == 0 else ret
+
     def find_key(self, cliff):
         """
         Find the Clifford index.
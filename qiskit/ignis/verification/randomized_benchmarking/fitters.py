@@ -16,13 +16,12 @@
 Functions used for the analysis of randomized benchmarking results.
 """
 
+import warnings
 from abc import ABC, abstractmethod
 from scipy.optimize import curve_fit
 import numpy as np
-from qiskit import QiskitError
-from qiskit.quantum_info.analysis.average import average_data
-from ..tomography import marginal_counts
-from ...characterization.fitters import build_counts_dict_from_list
+from ...utils import ResultIndex
+from .batched_fit import fit_rb_decays, rb_decay_guess
 
 try:
     from matplotlib import pyplot as plt
@@ -151,7 +150,16 @@ class RBFitter(RBFitterBase):
         self._nseeds = []
         self._circ_name_type = ''
 
-        self._result_list = []
+        # Success counts and shots of each seed, as arrays of shape
+        # (number of patterns, number of lengths)
+        self._successes = {}
+        self._shots = {}
+        # Experiments added since the raw data was last updated
+        self._new_names = {}
+        # Parameters of the last fit of each pattern
+        self._warm_start = [None for e in rb_pattern]
+
+        self._result_index = ResultIndex()
         self.add_data(backend_result)
 
     @property
@@ -208,13 +216,21 @@ class RBFitter(RBFitterBase):
     @property
     def results(self):
         """Return all the results."""
-        return self._result_list
+        return self._result_index.results
+
+    @property
+    def result_index(self):
+        """Return the index of the results by experiment name."""
+        return self._result_index
 
     def add_data(self, new_backend_result, rerun_fit=True):
         """
         Add a new result. Re calculate the raw data, means and
         fit.
 
+        Only the raw data of the circuits of the new results is
+        recalculated, and the fit starts from the previous fit parameters.
+
         Args:
             new_backend_result: list of rb results
             rerun_fit: re caculate the means and fit the result
@@ -231,18 +247,19 @@ class RBFitter(RBFitterBase):
             new_backend_result = [new_backend_result]
 
         for result in new_backend_result:
-            self._result_list.append(result)
+            self._result_index.add_results(result)
 
             # update the number of seeds *if* new ones
             # added. Note, no checking if we've done all the
             # cliffords
             for rbcirc in result.results:
+                self._new_names[rbcirc.header.name] = None
                 nseeds_circ = int(rbcirc.header.name.split('_')[-1])
                 if nseeds_circ not in self._nseeds:
                     self._nseeds.append(nseeds_circ)
 
         if rerun_fit:
-            self.calc_data()
+            self.update_data()
             self.calc_statistics()
             self.fit_data()
 
@@ -267,51 +284,65 @@ class RBFitter(RBFitterBase):
 
         # The type of the circuit name, e.g. rb or rb_interleaved
         # as it appears in the result (before _length_%d_seed_%d)
-        self._circ_name_type = self._result_list[0].results[0]. \
+        self._circ_name_type = self.results[0].results[0]. \
             header.name.split("_length")[0]
 
-        circ_counts = {}
-        circ_shots = {}
-        for seed in self._nseeds:
-            for circ, _ in enumerate(self._cliff_lengths[0]):
-                circ_name = self._circ_name_type + '_length_%d_seed_%d' \
-                            % (circ, seed)
-                count_list = []
-                for result in self._result_list:
-                    try:
-                        count_list.append(result.get_counts(circ_name))
-                    except (QiskitError, KeyError):
-                        pass
+        self._successes = {}
+        self._shots = {}
+        self._new_names = dict.fromkeys(self._result_index.names())
+        self.update_data()
 
-                circ_counts[circ_name] = \
-                    build_counts_dict_from_list(count_list)
+    def update_data(self):
+        """Update the probabilities of success with the circuits added
+        since the last update.
 
-                circ_shots[circ_name] = sum(circ_counts[circ_name].values())
+        The success counts of each pattern, seed and length are kept, so
+        that only the counts of the new circuits are marginalized.
+        Outputs results into the internal variable _raw_data as calc_data.
+        """
 
-        self._raw_data = []
+        if not self._circ_name_type and self.results:
+            self._circ_name_type = self.results[0].results[0]. \
+                header.name.split("_length")[0]
+
+        num_lengths = len(self._cliff_lengths[0])
+        # bit offsets and masks of the qubits of each pattern
+        bits = []
         startind = 0
+        for pattern in self._rb_pattern:
+            bits.append((startind, (1 << len(pattern)) - 1))
+            startind += len(pattern)
+
+        for circ_name in self._new_names:
+            circ_type, length, seed = _parse_circ_name(circ_name)
+            if circ_type != self._circ_name_type or length >= num_lengths:
+                continue
+            if seed not in self._successes:
+                self._successes[seed] = np.zeros(
+                    (len(self._rb_pattern), num_lengths), dtype=int)
+                self._shots[seed] = np.zeros(num_lengths, dtype=int)
+
+            # the counts of a circuit are merged over all the results, so
+            # that they replace the counts of the previous update
+            successes = [0] * len(self._rb_pattern)
+            shots = 0
+            for key, val in self._result_index.counts(circ_name).items():
+                outcome = int(key.replace(' ', ''), 2)
+                for patt_ind, (shift, mask) in enumerate(bits):
+                    if not (outcome >> shift) & mask:
+                        successes[patt_ind] += val
+                shots += val
+            self._successes[seed][:, length] = successes
+            self._shots[seed][length] = shots
+        self._new_names = {}
 
+        self._raw_data = []
         for patt_ind in range(len(self._rb_pattern)):
-
-            string_of_0s = ''
-            string_of_0s = string_of_0s.zfill(len(self._rb_pattern[patt_ind]))
-
             self._raw_data.append([])
-            endind = startind+len(self._rb_pattern[patt_ind])
-
-            for seedidx, seed in enumerate(self._nseeds):
-
-                self._raw_data[-1].append([])
-                for k, _ in enumerate(self._cliff_lengths[patt_ind]):
-                    circ_name = self._circ_name_type + '_length_%d_seed_%d' \
-                                % (k, seed)
-                    counts_subspace = marginal_counts(
-                        circ_counts[circ_name],
-                        np.arange(startind, endind))
-                    self._raw_data[-1][seedidx].append(
-                        counts_subspace.get(string_of_0s, 0)
-                        / circ_shots[circ_name])
-            startind = endind
+            for seed in self._nseeds:
+                self._raw_data[-1].append(
+                    (self._successes[seed][patt_ind]
+                     / self._shots[seed]).tolist())
 
     def calc_statistics(self):
         """Extract averages and std dev from the raw data (self._raw_data).
@@ -358,7 +389,6 @@ class RBFitter(RBFitterBase):
         """
 
         lens = self._cliff_lengths[patt_ind]
-        qubits = self._rb_pattern[patt_ind]
 
         # if at least one of the std values is zero, then sigma is replaced
         # by None
@@ -373,6 +403,13 @@ class RBFitter(RBFitterBase):
                                  sigma=sigma,
                                  p0=fit_guess,
                                  bounds=([0, 0, 0], [1, 1, 1]))
+        self._set_fit(patt_ind, params, pcov)
+
+    def _set_fit(self, patt_ind, params, pcov):
+        """Put the fit parameters and covariance of a pattern into its
+        fit dictionary."""
+
+        qubits = self._rb_pattern[patt_ind]
         alpha = params[1]  # exponent
         params_err = np.sqrt(np.diag(pcov))
         alpha_err = params_err[1]
@@ -383,12 +420,14 @@ class RBFitter(RBFitterBase):
 
         self._fit[patt_ind] = {'params': params, 'params_err': params_err,
                                'epc': epc, 'epc_err': epc_err}
+        self._warm_start[patt_ind] = params.copy()
 
     def fit_data(self):
         """Fit the RB results to an exponential curve.
 
-        Fit each of the patterns. Use the data to construct guess values
-        for the fits
+        Fit each of the patterns. Use the previous fit parameters, or the
+        data if there is no previous fit, to construct guess values for the
+        fits
 
         Puts the results into a list of fit dictionaries where each dictionary
         corresponds to a pattern and has fields:
@@ -402,6 +441,12 @@ class RBFitter(RBFitterBase):
 
         for patt_ind, _ in enumerate(self._rb_pattern):
 
+            # Warm start from the fit of the previous data
+            if self._warm_start[patt_ind] is not None:
+                self.fit_data_pattern(patt_ind,
+                                      tuple(self._warm_start[patt_ind]))
+                continue
+
             qubits = self._rb_pattern[patt_ind]
 
             # Should decay to 1/2^n
@@ -424,6 +469,74 @@ class RBFitter(RBFitterBase):
 
             self.fit_data_pattern(patt_ind, tuple(fit_guess))
 
+    def fit_data_batched(self, num_bootstrap=0, seed=None):
+        """Fit the RB results of all the patterns together.
+
+        The decays of all the patterns, and of the bootstrap resamples of
+        the seeds, are fitted with the vectorized Levenberg-Marquardt
+        iteration of `fit_rb_decays` instead of one `curve_fit` per
+        pattern. The fits start from the previous fit parameters, or from
+        log-linear guesses if there is no previous fit.
+
+        Args:
+            num_bootstrap: the number of bootstrap resamples of the seeds
+                of each pattern to fit (default is 0).
+            seed: seed of the bootstrap resamples.
+
+        Puts the results into the list of fit dictionaries as fit_data.
+        If num_bootstrap is positive, the dictionaries also have fields:
+
+         * ``bootstrap_params`` - the num_bootstrap x 3 parameters of the
+           fits of the resamples.
+         * ``bootstrap_epc`` - the num_bootstrap errors per Clifford of the
+           fits of the resamples.
+        """
+
+        xdata = np.array(self._cliff_lengths, dtype=float)
+        ydata = np.array([ydata['mean'] for ydata in self._ydata])
+        sigma = np.ones_like(ydata)
+        for patt_ind, ydata_patt in enumerate(self._ydata):
+            # the same rule for zero std values as fit_data_pattern
+            if ydata_patt['std'] is not None and \
+                    np.count_nonzero(ydata_patt['std']) == len(sigma[0]):
+                sigma[patt_ind] = ydata_patt['std']
+        num_qubits = np.array([len(qubits) for qubits in self._rb_pattern])
+
+        p0 = rb_decay_guess(xdata, ydata, sigma, num_qubits)
+        for patt_ind, warm_start in enumerate(self._warm_start):
+            if warm_start is not None:
+                p0[patt_ind] = warm_start
+        params, pcov = fit_rb_decays(xdata, ydata, sigma, p0)
+        for patt_ind, _ in enumerate(self._rb_pattern):
+            self._set_fit(patt_ind, params[patt_ind], pcov[patt_ind])
+
+        if num_bootstrap <= 0:
+            return
+
+        # resample the seeds of each pattern with replacement
+        raw_data = np.array(self._raw_data)
+        num_seeds = len(self._raw_data[0])
+        num_lengths = len(self._cliff_lengths[0])
+        rng = np.random.RandomState(seed)
+        resamples = rng.randint(num_seeds, size=(num_bootstrap, num_seeds))
+        samples = raw_data[:, resamples]
+        ydata = np.mean(samples, axis=2).reshape(-1, num_lengths)
+        sigma = np.std(samples, axis=2).reshape(-1, num_lengths)
+        if num_seeds == 1:
+            sigma = np.ones_like(sigma)
+        else:
+            sigma[np.any(sigma == 0, axis=1)] = 1
+
+        params, _ = fit_rb_decays(np.repeat(xdata, num_bootstrap, axis=0),
+                                  ydata, sigma,
+                                  np.repeat(params, num_bootstrap, axis=0))
+        params = params.reshape(len(self._rb_pattern), num_bootstrap, 3)
+        for patt_ind, qubits in enumerate(self._rb_pattern):
+            nrb = 2 ** len(qubits)
+            self._fit[patt_ind]['bootstrap_params'] = params[patt_ind]
+            self._fit[patt_ind]['bootstrap_epc'] = \
+                (nrb-1)/nrb*(1-params[patt_ind, :, 1])
+
     def plot_rb_data(self, pattern_index=0, ax=None,
                      add_label=True, show_plt=True):
         """Plot randomized benchmarking data of a single pattern.
@@ -511,15 +624,15 @@ class InterleavedRBFitter(RBFitterBase):
         self._rb_pattern = rb_pattern
         self._fit_interleaved = []
 
-        self._rbfit_original = RBFitter(
-            original_result, cliff_lengths, rb_pattern)
-        self._rbfit_interleaved = RBFitter(
-            interleaved_result, cliff_lengths, rb_pattern)
+        self._rbfit_original = RBFitter(None, cliff_lengths, rb_pattern)
+        self._rbfit_interleaved = RBFitter(None, cliff_lengths, rb_pattern)
 
-        self.rbfit_std.add_data(original_result)
-        self.rbfit_int.add_data(interleaved_result)
+        self.rbfit_std.add_data(original_result, rerun_fit=False)
+        self.rbfit_int.add_data(interleaved_result, rerun_fit=False)
 
         if not (original_result is None and interleaved_result is None):
+            self.update_data()
+            self.calc_statistics()
             self.fit_data()
 
     @property
@@ -590,10 +703,12 @@ class InterleavedRBFitter(RBFitterBase):
             Assumes that 'result' was executed is
             the output of circuits generated by randomized_benchmarking_seq
         """
-        self.rbfit_std.add_data(new_original_result, rerun_fit)
-        self.rbfit_int.add_data(new_interleaved_result, rerun_fit)
+        self.rbfit_std.add_data(new_original_result, rerun_fit=False)
+        self.rbfit_int.add_data(new_interleaved_result, rerun_fit=False)
 
         if rerun_fit:
+            self.update_data()
+            self.calc_statistics()
             self.fit_data()
 
     def calc_data(self):
@@ -605,6 +720,13 @@ class InterleavedRBFitter(RBFitterBase):
         self.rbfit_std.calc_data()
         self.rbfit_int.calc_data()
 
+    def update_data(self):
+        """Update the probabilities of success with the circuits added
+        since the last update."""
+
+        self.rbfit_std.update_data()
+        self.rbfit_int.update_data()
+
     def calc_statistics(self):
         """Extract averages and std dev.
 
@@ -794,14 +916,35 @@ class PurityRBFitter(RBFitterBase):
         self._nq = len(rb_pattern[0])  # all patterns have same length
 
         self._fit = [{} for e in rb_pattern]
-        self._circ_name_type = ''
 
+        # Z-correlators of each seed, as arrays of shape (number of
+        # patterns, number of lengths, npurity, 2^n), and the purities of
+        # each seed, as arrays of shape (number of patterns, number of
+        # lengths)
+        self._correlators = {}
+        self._purities = {}
+        # Experiments added since the raw data was last updated
+        self._new_names = {}
+        # Z-correlator dictionaries of the deprecated add_zdict_ops
         self._zdict_ops = []
-        self.add_zdict_ops()
+
+        # The Pauli correlator of each Z-correlator of each purity circuit,
+        # and the matrix averaging the Z-correlators of each Pauli
+        # correlator
+        self._corr_index = np.array(
+            [[self.F234(self._nq, indcorr, pur)
+              for indcorr in range(2 ** self._nq)]
+             for pur in range(npurity)])
+        corr_counts = np.asarray(np.bincount(self._corr_index.ravel(),
+                                             minlength=4 ** self._nq))
+        self._corr_average = np.zeros((npurity * 2 ** self._nq,
+                                       4 ** self._nq))
+        self._corr_average[np.arange(npurity * 2 ** self._nq),
+                           self._corr_index.ravel()] = \
+            1 / corr_counts[self._corr_index.ravel()]
 
         # rb purity fitter
-        self._rbfit_purity = RBFitter(purity_result, cliff_lengths,
-                                      rb_pattern)
+        self._rbfit_purity = RBFitter(None, cliff_lengths, rb_pattern)
         self.add_data(purity_result)
 
     @property
@@ -885,7 +1028,15 @@ class PurityRBFitter(RBFitterBase):
 
     def add_zdict_ops(self):
         """Creating all Z-correlators
-        in order to compute the expectation values"""
+        in order to compute the expectation values
+
+        Deprecated, since the Z-correlators are computed with a
+        Walsh-Hadamard transform of the counts.
+        """
+        warnings.warn("PurityRBFitter.add_zdict_ops is deprecated, the "
+                      "Z-correlators are computed from the counts without "
+                      "the Z-correlator dictionaries", DeprecationWarning)
+        self._zdict_ops = []
         statedict = {("{0:0%db}" % self._nq).format(i): 1 for i in
                      range(2 ** self._nq)}
 
@@ -912,10 +1063,16 @@ class PurityRBFitter(RBFitterBase):
         if new_purity_result is None:
             return
 
-        self.rbfit_pur.add_data(new_purity_result, rerun_fit)
+        self.rbfit_pur.add_data(new_purity_result, rerun_fit=False)
+
+        if not isinstance(new_purity_result, list):
+            new_purity_result = [new_purity_result]
+        for result in new_purity_result:
+            for rbcirc in result.results:
+                self._new_names[rbcirc.header.name] = None
 
         if rerun_fit:
-            self.calc_data()
+            self.update_data()
             self.calc_statistics()
             self.fit_data()
 
@@ -929,86 +1086,63 @@ class PurityRBFitter(RBFitterBase):
         Assumes that 'result' was executed is
         the output of circuits generated by randomized_becnhmarking_seq,
         """
-        circ_counts = {}
-        circ_shots = {}
-        result_count = 0
-
-        # Calculating the result output
-        for _, seed in enumerate(self.rbfit_pur.seeds):
-
-            for pur in range(self._npurity):
-
-                self._circ_name_type = self.rbfit_pur.results[
-                    result_count].results[0].header.name.split("_length")[0]
-                result_count += 1
+        self._correlators = {}
+        self._purities = {}
+        self._new_names = dict.fromkeys(self.rbfit_pur.result_index.names())
+        self.update_data()
 
-                for circ, _ in enumerate(self._cliff_lengths[0]):
-                    circ_name = self._circ_name_type + '_length_%d_seed_%d' \
-                                % (circ, seed)
-                    count_list = []
-                    for result in self.rbfit_pur.results:
-                        try:
-                            count_list.append(result.get_counts(circ_name))
-                        except (QiskitError, KeyError):
-                            pass
-
-                    circ_name = 'rb_purity_' + str(pur) + \
-                                '_length_%d_seed_%d' % (circ, seed)
-
-                    circ_counts[circ_name] = build_counts_dict_from_list(
-                        count_list)
-                    circ_shots[circ_name] = sum(circ_counts[circ_name].
-                                                values())
+    def update_data(self):
+        """
+        Update the purities with the circuits added since the last update.
+
+        The Z-correlators of each purity circuit are kept, so that only the
+        counts of the new circuits are marginalized and only the purities
+        of their seeds and lengths are recalculated. All the Z-correlators
+        of a pattern are computed at once by a Walsh-Hadamard transform of
+        its counts indexed by outcome.
+        Outputs results into the internal variable _raw_data as calc_data.
+        """
+        num_lengths = len(self._cliff_lengths[0])
+        updated = set()
+        for circ_name in self._new_names:
+            circ_type, length, seed = _parse_circ_name(circ_name)
+            if not circ_type.startswith('rb_purity_') or \
+                    length >= num_lengths:
+                continue
+
+            # the purity circuit index from the rotation of each qubit
+            pur = 0
+            for qubit, rot in enumerate(circ_type[len('rb_purity_'):]):
+                pur += 'ZXY'.index(rot) * 3 ** qubit
+
+            if seed not in self._correlators:
+                self._correlators[seed] = np.full(
+                    (len(self._rb_pattern), num_lengths, self._npurity,
+                     2 ** self._nq), np.nan)
+                self._purities[seed] = np.full(
+                    (len(self._rb_pattern), num_lengths), np.nan)
+
+            # calculating the vectors of 2^n Z-correlators of the patterns
+            count_vecs = np.array(_pattern_count_vectors(
+                self.rbfit_pur.result_index.counts(circ_name),
+                [len(pattern) for pattern in self._rb_pattern]))
+            self._correlators[seed][:, length, pur] = \
+                _walsh_hadamard(count_vecs) / np.sum(count_vecs[0])
+            updated.add((seed, length))
+        self._new_names = {}
+
+        for seed, length in updated:
+            # the 4^n correlators, and the purity
+            correlators = self._correlators[seed][:, length].reshape(
+                len(self._rb_pattern), -1).dot(self._corr_average)
+            self._purities[seed][:, length] = \
+                np.sum(correlators ** 2, axis=1) / 2 ** self._nq
 
         # Calculating raw_data
-        self.rbfit_pur.raw_data = []
-        startind = 0
-        # for each pattern
-        for patt_ind, _ in enumerate(self._rb_pattern):
-
-            endind = startind + len(self._rb_pattern[patt_ind])
-            self.rbfit_pur.raw_data.append([])
-
-            # for each seed
-            for seedidx, seed in enumerate(self.rbfit_pur.seeds):
-                self.rbfit_pur.raw_data[-1].append([])
-
-                # for each length
-                for k, _ in enumerate(self._cliff_lengths[0]):
-
-                    # vector of the 4^n correlators and counts
-                    corr_vec = [0] * (4 ** self._nq)
-                    count_vec = [0] * (4 ** self._nq)
-                    # corr_list = [[] for e in range(4 ** self._nq)]
-
-                    for pur in range(self._npurity):
-
-                        circ_name = 'rb_purity_' + str(pur) + \
-                                    '_length_%d_seed_%d' % (k, seed)
-
-                        # marginal counts for the pattern
-                        counts_subspace = marginal_counts(
-                            circ_counts[circ_name],
-                            np.arange(startind, endind))
-
-                        # calculating the vector of 4^n correlators
-                        for indcorr in range(2 ** self._nq):
-                            zcorr = average_data(counts_subspace,
-                                                 self._zdict_ops[indcorr])
-                            zind = self.F234(self._nq, indcorr, pur)
-
-                            corr_vec[zind] += zcorr
-                            count_vec[zind] += 1
-
-                    # calculating the purity
-                    purity = 0
-                    for idx, _ in enumerate(corr_vec):
-                        purity += (corr_vec[idx]/count_vec[idx]) ** 2
-                    purity = purity / (2 ** self._nq)
-
-                    self.rbfit_pur.raw_data[-1][seedidx].append(purity)
-
-            startind = endind
+        self.rbfit_pur.raw_data = [
+            [self._purities[seed][patt_ind].tolist()
+             for seed in self.rbfit_pur.seeds]
+            for patt_ind, _ in enumerate(self._rb_pattern)]
 
     def calc_statistics(self):
         """Extract averages and std dev from the raw data (self._raw_data).
@@ -1140,3 +1274,50 @@ class PurityRBFitter(RBFitterBase):
 
         if show_plt:
             plt.show()
+
+
+def _parse_circ_name(circ_name):
+    """Return the type, length index and seed of an RB circuit name."""
+    circ_type, _, circ_name = circ_name.partition('_length_')
+    length, _, seed = circ_name.partition('_seed_')
+    return circ_type, int(length), int(seed)
+
+
+def _pattern_count_vectors(counts, pattern_sizes):
+    """Return the counts of the outcomes of the qubits of each pattern.
+
+    The qubits of the patterns are consecutive bits of the outcomes, and
+    the counts of a pattern of size m are a vector of length 2^m indexed by
+    the outcomes of its qubits as integers. The vectors are returned as a
+    list, since the patterns may have different sizes.
+    """
+    keys = [key.replace(' ', '') for key in counts]
+    # bit j of an outcome is the character j from the end of its key
+    bits = np.frombuffer(''.join(keys).encode(), dtype=np.uint8).reshape(
+        len(keys), -1)[:, ::-1] == ord('1')
+    vals = np.fromiter(counts.values(), dtype=float, count=len(keys))
+    vecs = []
+    startind = 0
+    for size in pattern_sizes:
+        index = bits[:, startind:startind + size].dot(1 << np.arange(size))
+        vecs.append(np.bincount(index, weights=vals, minlength=2 ** size))
+        startind += size
+    return vecs
+
+
+def _walsh_hadamard(vecs):
+    """Return the Walsh-Hadamard transform of the last axis of an array.
+
+    Entry i of the transform of a vector v is the sum over j of
+    (-1)^popcount(i & j) v[j], so that the transform of the counts of an
+    outcome vector is the vector of the Z-correlators times the shots.
+    """
+    size = vecs.shape[-1]
+    ret = np.array(vecs, dtype=float)
+    half = 1
+    while half < size:
+        ret = ret.reshape(vecs.shape[:-1] + (size // (2 * half), 2, half))
+        ret = np.stack([ret[..., 0, :] + ret[..., 1, :],
+                        ret[..., 0, :] - ret[..., 1, :]], axis=-2)
+        half *= 2
+    return ret.reshape(vecs.shape)
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+    Bit-packed Clifford Operator class
+"""
+
+import numpy as np
+from .Clifford import Clifford
+
+
+class PackedClifford:
+
+    """
+    Clifford class with the symplectic table packed into an integer.
+
+    The table is stored as a single integer whose bits are the table
+    entries in row-major order, with the first entry as the most significant
+    bit, which is the bit order of `Clifford.index`. A table column is then
+    a set of bits spaced by the row width, so that each gate is applied to
+    all the rows at once with a few integer shift, XOR and AND operations.
+    The phases are stored in the same spacing as the last table column.
+    """
+
+    __slots__ = ('_num_qubits', '_width', '_lanes', '_table', '_phases')
+
+    # Cache of the lanes and identity tables for each number of qubits
+    _identity = {}
+    # Cache of the phase bits of the phase integers for each row width
+    _phase_bits = {}
+
+    def __init__(self, num_qubits, table=None, phases=None):
+        """Initialize an n-qubit packed Clifford table.
+
+        Args:
+            num_qubits: number of qubits.
+            table: the symplectic table given as an integer in the bit
+                order of `Clifford.index` (default is the identity).
+            phases: the phases given as an integer in the bit order of
+                `Clifford.index` (default is all zero).
+        """
+        self._num_qubits = num_qubits
+        width = 2 * num_qubits
+        self._width = width
+        if num_qubits not in self._identity:
+            # Mask of the last column of each row
+            lanes = sum(1 << (width * row) for row in range(width))
+            identity = 0
+            for row in range(width):
+                # Destabilizer j is X_j and stabilizer j is Z_j
+                col = (row + num_qubits) % width
+                identity |= 1 << self._position(row, col)
+            self._identity[num_qubits] = (lanes, identity)
+        self._lanes, identity = self._identity[num_qubits]
+
+        self._table = identity if table is None else table
+        self._phases = 0
+        if phases:
+            for row in range(width):
+                if (phases >> (width - 1 - row)) & 1:
+                    self._phases |= 1 << self._position(row, width - 1)
+
+    def _position(self, row, col):
+        """Return the bit position of a table entry."""
+        return self._width * (self._width - 1 - row) + self._width - 1 - col
+
+    def __repr__(self):
+        return 'PackedClifford(num_qubits={}, index={})'.format(
+            self._num_qubits, self.index())
+
+    # ---------------------------------------------------------------------
+    # Data accessors
+    # ---------------------------------------------------------------------
+
+    @property
+    def num_qubits(self):
+        """Return the number of qubits for the Clifford."""
+        return self._num_qubits
+
+    @property
+    def table(self):
+        """Return the Clifford table as a boolean array."""
+        width = self._width
+        bits = [(self._table >> self._position(row, col)) & 1
+                for row in range(width) for col in range(width)]
+        return np.array(bits, dtype=bool).reshape(width, width)
+
+    @property
+    def phases(self):
+        """Return the Clifford phases as a boolean array."""
+        return np.array([(self._phases >> self._position(row, self._width - 1))
+                         & 1 for row in range(self._width)], dtype=bool)
+
+    def copy(self):
+        """Return a copy of the Clifford."""
+        # pylint: disable=protected-access
+        ret = PackedClifford(self._num_qubits, table=self._table)
+        ret._phases = self._phases
+        return ret
+
+    @classmethod
+    def from_clifford(cls, clifford):
+        """Return the packed Clifford of a `Clifford` object."""
+        width = 2 * clifford.num_qubits
+        index = clifford.index()
+        return cls(clifford.num_qubits, table=index >> width,
+                   phases=index & ((1 << width) - 1))
+
+    def to_clifford(self):
+        """Return the `Clifford` object of the packed Clifford."""
+        return Clifford(table=self.table, phases=self.phases.tolist())
+
+    # ---------------------------------------------------------------------
+    # Unique Clifford index
+    # ---------------------------------------------------------------------
+    def index(self):
+        """
+        Returns a unique index for the Clifford.
+
+        Returns:
+            A unique index (integer), equal to the index of the
+            corresponding `Clifford` object.
+        """
+        width = self._width
+        cache = self._phase_bits.setdefault(width, {})
+        bits = cache.get(self._phases)
+        if bits is None:
+            bits = 0
+            for row in range(width):
+                bits = (bits << 1) | (
+                    (self._phases >> self._position(row, width - 1)) & 1)
+            cache[self._phases] = bits
+        return (self._table << width) | bits
+
+    # ---------------------------------------------------------------------
+    # Canonical gate operations
+    # ---------------------------------------------------------------------
+
+    # A column is extracted aligned to the last column by shifting the table
+    # right by the column shift and masking the lanes, and is updated by
+    # XORing an aligned value shifted left by the column shift. The shifts
+    # are cast to int so that numpy integer qubit indices do not turn the
+    # table into a fixed width integer.
+    def x(self, qubit):
+        """Apply a Pauli "x" gate to a qubit"""
+        shift_z = int(self._width - 1 - qubit)
+        self._phases ^= (self._table >> shift_z) & self._lanes
+
+    def y(self, qubit):
+        """Apply an Pauli "y" gate to a qubit"""
+        shift_z = int(self._width - 1 - qubit)
+        shift_x = shift_z - self._num_qubits
+        self._phases ^= ((self._table >> shift_z) ^
+                         (self._table >> shift_x)) & self._lanes
+
+    def z(self, qubit):
+        """Apply an Pauli "z" gate to qubit"""
+        shift_x = int(self._num_qubits - 1 - qubit)
+        self._phases ^= (self._table >> shift_x) & self._lanes
+
+    def h(self, qubit):
+        """Apply an Hadamard "h" gate to qubit"""
+        shift_z = int(self._width - 1 - qubit)
+        shift_x = shift_z - self._num_qubits
+        col_z = (self._table >> shift_z) & self._lanes
+        col_x = (self._table >> shift_x) & self._lanes
+        self._phases ^= col_z & col_x
+        # Swap X and Z columns for qubit
+        diff = col_z ^ col_x
+        self._table ^= (diff << shift_z) | (diff << shift_x)
+
+    def s(self, qubit):
+        """Apply an phase "s" gate to qubit"""
+        shift_z = int(self._width - 1 - qubit)
+        shift_x = shift_z - self._num_qubits
+        col_z = (self._table >> shift_z) & self._lanes
+        col_x = (self._table >> shift_x) & self._lanes
+        self._phases ^= col_z & col_x
+        self._table ^= col_x << shift_z
+
+    def sdg(self, qubit):
+        """Apply an adjoint phase "sdg" gate to qubit"""
+        shift_z = int(self._width - 1 - qubit)
+        shift_x = shift_z - self._num_qubits
+        col_z = (self._table >> shift_z) & self._lanes
+        col_x = (self._table >> shift_x) & self._lanes
+        # z followed by s
+        self._phases ^= col_x & (self._lanes ^ col_z)
+        self._table ^= col_x << shift_z
+
+    def v(self, qubit):
+        """Apply v gate sd.h"""
+        # The phases of sdg and h cancel and the columns map as
+        # (Z, X) -> (X, Z ^ X)
+        shift_z = int(self._width - 1 - qubit)
+        shift_x = shift_z - self._num_qubits
+        col_z = (self._table >> shift_z) & self._lanes
+        col_x = (self._table >> shift_x) & self._lanes
+        self._table ^= ((col_z ^ col_x) << shift_z) | (col_z << shift_x)
+
+    def w(self, qubit):
+        """Apply w gate v.v"""
+        # The phases of h and s cancel and the columns map as
+        # (Z, X) -> (Z ^ X, Z)
+        shift_z = int(self._width - 1 - qubit)
+        shift_x = shift_z - self._num_qubits
+        col_z = (self._table >> shift_z) & self._lanes
+        col_x = (self._table >> shift_x) & self._lanes
+        self._table ^= (col_x << shift_z) | ((col_z ^ col_x) << shift_x)
+
+    def cx(self, qubit_ctrl, qubit_trgt):
+        """Apply a Controlled-NOT "cx" gate"""
+        shift_zc = int(self._width - 1 - qubit_ctrl)
+        shift_xc = shift_zc - self._num_qubits
+        shift_zt = int(self._width - 1 - qubit_trgt)
+        shift_xt = shift_zt - self._num_qubits
+        lanes = self._lanes
+        iz_c = (self._table >> shift_zc) & lanes
+        ix_c = (self._table >> shift_xc) & lanes
+        iz_t = (self._table >> shift_zt) & lanes
+        ix_t = (self._table >> shift_xt) & lanes
+        # Compute phase
+        self._phases ^= iz_t & ix_c & (lanes ^ ix_t ^ iz_c)
+        # Update stabilizers
+        self._table ^= (ix_c << shift_xt) | (iz_t << shift_zc)
+
+    def cz(self, qubit_ctrl, qubit_trgt):
+        """Apply a Controlled-z "cx" gate"""
+        self.h(qubit_trgt)
+        self.cx(qubit_ctrl, qubit_trgt)
+        self.h(qubit_trgt)
+
+    def swap(self, qubit0, qubit1):
+        """Apply SWAP gate between two qubits"""
+        self.cx(qubit0, qubit1)
+        self.cx(qubit1, qubit0)
+        self.cx(qubit0, qubit1)
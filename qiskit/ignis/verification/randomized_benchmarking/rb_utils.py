@@ -21,6 +21,8 @@ RB Helper functions
 
 
 import numpy as np
+from qiskit import QuantumCircuit
+from .circuits import _sequence_gate_counts
 
 
 def count_gates(qobj, basis, qubits):
@@ -29,7 +31,9 @@ def count_gates(qobj, basis, qubits):
     Take a compiled qobj and output the number of gates in each circuit
 
     Args:
-        qobj: compiled qobj
+        qobj: compiled qobj, or a circuit or list of circuits whose gates
+            are in the basis, such as the rb circuits generated with
+            basis_gates
         basis: gates basis for the qobj
         qubits: qubits to count over
 
@@ -43,32 +47,86 @@ def count_gates(qobj, basis, qubits):
         nQ gates are counted in each qubit's set of gates
     """
 
-    nexp = len(qobj.experiments)
-    ngates = np.zeros([nexp, len(qubits), len(basis)], dtype=int)
+    return _count_instructions(_experiment_instructions(qobj), basis, qubits)
 
-    basis_ind = {basis[i]: i for i in range(len(basis))}
 
-    for i in range(nexp):
-        for instr in qobj.experiments[i].instructions:
-            if instr.name in basis:
-                for qind, qubit in enumerate(qubits):
-                    if qubit in instr.qubits:
-                        ngates[i][qind][basis_ind[instr.name]] += 1
+def _count_instructions(experiments, basis, qubits):
+    """Count the gates of the basis on each qubit of each experiment.
 
+    The (experiment, basis gate, qubit) triple of each qubit of each basis
+    gate is collected into an array, and the triples are mapped to the
+    indices of the counted qubits with one lookup array and accumulated
+    with np.add.at.
+    """
+    ngates = np.zeros([len(experiments), len(qubits), len(basis)], dtype=int)
+
+    basis_ind = {name: ind for ind, name in enumerate(basis)}
+    triples = np.array(
+        [(exp_ind, basis_ind[name], qubit)
+         for exp_ind, instructions in enumerate(experiments)
+         for name, instr_qubits in instructions if name in basis_ind
+         for qubit in instr_qubits], dtype=int).reshape(-1, 3)
+    if not triples.size or len(qubits) == 0:
+        return ngates
+
+    # the index of each qubit in qubits, or -1 if it is not counted
+    qubit_ind = np.full(max(np.max(triples[:, 2]), max(qubits)) + 1, -1)
+    qubit_ind[qubits] = np.arange(len(qubits))
+    qinds = qubit_ind[triples[:, 2]]
+    counted = qinds >= 0
+    np.add.at(ngates, (triples[counted, 0], qinds[counted],
+                       triples[counted, 1]), 1)
     return ngates
 
 
-def gates_per_clifford(qobj_list, clifford_length, basis, qubits):
+def _experiment_instructions(qobj):
+    """Return the (name, qubits) pairs of the instructions of each
+    experiment of a qobj, of a circuit or of each circuit of a list of
+    circuits.
+
+    The qubits of a circuit are numbered in the order of circuit.qubits
+    across all its registers, as when the circuit is assembled.
+    """
+    if hasattr(qobj, 'experiments'):
+        return [[(instr.name, getattr(instr, 'qubits', []))
+                 for instr in experiment.instructions]
+                for experiment in qobj.experiments]
+    if isinstance(qobj, QuantumCircuit):
+        qobj = [qobj]
+    experiments = []
+    for circuit in qobj:
+        qubit_ind = {qubit: ind for ind, qubit in enumerate(circuit.qubits)}
+        experiments.append([(instr.name, [qubit_ind[qubit]
+                                          for qubit in qargs])
+                            for instr, qargs, _ in circuit.data])
+    return experiments
+
+
+def gates_per_clifford(qobj_list, clifford_length, basis, qubits,
+                       rb_opts=None):
 
     """
     Take a list of compiled qobjs (for each seed) and use these
     to calculate the number of gates per clifford
 
+    The rb circuits generated with basis_gates contain the basis gates of
+    each Clifford, so their lists of circuits can be passed instead of
+    the compiled qobjs to count the gates without compiling them.
+
+    If rb_opts is given, the gates are counted from the native
+    decomposition of each Clifford of the sequences instead, without
+    generating any circuit. The sequences are the ones generated by
+    `randomized_benchmarking_seq` with the same rand_seed.
+
     Args:
-        qobj_list: compiled qobjs for each seed
+        qobj_list: compiled qobjs (or lists of rb circuits) for each seed
+            (ignored if rb_opts is given)
         clifford_length: number of cliffords in each circuit
         basis: gates basis for the qobj
         qubits: qubits to count over
+        rb_opts: the arguments of `randomized_benchmarking_seq` of standard
+            rb sequences, which must include rand_seed, or None to count
+            the gates of qobj_list
 
     Returns:
         l x m list of number of gates per clifford
@@ -77,14 +135,24 @@ def gates_per_clifford(qobj_list, clifford_length, basis, qubits):
             m: length of basis
     """
 
-    ncliffs = 0
-    ngates = np.zeros([len(qubits), len(basis)], dtype=int)
-
-    for qobj_seed in qobj_list:
-        ngates_tmp = count_gates(qobj_seed, basis, qubits)
-        for cliff_idx, cliff in enumerate(clifford_length):
-            ncliffs += (cliff + 1)  # include inverse
-            ngates += np.array(ngates_tmp[cliff_idx])
+    if rb_opts is not None:
+        ngates = _sequence_gate_counts(basis, qubits, **rb_opts)
+        nseeds = rb_opts.get('nseeds', 1)
+    else:
+        # count the gates of the circuits of all the seeds in one pass
+        experiments = []
+        circ_inds = []
+        for qobj_seed in qobj_list:
+            circ_inds.extend(len(experiments) +
+                             np.arange(len(clifford_length)))
+            experiments.extend(_experiment_instructions(qobj_seed))
+        ngates = np.sum(
+            _count_instructions(experiments, basis, qubits)[circ_inds],
+            axis=0)
+        nseeds = len(qobj_list)
+
+    # include inverse
+    ncliffs = nseeds * np.sum(np.asarray(clifford_length) + 1)
 
     return ngates/ncliffs
 
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Table-free n-qubit Clifford operations for randomized benchmarking.
+
+The random Cliffords are sampled as a uniformly random symplectic matrix,
+following R. Koenig and J. A. Smolin, "How to efficiently select an
+arbitrary Clifford group element", J. Math. Phys. 55, 122202 (2014),
+together with uniformly random phases. Gate lists are synthesized from the
+Clifford tables by reducing them to the identity with H, S and CX gates as
+in S. Aaronson and D. Gottesman, "Improved simulation of stabilizer
+circuits", Phys. Rev. A 70, 052328 (2004).
+"""
+
+import numpy as np
+from .Clifford import Clifford
+from .clifford_utils import CliffordUtils
+
+
+def _inner(vecs, vec):
+    """Return the symplectic inner products of rows with a vector.
+
+    The vectors are in the interleaved order (x_0, z_0, x_1, z_1, ...).
+    """
+    prod = (vecs[..., 0::2] & vec[1::2]) ^ (vecs[..., 1::2] & vec[0::2])
+    return (np.sum(prod, axis=-1) % 2).astype(np.uint8)
+
+
+def _transvection(vecs, vec):
+    """Apply the symplectic transvection of a vector to rows."""
+    return vecs ^ np.multiply.outer(_inner(vecs, vec), vec)
+
+
+def _find_transvection(vec1, vec2):
+    """Return two vectors whose transvections map vec1 to vec2."""
+    ret = np.zeros((2, len(vec1)), dtype=np.uint8)
+    if np.array_equal(vec1, vec2):
+        return ret
+    if _inner(vec1, vec2) == 1:
+        ret[0] = vec1 ^ vec2
+        return ret
+    pairs1 = vec1[0::2] | vec1[1::2]
+    pairs2 = vec2[0::2] | vec2[1::2]
+    vec = np.zeros(len(vec1), dtype=np.uint8)
+    both = np.flatnonzero(pairs1 & pairs2)
+    if both.size:
+        # a qubit on which both vectors are not the identity
+        q = 2 * both[0]
+        vec[q:q + 2] = vec1[q:q + 2] ^ vec2[q:q + 2]
+        if not vec[q] | vec[q + 1]:
+            vec[q + 1] = 1
+            if vec1[q] != vec1[q + 1]:
+                vec[q] = 1
+    else:
+        # a qubit on which only vec1 is not the identity, and one on which
+        # only vec2 is not the identity
+        for pairs, src in ((pairs1 & ~pairs2, vec1), (pairs2 & ~pairs1, vec2)):
+            q = 2 * np.flatnonzero(pairs)[0]
+            if src[q] == src[q + 1]:
+                vec[q + 1] = 1
+            else:
+                vec[q] = src[q + 1]
+                vec[q + 1] = src[q]
+    ret[0] = vec1 ^ vec
+    ret[1] = vec2 ^ vec
+    return ret
+
+
+def random_symplectic(num_qubits, rng=None):
+    """
+    Sample a uniformly random symplectic matrix.
+
+    The matrix is built one qubit at a time. A random symplectic matrix on
+    the last qubits is extended by the identity on the first qubit and
+    mapped by four transvections sending X_0 to a uniformly random non-zero
+    vector and Z_0 to a uniformly random vector anticommuting with it, so
+    each element of the symplectic group is drawn with the same probability
+    in O(n^3) time.
+
+    Args:
+        num_qubits: the number of qubits.
+        rng: a np.random.RandomState to draw from (default is the global
+            numpy random number generator).
+
+    Returns:
+        A (2n, 2n) integer array whose rows 2j and 2j+1 are the images of
+        X_j and Z_j in the interleaved order (x_0, z_0, x_1, z_1, ...).
+    """
+    if rng is None:
+        rng = np.random
+    ret = np.eye(2, dtype=np.uint8)
+    for size in range(1, num_qubits + 1):
+        width = 2 * size
+        # image of X_0: a uniformly random non-zero vector
+        image_x = np.zeros(width, dtype=np.uint8)
+        while not image_x.any():
+            image_x = rng.randint(2, size=width).astype(np.uint8)
+        bits = rng.randint(2, size=width - 1).astype(np.uint8)
+        unit = np.zeros(width, dtype=np.uint8)
+        unit[0] = 1
+        trans = _find_transvection(unit, image_x)
+        # The transvections of trans map X_0 to image_x. The transvections
+        # of shift and of image_x fix image_x and map the image of Z_0 to
+        # one of the 2^(2 size - 1) vectors anticommuting with image_x.
+        shift = unit.copy()
+        shift[2:] = bits[1:]
+        shift = _transvection(_transvection(shift, trans[0]), trans[1])
+        if bits[0]:
+            image_x = np.zeros(width, dtype=np.uint8)
+        if size > 1:
+            sub = ret
+            ret = np.eye(width, dtype=np.uint8)
+            ret[2:, 2:] = sub
+        for vec in (trans[0], trans[1], shift, image_x):
+            ret = _transvection(ret, vec)
+    return ret
+
+
+class SymplecticCliffordUtils(CliffordUtils):
+    """
+    Class for util functions for the n-qubit Clifford group without tables.
+
+    Random Cliffords are sampled as uniformly random symplectic matrices and
+    phases, and the inverse of a Clifford is synthesized from its table, so
+    that no group table is needed for any number of qubits.
+    """
+
+    def load_tables(self, num_qubits):
+        """
+        Returns the needed Clifford tables.
+
+        Args:
+            num_qubits: number of qubits.
+
+        Returns:
+            None, since the n-qubit Clifford group does not use tables.
+        """
+        return None
+
+    # --------------------------------------------------------
+    # Random Cliffords
+    # --------------------------------------------------------
+    def random_clifford(self, num_qubits, rng=None):
+        """
+        Pick a uniformly random Clifford.
+
+        Args:
+            num_qubits: dimension of the Clifford.
+            rng: a np.random.RandomState to draw the Clifford from
+                (default is the global numpy random number generator).
+
+        Returns:
+            A random num_qubits Clifford class object.
+        """
+        if rng is None:
+            rng = np.random
+        symp = random_symplectic(num_qubits, rng).astype(bool)
+        # rows of the destabilizers then of the stabilizers, and columns
+        # of the Z then of the X components
+        table = np.block([[symp[0::2, 1::2], symp[0::2, 0::2]],
+                          [symp[1::2, 1::2], symp[1::2, 0::2]]])
+        phases = rng.randint(2, size=2 * num_qubits).astype(bool)
+        cliff = Clifford(table=table, phases=phases.tolist())
+        self._elmnt = cliff
+        return cliff
+
+    def random_gates(self, num_qubits, rng=None):
+        """
+        Pick a uniformly random Clifford gate.
+
+        Args:
+            num_qubits: dimension of the Clifford.
+            rng: a np.random.RandomState to draw the Clifford from
+                (default is the global numpy random number generator).
+
+        Returns:
+            A num_qubits Clifford gate list of h, s, cx, x and z gates.
+        """
+        # The inverse of a uniformly random Clifford is a uniformly random
+        # Clifford, so the gates reducing a random Clifford are used as is
+        gatelist = self.clifford_inverse_gates(
+            self.random_clifford(num_qubits, rng))
+        self._gatelist = gatelist
+        return gatelist
+
+    # --------------------------------------------------------
+    # Inverse Cliffords
+    # --------------------------------------------------------
+    def clifford_inverse_gates(self, cliff):
+        """
+        Synthesize the inverse of a Clifford.
+
+        The gates reduce the Clifford table to the identity one qubit at a
+        time, so the gate list has O(n^2) gates and takes O(n^3) time.
+
+        Args:
+            cliff: a Clifford class object. It is not modified.
+
+        Returns:
+            A gate list of h, s, cx, x and z gates of the inverse Clifford.
+        """
+        num_qubits = cliff.num_qubits
+        cliff = Clifford(table=cliff.table.copy(),
+                         phases=cliff.phases.tolist())
+        table = cliff.table
+        gatelist = []
+
+        def append(gate, *qubits):
+            getattr(cliff, gate)(*qubits)
+            gatelist.append(' '.join([gate] + [str(q) for q in qubits]))
+
+        for qubit in range(num_qubits):
+            # views of the destabilizer and stabilizer rows of the qubit
+            dest_z = table[qubit, :num_qubits]
+            dest_x = table[qubit, num_qubits:]
+            stab_z = table[num_qubits + qubit, :num_qubits]
+            stab_x = table[num_qubits + qubit, num_qubits:]
+
+            # set the X component of the destabilizer on the qubit
+            if not dest_x[qubit]:
+                others = np.flatnonzero(dest_x[qubit:])
+                if not others.size:
+                    others = np.flatnonzero(dest_z[qubit:])
+                    append('h', qubit + others[0])
+                if others[0]:
+                    append('cx', qubit + others[0], qubit)
+            # reduce the destabilizer to X on the qubit
+            for other in range(qubit + 1, num_qubits):
+                if dest_x[other]:
+                    append('cx', qubit, other)
+            if dest_z[qubit:].any():
+                if not dest_z[qubit]:
+                    append('s', qubit)
+                for other in range(qubit + 1, num_qubits):
+                    if dest_z[other]:
+                        append('cx', other, qubit)
+                append('s', qubit)
+
+            # reduce the stabilizer to Z on the qubit
+            for other in range(qubit + 1, num_qubits):
+                if stab_z[other]:
+                    append('cx', other, qubit)
+            if stab_x[qubit:].any():
+                append('h', qubit)
+                for other in range(qubit + 1, num_qubits):
+                    if stab_x[other]:
+                        append('cx', qubit, other)
+                if stab_z[qubit]:
+                    append('s', qubit)
+                append('h', qubit)
+
+        # fix the signs of the destabilizers and stabilizers
+        for qubit in range(num_qubits):
+            if cliff.phases[qubit]:
+                append('z', qubit)
+            if cliff.phases[num_qubits + qubit]:
+                append('x', qubit)
+        return gatelist
+
+    def find_inverse_gates(self, num_qubits, gatelist):
+        """
+        Find the inverse of a Clifford gate.
+
+        Args:
+            num_qubits: the dimension of the Clifford.
+            gatelist: a Clifford gate.
+
+        Returns:
+            An inverse Clifford gate.
+        """
+        return self.clifford_inverse_gates(
+            self.clifford_from_gates(num_qubits, gatelist))
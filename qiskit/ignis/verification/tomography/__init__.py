@@ -20,12 +20,21 @@ Quantum State and Process Tomography module
 # Tomography circuit generation
 from .basis import state_tomography_circuits
 from .basis import process_tomography_circuits
+from .basis import overlapping_tomography_circuits
+from .basis import direct_fidelity_circuits
+from .basis import simultaneous_tomography_circuits
+from .basis import state_tomography_template
+from .basis import bind_tomography_template
 from . import basis
 
 # Tomography data formatting
 from .fitters import StateTomographyFitter
 from .fitters import ProcessTomographyFitter
 from .fitters import TomographyFitter
+from .fitters import OverlappingTomographyFitter
+from .fitters import DirectFidelityFitter
+from .fitters import SimultaneousTomographyFitter
+from .fitters import LowRankTomographyFitter
 
 # Utility functions TODO: move to qiskit.quantum_info
 from .data import marginal_counts     # TODO: move to qiskit.tools
@@ -22,5 +22,13 @@ from .paulibasis import PauliBasis
 from .sicbasis import SICBasis
 from .circuits import state_tomography_circuits
 from .circuits import process_tomography_circuits
+from .circuits import overlapping_tomography_circuits
+from .circuits import overlapping_measurement_labels
+from .circuits import simultaneous_tomography_circuits
+from .circuits import random_tomography_labels
+from .circuits import state_tomography_template
+from .circuits import bind_tomography_template
+from .circuits import direct_fidelity_circuits
+from .circuits import direct_fidelity_paulis
 from .circuits import default_basis
 from .circuits import tomography_circuit_tuples
@@ -19,13 +19,17 @@ Quantum tomography circuit generation.
 
 import logging
 import itertools as it
+import numpy as np
 
 from qiskit import QuantumRegister
 from qiskit import ClassicalRegister
 from qiskit import QuantumCircuit
 from qiskit import QiskitError
+from qiskit.circuit import Parameter
 from qiskit.circuit.measure import Measure
 from qiskit.circuit.reset import Reset
+from qiskit.quantum_info.synthesis.two_qubit_decompose import \
+    euler_angles_1q
 
 from .tomographybasis import TomographyBasis
 from .paulibasis import PauliBasis
@@ -42,7 +46,8 @@ logger = logging.getLogger(__name__)
 ###########################################################################
 
 def state_tomography_circuits(circuit, measured_qubits,
-                              meas_labels='Pauli', meas_basis='Pauli',):
+                              meas_labels='Pauli', meas_basis='Pauli',
+                              lazy=False):
     """
     Return a list of quantum state tomography circuits.
 
@@ -59,6 +64,8 @@ def state_tomography_circuits(circuit, measured_qubits,
             labels. See additional information for details (Default: 'Pauli').
         meas_basis (str, TomographyBasis): The measurement basis.
             See additional information for details (Default: 'Pauli').
+        lazy (bool): If True return a generator yielding the circuits one
+            at a time instead of a list (Default: False).
 
     Returns:
         A list of QuantumCircuit objects containing the original circuit
@@ -73,9 +80,443 @@ def state_tomography_circuits(circuit, measured_qubits,
     """
     return _tomography_circuits(circuit, measured_qubits, None,
                                 meas_labels=meas_labels, meas_basis=meas_basis,
+                                prep_labels=None, prep_basis=None, lazy=lazy)
+
+
+###########################################################################
+# Overlapping tomography circuits for k-local reduced states
+###########################################################################
+
+def overlapping_tomography_circuits(circuit, measured_qubits, k=2,
+                                    meas_labels='Pauli', meas_basis='Pauli',
+                                    seed=None):
+    """
+    Return a list of overlapping quantum state tomography circuits.
+
+    The measurement settings are chosen so that every subset of `k` of the
+    measured qubits is measured in all 3 ** k local Pauli settings at least
+    once. All k-local reduced density matrices can then be reconstructed from
+    the marginals of a single shared set of circuits, whose size grows only
+    logarithmically with the number of measured qubits.
+
+    Args:
+        circuit (QuantumCircuit): the state preparation circuit to be
+            tomographed.
+        measured_qubits (QuantumRegister): the qubits to be measured.
+            This can also be a list of whole QuantumRegisters or
+            individual QuantumRegister qubit tuples.
+        k (int): the number of qubits of the reduced states (Default: 2).
+        meas_labels (str, tuple): The single-qubit measurement operator
+            labels (Default: 'Pauli').
+        meas_basis (str, TomographyBasis): The measurement basis
+            (Default: 'Pauli').
+        seed (int or None): seed for the random choice of measurement
+            settings (Default: None).
+
+    Returns:
+        A list of QuantumCircuit objects containing the original circuit
+        with state tomography measurements appended at the end.
+
+    Additional Information:
+        The returned circuits are named by the n-qubit measurement basis
+        and the count data should be processed with the
+        `OverlappingTomographyFitter`.
+    """
+    if isinstance(measured_qubits, list):
+        num_qubits = len(_format_registers(*measured_qubits))
+    else:
+        num_qubits = len(_format_registers(measured_qubits))
+    labels = overlapping_measurement_labels(num_qubits, k,
+                                            meas_labels=meas_labels,
+                                            seed=seed)
+    return _tomography_circuits(circuit, measured_qubits, None,
+                                meas_labels=labels, meas_basis=meas_basis,
                                 prep_labels=None, prep_basis=None)
 
 
+def overlapping_measurement_labels(num_qubits, k=2, meas_labels='Pauli',
+                                   seed=None):
+    """
+    Return n-qubit measurement labels covering all k-local settings.
+
+    Random measurement settings are drawn until every subset of `k` qubits
+    has been measured in every combination of the single-qubit labels.
+    Settings that are redundant for this coverage are then removed.
+
+    Args:
+        num_qubits (int): the number of measured qubits.
+        k (int): the number of qubits of the reduced states (Default: 2).
+        meas_labels (str, tuple): The single-qubit measurement operator
+            labels (Default: 'Pauli').
+        seed (int or None): seed for the random number generator
+            (Default: None).
+
+    Returns:
+        list(tuple): a list of n-qubit measurement label tuples.
+
+    Raises:
+        QiskitError: if k is not between 1 and the number of qubits.
+    """
+    if k < 1 or k > num_qubits:
+        raise QiskitError("k must be between 1 and the number of qubits.")
+    if isinstance(meas_labels, str):
+        meas_labels = _default_measurement_labels(meas_labels)
+    num_labels = len(meas_labels)
+    rng = np.random.RandomState(seed)
+
+    subsets = np.array(list(it.combinations(range(num_qubits), k)))
+    powers = num_labels ** np.arange(k)
+    num_local = num_labels ** k
+    offsets = num_local * np.arange(len(subsets))
+
+    # Number of settings covering each (subset, local setting) pair
+    coverage = np.zeros(len(subsets) * num_local, dtype=int)
+    settings = np.zeros((0, num_qubits), dtype=int)
+    while not coverage.all():
+        batch = rng.randint(num_labels, size=(num_local, num_qubits))
+        codes = batch[:, subsets].dot(powers) + offsets
+        coverage += np.bincount(codes.ravel(), minlength=coverage.size)
+        settings = np.vstack([settings, batch])
+
+    # Greedily drop settings whose local settings are all covered twice
+    keep = np.ones(len(settings), dtype=bool)
+    for j in reversed(range(len(settings))):
+        codes = settings[j, subsets].dot(powers) + offsets
+        if np.all(coverage[codes] > 1):
+            coverage[codes] -= 1
+            keep[j] = False
+
+    return [tuple(meas_labels[i] for i in row) for row in settings[keep]]
+
+
+def random_tomography_labels(num_qubits, num_settings, meas_labels='Pauli',
+                             seed=None):
+    """
+    Return distinct random n-qubit measurement labels.
+
+    These labels may be passed as the `meas_labels` of
+    `state_tomography_circuits` for partial tomography experiments, such as
+    those fitted by the `LowRankTomographyFitter`.
+
+    Args:
+        num_qubits (int): the number of measured qubits.
+        num_settings (int): the number of distinct measurement settings.
+        meas_labels (str, tuple): The single-qubit measurement operator
+            labels (Default: 'Pauli').
+        seed (int or None): seed for the random number generator
+            (Default: None).
+
+    Returns:
+        list(tuple): a list of `num_settings` measurement label tuples.
+
+    Raises:
+        QiskitError: if there are not enough distinct settings.
+    """
+    if isinstance(meas_labels, str):
+        meas_labels = _default_measurement_labels(meas_labels)
+    if num_settings > len(meas_labels) ** num_qubits:
+        raise QiskitError("Number of settings exceeds the number of "
+                          "distinct measurement labels.")
+    rng = np.random.RandomState(seed)
+    labels = {}
+    while len(labels) < num_settings:
+        rows = rng.randint(len(meas_labels),
+                           size=(num_settings - len(labels), num_qubits))
+        for row in rows:
+            labels.setdefault(tuple(meas_labels[i] for i in row))
+    return list(labels)
+
+
+###########################################################################
+# Simultaneous tomography circuits for disjoint qubit subsets
+###########################################################################
+
+def simultaneous_tomography_circuits(circuit, qubit_subsets,
+                                     meas_labels='Pauli', meas_basis='Pauli'):
+    """
+    Return state tomography circuits measuring disjoint subsets in parallel.
+
+    All subsets are measured in the same circuits with synchronized
+    measurement settings: for each n-qubit measurement label of the largest
+    subset, every subset is measured with the first labels of that setting.
+    The number of circuits is therefore that of the largest subset alone.
+
+    Args:
+        circuit (QuantumCircuit): the state preparation circuit to be
+            tomographed.
+        qubit_subsets (list): a list of disjoint qubit subsets. Each subset
+            can be a QuantumRegister, or a list of whole QuantumRegisters or
+            individual QuantumRegister qubit tuples.
+        meas_labels (str, tuple, list(tuple)): The measurement operator
+            labels of the largest subset (Default: 'Pauli').
+        meas_basis (str, TomographyBasis): The measurement basis
+            (Default: 'Pauli').
+
+    Returns:
+        A list of QuantumCircuit objects containing the original circuit
+        with state tomography measurements appended at the end.
+
+    Raises:
+        QiskitError: if the qubit subsets are not disjoint.
+
+    Additional Information:
+        The measurements of each subset are stored in consecutive clbits
+        in the order of `qubit_subsets`. The returned circuits are named by
+        the measurement label of the largest subset and the count data
+        should be processed with the `SimultaneousTomographyFitter`.
+    """
+    subsets = [_format_registers(*subset) if isinstance(subset, list)
+               else _format_registers(subset) for subset in qubit_subsets]
+    measured_qubits = [qubit for subset in subsets for qubit in subset]
+    if len(measured_qubits) != len(set(measured_qubits)):
+        raise QiskitError("Qubit subsets must be disjoint.")
+    if isinstance(meas_labels, str):
+        meas_labels = _default_measurement_labels(meas_labels)
+    labels = _generate_labels(meas_labels,
+                              max(len(subset) for subset in subsets))
+    all_labels = [tuple(op for subset in subsets for op in ml[:len(subset)])
+                  for ml in labels]
+    circuits = _tomography_circuits(circuit, measured_qubits, None,
+                                    meas_labels=all_labels,
+                                    meas_basis=meas_basis,
+                                    prep_labels=None, prep_basis=None)
+    for circ, ml in zip(circuits, labels):
+        circ.name = str(ml)
+    return circuits
+
+
+###########################################################################
+# Direct fidelity estimation circuits
+###########################################################################
+
+def direct_fidelity_circuits(circuit, measured_qubits, target, num_paulis,
+                             seed=None):
+    """
+    Return the measurement circuits for direct fidelity estimation.
+
+    Pauli operators are importance sampled from the Pauli expansion of
+    the target state, and only the measurement settings of the sampled
+    operators are returned. Identity factors are measured in the Z-basis.
+
+    Args:
+        circuit (QuantumCircuit): the state preparation circuit.
+        measured_qubits (QuantumRegister): the qubits to be measured.
+            This can also be a list of whole QuantumRegisters or
+            individual QuantumRegister qubit tuples.
+        target (array_like): the target statevector or density matrix.
+        num_paulis (int): the number of Pauli operators to sample.
+        seed (int or None): seed for the sampling of Pauli operators
+            (Default: None).
+
+    Returns:
+        tuple: (circuits, paulis) where `circuits` is a list of
+        QuantumCircuit objects for the distinct measurement settings, named
+        as state tomography circuits, and `paulis` is the list of sampled
+        Pauli operator labels to be passed to the `DirectFidelityFitter`.
+    """
+    paulis = direct_fidelity_paulis(target, num_paulis, seed=seed)
+    labels = list(dict.fromkeys(_pauli_setting(p) for p in paulis))
+    circuits = _tomography_circuits(circuit, measured_qubits, None,
+                                    meas_labels=labels, meas_basis='Pauli',
+                                    prep_labels=None, prep_basis=None)
+    return circuits, paulis
+
+
+def direct_fidelity_paulis(target, num_paulis, seed=None):
+    """
+    Return Pauli operators importance sampled from a target state.
+
+    Each Pauli operator P is sampled with probability proportional to
+    tr(target P) ** 2.
+
+    Args:
+        target (array_like): the target statevector or density matrix.
+        num_paulis (int): the number of Pauli operators to sample.
+        seed (int or None): seed for the random number generator
+            (Default: None).
+
+    Returns:
+        list(str): the sampled Pauli operator labels, where the rightmost
+        character acts on the first measured qubit.
+    """
+    rho = _target_density_matrix(target)
+    dim = len(rho)
+    num_qubits = dim.bit_length() - 1
+    probs = _pauli_expectations(rho).ravel() ** 2
+    rng = np.random.RandomState(seed)
+    samples = rng.choice(dim ** 2, size=num_paulis, p=probs / np.sum(probs))
+    return [_pauli_label(idx // dim, idx % dim, num_qubits)
+            for idx in samples]
+
+
+def _target_density_matrix(target):
+    """Return a target state as a density matrix."""
+    target = np.asarray(getattr(target, 'data', target))
+    if target.ndim == 1:
+        target = np.outer(target, target.conj())
+    dim = len(target)
+    if target.shape != (dim, dim) or dim & (dim - 1) or dim < 2:
+        raise QiskitError("Target must be an n-qubit statevector or "
+                          "density matrix.")
+    return target
+
+
+def _pauli_expectations(rho):
+    """
+    Return the expectation values of all Pauli operators for a state.
+
+    The returned array `ret` is indexed as `ret[x, z]` where the bits of
+    `x` and `z` are the X and Z components of the Pauli operator on each
+    qubit. All values are computed by a Walsh-Hadamard transform over z
+    of the off-diagonals `rho[b, b ^ x]`.
+    """
+    dim = len(rho)
+    b = np.arange(dim)
+    vec = rho[b[None, :], b[None, :] ^ b[:, None]]
+    half = 1
+    while half < dim:
+        vec = vec.reshape(dim, -1, 2, half)
+        vec = np.concatenate([vec[:, :, :1] + vec[:, :, 1:],
+                              vec[:, :, :1] - vec[:, :, 1:]], axis=2)
+        half *= 2
+    vec = vec.reshape(dim, dim)
+    weights = np.array([bin(j).count('1') for j in range(dim)])
+    phases = 1j ** weights[b[:, None] & b[None, :]]
+    return np.real(phases * vec)
+
+
+def _pauli_expectation(rho, label):
+    """Return the expectation value of a Pauli label for a state."""
+    x = sum(2 ** q for q, p in enumerate(reversed(label)) if p in 'XY')
+    z = sum(2 ** q for q, p in enumerate(reversed(label)) if p in 'YZ')
+    b = np.arange(len(rho))
+    signs = 1 - 2 * (np.array([bin(j).count('1') for j in b & z]) % 2)
+    val = np.sum(rho[b, b ^ x] * signs)
+    return np.real(1j ** bin(x & z).count('1') * val)
+
+
+def _pauli_label(x, z, num_qubits):
+    """Return the label of the Pauli operator with X and Z bits x and z."""
+    paulis = ('I', 'Z', 'X', 'Y')
+    return ''.join(paulis[2 * ((x >> q) & 1) + ((z >> q) & 1)]
+                   for q in reversed(range(num_qubits)))
+
+
+def _pauli_setting(label):
+    """Return the measurement setting of a Pauli label."""
+    return tuple('Z' if p == 'I' else p for p in reversed(label))
+
+
+###########################################################################
+# Parameterized state tomography template
+###########################################################################
+
+def state_tomography_template(circuit, measured_qubits, meas_labels='Pauli',
+                              meas_basis='Pauli'):
+    """
+    Return a parameterized state tomography circuit and label bindings.
+
+    The template appends a parameterized `u3` basis change and a measurement
+    to each measured qubit, so it can be transpiled once and then bound to
+    every measurement label with `bind_tomography_template`.
+
+    Args:
+        circuit (QuantumCircuit): the state preparation circuit to be
+            tomographed.
+        measured_qubits (QuantumRegister): the qubits to be measured.
+            This can also be a list of whole QuantumRegisters or
+            individual QuantumRegister qubit tuples.
+        meas_labels (str, tuple, list(tuple)): The measurement operator
+            labels. See `state_tomography_circuits` (Default: 'Pauli').
+        meas_basis (str, TomographyBasis): The measurement basis. Its
+            single-qubit measurement operators must be rank-1 projectors
+            (Default: 'Pauli').
+
+    Returns:
+        tuple: (template, bindings) where `template` is the parameterized
+        QuantumCircuit and `bindings` is a dict mapping each measurement
+        label tuple to the parameter binding dict for that label.
+
+    Raises:
+        QiskitError: if the measurement basis is not a rank-1 projective
+            basis.
+    """
+    if isinstance(measured_qubits, list):
+        meas_qubits = _format_registers(*measured_qubits)
+    else:
+        meas_qubits = _format_registers(measured_qubits)
+    num_qubits = len(meas_qubits)
+    qubit_registers = set(q.register for q in meas_qubits)
+
+    basis = default_basis(meas_basis)
+    if not isinstance(basis, TomographyBasis) or basis.measurement is not True:
+        raise QiskitError("Invalid measurement basis")
+    if isinstance(meas_labels, str):
+        meas_labels = _default_measurement_labels(meas_labels)
+    meas_labels = _generate_labels(meas_labels, num_qubits)
+
+    clbits = ClassicalRegister(num_qubits)
+    template = QuantumCircuit(*qubit_registers, clbits)
+    template += circuit
+    template.barrier(*qubit_registers)
+    params = []
+    for j, qubit in enumerate(meas_qubits):
+        angles = tuple(Parameter('tomo_{}_{}'.format(name, j))
+                       for name in ('theta', 'phi', 'lam'))
+        params.append(angles)
+        template.u3(*angles, qubit)
+        template.measure(qubit, clbits[j])
+
+    # Basis change angles of each single-qubit label
+    angles = {}
+    for label in set(op for ml in meas_labels for op in ml):
+        angles[label] = _measurement_euler_angles(
+            basis.measurement_matrix, label)
+
+    bindings = {}
+    for ml in meas_labels:
+        bindings[tuple(ml)] = {param: val for j, op in enumerate(ml)
+                               for param, val in zip(params[j], angles[op])}
+    return template, bindings
+
+
+def bind_tomography_template(template, bindings):
+    """
+    Return the tomography circuits of a bound tomography template.
+
+    Args:
+        template (QuantumCircuit): a tomography template, or a transpiled
+            version of it.
+        bindings (dict): the label bindings returned by
+            `state_tomography_template`.
+
+    Returns:
+        A list of QuantumCircuit objects named by their measurement label,
+        as the circuits returned by `state_tomography_circuits`.
+    """
+    circuits = []
+    for label, binding in bindings.items():
+        circ = template.bind_parameters(binding)
+        circ.name = str(label)
+        circuits.append(circ)
+    return circuits
+
+
+def _measurement_euler_angles(meas_matrix_fn, label):
+    """Return u3 angles rotating a measurement basis to the Z-basis."""
+    rows = []
+    for outcome in range(2):
+        vals, vecs = np.linalg.eigh(np.array(meas_matrix_fn(label, outcome),
+                                             dtype=complex))
+        if np.sum(np.abs(vals) > 1e-10) != 1:
+            raise QiskitError("Measurement operators must be rank-1.")
+        rows.append(vecs[:, -1].conj())
+    unitary = np.array(rows)
+    if not np.allclose(unitary.dot(unitary.T.conj()), np.eye(2)):
+        raise QiskitError("Measurement operators must be projective.")
+    return euler_angles_1q(unitary)
+
+
 ###########################################################################
 # Process tomography circuits for preparation and measurement in Pauli basis
 ###########################################################################
@@ -83,7 +524,8 @@ def state_tomography_circuits(circuit, measured_qubits,
 def process_tomography_circuits(circuit, measured_qubits,
                                 prepared_qubits=None,
                                 meas_labels='Pauli', meas_basis='Pauli',
-                                prep_labels='Pauli', prep_basis='Pauli'):
+                                prep_labels='Pauli', prep_basis='Pauli',
+                                lazy=False):
     """Return a list of quantum process tomography circuits.
 
     This performs preparation in the minimial Pauli-basis eigenstates
@@ -109,6 +551,8 @@ def process_tomography_circuits(circuit, measured_qubits,
             labels. See additional information for details (Default: 'Pauli').
         prep_basis (str, TomographyBasis): The preparation basis.
             See additional information for details (Default: 'Pauli').
+        lazy (bool): If True return a generator yielding the circuits one
+            at a time instead of a list (Default: False).
 
     Returns:
         A list of QuantumCircuit objects containing the original circuit
@@ -126,7 +570,8 @@ def process_tomography_circuits(circuit, measured_qubits,
     """
     return _tomography_circuits(circuit, measured_qubits, prepared_qubits,
                                 meas_labels=meas_labels, meas_basis=meas_basis,
-                                prep_labels=prep_labels, prep_basis=prep_basis)
+                                prep_labels=prep_labels, prep_basis=prep_basis,
+                                lazy=lazy)
 
 
 ###########################################################################
@@ -135,7 +580,7 @@ def process_tomography_circuits(circuit, measured_qubits,
 
 def _tomography_circuits(circuit, measured_qubits, prepared_qubits=None,
                          meas_labels='Pauli', meas_basis='Pauli',
-                         prep_labels=None, prep_basis=None):
+                         prep_labels=None, prep_basis=None, lazy=False):
     """
     Return a list of quantum tomography circuits.
 
@@ -163,6 +608,8 @@ def _tomography_circuits(circuit, measured_qubits, prepared_qubits=None,
             function. See additional information for details (Default: None).
         prep_circuit_fn (None, str, function): The preparation circuit
             function. See additional information for details (Default: None).
+        lazy (bool): If True return a generator yielding the circuits one
+            at a time instead of a list (Default: False).
 
     Returns:
         A list of QuantumCircuit objects containing the original circuit
@@ -325,37 +772,93 @@ def _tomography_circuits(circuit, measured_qubits, prepared_qubits=None,
     # measurments which will be inserted as the first classical register in
     # the list of returned circuits.
     registers = qubit_registers.copy()
+    clbits = None
     if measurement is not None:
         clbits = ClassicalRegister(num_qubits)
         registers.add(clbits)
 
     # Generate the circuits
-    qst_circs = []
+    qst_circs = _tomography_circuit_generator(
+        circuit, registers, qubit_registers, clbits, meas_qubits,
+        prep_qubits, meas_labels, measurement, prep_labels, preparation)
+    if lazy:
+        return qst_circs
+    return list(qst_circs)
+
+
+def _tomography_circuit_generator(circuit, registers, qubit_registers,
+                                  clbits, meas_qubits, prep_qubits,
+                                  meas_labels, measurement, prep_labels,
+                                  preparation):
+    """Yield tomography circuits for validated labels and basis functions.
+
+    The single-qubit preparation and measurement circuits are generated
+    once for each label and qubit and their instructions are shared by all
+    returned circuits. Each returned circuit copies the instruction list of
+    the preparation and target circuit prefix instead of re-appending every
+    instruction, so the cost per circuit is a list copy of the prefix.
+    """
+    # pylint: disable=protected-access
+    num_qubits = len(meas_qubits)
+
+    # Cache single-qubit snippets and barriers
+    meas_cache = {}
+    prep_cache = {}
+    barrier = QuantumCircuit(*registers)
+    barrier.barrier(*qubit_registers)
+    barrier = barrier.data[0]
+
+    # The target circuit with the tomography registers
+    body = QuantumCircuit(*registers)
+    body += circuit
+
     for pl in prep_labels:
-        prep = QuantumCircuit(*registers)
+        prep = QuantumCircuit(*body.qregs, *body.cregs)
         # Generate preparation circuit
         if pl is not None:
             for j in range(num_qubits):
-                prep += preparation(pl[j], prep_qubits[j])
-            prep.barrier(*qubit_registers)
+                key = (pl[j], j)
+                if key not in prep_cache:
+                    prep_cache[key] = preparation(pl[j], prep_qubits[j]).data
+                for inst in prep_cache[key]:
+                    prep._append(*inst)
+            prep._append(*barrier)
         # Add circuit being tomographed
-        prep += circuit
+        _extend_instructions(prep, body)
         # Generate Measurement circuit
         for ml in meas_labels:
-            meas = QuantumCircuit(*registers)
+            circ = QuantumCircuit(*prep.qregs, *prep.cregs)
+            _extend_instructions(circ, prep)
             if ml is not None:
-                meas.barrier(*qubit_registers)
+                circ._append(*barrier)
                 for j in range(num_qubits):
-                    meas += measurement(ml[j], meas_qubits[j], clbits[j])
-            circ = prep + meas
+                    key = (ml[j], j)
+                    if key not in meas_cache:
+                        meas_cache[key] = measurement(
+                            ml[j], meas_qubits[j], clbits[j]).data
+                    for inst in meas_cache[key]:
+                        circ._append(*inst)
             if pl is None:
                 # state tomography circuit
                 circ.name = str(ml)
             else:
                 # process tomography circuit
                 circ.name = str((pl, ml))
-            qst_circs.append(circ)
-    return qst_circs
+            yield circ
+
+
+def _extend_instructions(circ, other):
+    """Append the instructions of a circuit on the same registers in place.
+
+    Unless `other` has parameters, the instruction list is copied directly
+    rather than re-validating the instructions one at a time as
+    `QuantumCircuit.extend` does.
+    """
+    if other.parameters:
+        circ.extend(other)
+        return
+    # pylint: disable=protected-access
+    circ._data.extend(other._data)
 
 
 ###########################################################################
@@ -21,3 +21,7 @@ Quantum tomography fitter functions
 from .state_fitter import StateTomographyFitter
 from .process_fitter import ProcessTomographyFitter
 from .base_fitter import TomographyFitter
+from .overlapping_fitter import OverlappingTomographyFitter
+from .fidelity_fitter import DirectFidelityFitter
+from .simultaneous_fitter import SimultaneousTomographyFitter
+from .lowrank_fitter import LowRankTomographyFitter
@@ -40,7 +40,8 @@ class TomographyFitter:
                  result,
                  circuits,
                  meas_basis='Pauli',
-                 prep_basis='Pauli'):
+                 prep_basis='Pauli',
+                 meas_calibration=None):
         """Initialize tomography fitter with experimental data.
 
         Args:
@@ -54,6 +55,9 @@ class TomographyFitter:
             prep_basis (TomographyBasis, str): A function to return
                 preparation operators. See Additional
                 Information (default: 'Pauli')
+            meas_calibration (optional): a measurement error calibration
+                fitter or filter. See `set_measure_calibration`
+                (default: None)
         """
 
         # Set the measure and prep basis
@@ -61,6 +65,8 @@ class TomographyFitter:
         self._prep_basis = None
         self.set_measure_basis(meas_basis)
         self.set_preparation_basis(prep_basis)
+        self._meas_cal_matrix = None
+        self.set_measure_calibration(meas_calibration)
 
         # Add initial data
         self._data = {}
@@ -88,6 +94,61 @@ class TomographyFitter:
             if self._prep_basis.preparation is not True:
                 raise QiskitError("Invalid preparation basis")
 
+    def set_measure_calibration(self, calibration):
+        """Set the measurement error calibration.
+
+        The calibration matrix is folded into the measurement operators so
+        that the noisy measurement POVM is fitted directly, instead of
+        mitigating the counts of every circuit before fitting.
+
+        Args:
+            calibration (CompleteMeasFitter or TensoredMeasFitter or
+                MeasurementFilter or TensoredFilter or None): the measurement
+                calibration of the measured qubits in the order of the
+                tomography clbits. If None no calibration is applied.
+
+        Raises:
+            QiskitError: if the calibration is invalid.
+
+        Additional Information:
+            For a tensored calibration the first calibration matrix acts on
+            the lowest clbits, as for `TensoredFilter.apply`. The calibration
+            is used by `fit` and is not applied to the batched marginal fits
+            of k-local tomography fitters.
+        """
+        if calibration is None:
+            self._meas_cal_matrix = None
+            return
+        # Measurement fitters are reduced to their filter
+        calibration = getattr(calibration, 'filter', calibration)
+        if hasattr(calibration, 'cal_matrices'):
+            cal_matrices = calibration.cal_matrices
+            labels_list = calibration.substate_labels_list
+        elif hasattr(calibration, 'cal_matrix'):
+            cal_matrices = [calibration.cal_matrix]
+            labels_list = [calibration.state_labels]
+        else:
+            raise QiskitError("Invalid measurement calibration")
+
+        # Reorder calibration matrices to count_keys ordering and tensor
+        # them together with the first matrix on the lowest clbits
+        cal_matrix = np.ones((1, 1))
+        for mat, labels in zip(cal_matrices, labels_list):
+            num_qubits = int(np.log2(len(labels)))
+            keys = count_keys(num_qubits)
+            if sorted(labels) != keys:
+                raise QiskitError("Measurement calibration must contain "
+                                  "all basis states of its qubits")
+            order = [labels.index(key) for key in keys]
+            cal_matrix = np.kron(np.asarray(mat)[np.ix_(order, order)],
+                                 cal_matrix)
+        self._meas_cal_matrix = cal_matrix
+
+    @property
+    def measure_calibration_matrix(self):
+        """Return the measurement calibration matrix in count key order."""
+        return self._meas_cal_matrix
+
     @property
     def measure_basis(self):
         """Return the tomography measurement basis."""
@@ -210,22 +271,24 @@ class TomographyFitter:
             result (Result): a Qiskit Result object obtained from executing
                 tomography circuits.
             circuits (list): a list of circuits or circuit names to extract
-                count information from the result object.
+                count information from the result object. This may also be a
+                list of tomography label tuples, such as the keys of the
+                bindings of `state_tomography_template`, when the executed
+                circuits are named by their label.
         """
-        if len(circuits[0].cregs) == 1:
-            marginalize = False
-        else:
-            marginalize = True
+        marginalize = bool(isinstance(circuits[0], QuantumCircuit) and
+                           len(circuits[0].cregs) != 1)
 
         # Process measurement counts into probabilities
         for circ in circuits:
-            counts = result.get_counts(circ)
             if isinstance(circ, str):
                 tup = literal_eval(circ)
             elif isinstance(circ, QuantumCircuit):
                 tup = literal_eval(circ.name)
             else:
                 tup = circ
+                circ = str(circ)
+            counts = result.get_counts(circ)
             if marginalize:
                 counts = marginal_counts(counts, range(len(tup[0])))
             if tup in self._data:
@@ -284,6 +347,10 @@ class TomographyFitter:
             ctkeys = count_keys(len(label[1]))
         else:
             ctkeys = count_keys(len(label))
+        if self._meas_cal_matrix is not None and \
+                len(self._meas_cal_matrix) != len(ctkeys):
+            raise QiskitError("Measurement calibration does not match the "
+                              "number of measured qubits")
         for label, cts in self._data.items():
 
             # Convert counts dict to numpy array
@@ -311,10 +378,107 @@ class TomographyFitter:
             meas_ops = self._measurement_ops(meas_label, measurement)
             block = self._basis_operator_matrix(
                 [np.kron(prep_op.T, mop) for mop in meas_ops])
+            if self._meas_cal_matrix is not None:
+                # Noisy POVM elements are mixtures of the ideal elements
+                block = self._meas_cal_matrix.dot(block)
             basis_blocks.append(block)
 
         return data, np.vstack(basis_blocks), weights
 
+    def _count_arrays(self):
+        """Return state tomography data as flat integer arrays.
+
+        Returns:
+            tuple: (settings, index, outcomes, values) where `settings` is
+            the array of single-qubit measurement label indices of each
+            measurement setting, and `index`, `outcomes` and `values` are
+            the setting index, integer outcome and number of counts of each
+            count dictionary entry.
+        """
+        label_index = {lbl: j for j, lbl in
+                       enumerate(self._meas_basis.measurement_labels)}
+        settings = []
+        index = []
+        outcomes = []
+        values = []
+        for j, (label, cts) in enumerate(self._data.items()):
+            settings.append([label_index[lbl] for lbl in label])
+            for key, val in cts.items():
+                index.append(j)
+                outcomes.append(int(key.replace(' ', ''), 2))
+                values.append(val)
+        return (np.array(settings, dtype=int), np.array(index, dtype=int),
+                np.array(outcomes, dtype=int), np.array(values))
+
+    def _local_labels(self, num_qubits):
+        """Return the local measurement labels of marginal count arrays.
+
+        The j-th label of the returned list has the single-qubit label
+        indices given by the base-L digits of j, least significant first,
+        where L is the number of single-qubit measurement labels.
+        """
+        return [tuple(reversed(lbl)) for lbl in it.product(
+            self._meas_basis.measurement_labels, repeat=num_qubits)]
+
+    def _fit_marginals(self, labels, counts, method='auto',
+                       standard_weights=True, beta=0.5, **kwargs):
+        """Fit a batch of reduced states from marginal count arrays.
+
+        The basis matrix of the local measurement labels is computed once
+        and shared by all fits.
+
+        Args:
+            labels (list(tuple)): the local measurement labels.
+            counts (np.array): array of shape
+                (num_states, len(labels), num_outcomes) of marginal counts.
+            method (str): The fitter method 'auto', 'cvx' or 'lstsq'.
+            standard_weights (bool, optional): Apply weights to
+                tomography data based on count probability
+                (default: True)
+            beta (float): hedging parameter for converting counts
+                to probabilities (default: 0.5)
+            **kwargs (optional): kwargs for fitter method.
+
+        Returns:
+            list(np.array): the fitted density matrix of each state.
+
+        Raises:
+            QiskitError: In case the fitting method is unrecognized.
+        """
+        # Choose automatic method
+        if method == 'auto':
+            if cvxpy is None:
+                method = 'lstsq'
+            else:
+                method = 'cvx'
+        if method == 'lstsq':
+            fitter = lstsq_fit
+        elif method == 'cvx':
+            fitter = cvx_fit
+        else:
+            raise QiskitError('Unrecognised fit method {}'.format(method))
+
+        measurement = self._meas_basis.measurement_matrix
+        blocks = np.array([
+            self._basis_operator_matrix(
+                self._measurement_ops(label, measurement))
+            for label in labels])
+
+        ret = []
+        for cts in counts:
+            shots = np.sum(cts, axis=1)
+            rows = shots > 0
+            data = (cts[rows] / shots[rows, None]).ravel()
+            basis_matrix = np.vstack(blocks[rows])
+            if standard_weights is True:
+                weights = np.concatenate(
+                    [self._binomial_weights(c, beta) for c in cts[rows]])
+            else:
+                weights = None
+            ret.append(fitter(data, basis_matrix, weights=weights,
+                              trace=1, PSD=True, **kwargs))
+        return ret
+
     def _binomial_weights(self, counts, beta=0.5):
         """
         Compute binomial weights for list or dictionary of counts.
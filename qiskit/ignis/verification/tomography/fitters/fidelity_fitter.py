@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""
+Direct fidelity estimation fitter
+"""
+
+import numpy as np
+
+from qiskit import QiskitError
+from .base_fitter import TomographyFitter
+from ..basis.circuits import _target_density_matrix, _pauli_expectation
+from ..basis.circuits import _pauli_setting
+
+
+class DirectFidelityFitter(TomographyFitter):
+    """Direct fidelity estimation from importance sampled Pauli data."""
+
+    def __init__(self,
+                 result,
+                 circuits,
+                 target,
+                 paulis):
+        """Initialize direct fidelity fitter with experimental data.
+
+        Args:
+            result (Result): a Qiskit Result object obtained from executing
+                direct fidelity estimation circuits.
+            circuits (list): a list of circuits or circuit names to extract
+                count information from the result object.
+            target (array_like): the target statevector or density matrix.
+            paulis (list(str)): the sampled Pauli operator labels returned
+                by `direct_fidelity_circuits`.
+        """
+        self._target = _target_density_matrix(target)
+        self._paulis = list(paulis)
+        super().__init__(result, circuits, 'Pauli', None)
+
+    @property
+    def paulis(self):
+        """Return the sampled Pauli operator labels."""
+        return self._paulis
+
+    def pauli_expectation(self, label):
+        """Return the measured expectation value of a Pauli operator.
+
+        Args:
+            label (str): the Pauli operator label.
+
+        Returns:
+            float: the expectation value estimated from the counts of the
+            corresponding measurement setting.
+
+        Raises:
+            QiskitError: if the measurement setting has no data.
+        """
+        setting = _pauli_setting(label)
+        if setting not in self._data:
+            raise QiskitError(
+                "No data for measurement setting {}".format(setting))
+        mask = sum(2 ** q for q, p in enumerate(reversed(label)) if p != 'I')
+        counts = self._data[setting]
+        shots = 0
+        val = 0
+        for key, cts in counts.items():
+            outcome = int(key.replace(' ', ''), 2)
+            val += (-1) ** bin(outcome & mask).count('1') * cts
+            shots += cts
+        return val / shots
+
+    def fit(self):
+        """Estimate the fidelity of the measured state with the target.
+
+        The fidelity tr(rho target) is estimated as the mean of the ratios
+        tr(rho P) / tr(target P) over the sampled Pauli operators P, scaled
+        by the purity of the target. Only the sampled expectation values are
+        computed, so the cost does not grow with the size of the full Pauli
+        basis.
+
+        Returns:
+            float: the estimated fidelity.
+        """
+        ratios = [self.pauli_expectation(label) /
+                  _pauli_expectation(self._target, label)
+                  for label in self._paulis]
+        purity = np.sum(np.abs(self._target) ** 2)
+        return np.mean(ratios) * purity
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""
+Low-rank state tomography fitter
+"""
+
+import numpy as np
+from scipy.optimize import minimize
+
+from qiskit import QiskitError
+from .base_fitter import TomographyFitter
+from ..data import count_keys
+
+
+class LowRankTomographyFitter(TomographyFitter):
+    """Factored low-rank state tomography fitter."""
+
+    def __init__(self,
+                 result,
+                 circuits,
+                 meas_basis='Pauli'):
+        """Initialize low-rank state tomography fitter with experimental data.
+
+        Args:
+            result (Result): a Qiskit Result object obtained from executing
+                tomography circuits.
+            circuits (list): a list of circuits or circuit names to extract
+                count information from the result object. This may be any
+                subset of the state tomography circuits, for example those
+                generated from `random_tomography_labels`.
+            meas_basis (TomographyBasis, str): A function to return measurement
+                operators corresponding to measurement outcomes. The
+                single-qubit measurement operators must be rank-1. See
+                Additional Information (default: 'Pauli')
+        """
+        super().__init__(result, circuits, meas_basis, None)
+
+    def fit(self, rank=1, standard_weights=True, beta=0.5, seed=None,
+            **kwargs):
+        """Reconstruct a low-rank quantum state.
+
+        Args:
+            rank (int): the rank of the reconstructed state (default: 1).
+            standard_weights (bool, optional): Apply weights to
+                tomography data based on count probability
+                (default: True)
+            beta (float): hedging parameter for converting counts
+                to probabilities (default: 0.5)
+            seed (int or None): seed for the random initial factor
+                (default: None).
+            **kwargs (optional): kwargs for `scipy.optimize.minimize`
+                with the L-BFGS-B method.
+
+        Returns:
+            The fitted density matrix.
+
+        Additional Information:
+            See `fit_factor` for the objective function.
+        """
+        factor = self.fit_factor(rank=rank, standard_weights=standard_weights,
+                                 beta=beta, seed=seed, **kwargs)
+        return factor.dot(factor.T.conj())
+
+    def fit_factor(self, rank=1, standard_weights=True, beta=0.5, seed=None,
+                   **kwargs):
+        """Reconstruct the factor A of a low-rank state rho = A * A^dagger.
+
+        This fitter solves the least-squares minimization:
+        :math:`minimize: \\sum_j w_j^2 (tr(M_j A A^\\dagger) / ||A||^2
+        - f_j)^2`
+        over complex 2^n x rank matrices A, where :math:`M_j` are the
+        measurement operators, :math:`f_j` the measured frequencies and
+        :math:`w_j` the weights. The resulting state is positive
+        semidefinite with unit trace by construction.
+
+        The minimization uses L-BFGS with an analytic gradient. Since the
+        measurement operators are tensor products of single-qubit operators
+        they are applied to A one qubit at a time, so that memory and time
+        per measurement setting scale as rank * 2^n rather than 4^n.
+
+        Args:
+            rank (int): the rank of the reconstructed state (default: 1).
+            standard_weights (bool, optional): Apply weights to
+                tomography data based on count probability
+                (default: True)
+            beta (float): hedging parameter for converting counts
+                to probabilities (default: 0.5)
+            seed (int or None): seed for the random initial factor
+                (default: None).
+            **kwargs (optional): kwargs for `scipy.optimize.minimize`
+                with the L-BFGS-B method.
+
+        Returns:
+            np.array: the 2^n x rank factor A normalized so that
+            rho = A * A^dagger has unit trace.
+        """
+        num_qubits = len(next(iter(self._data)))
+        dim = 2 ** num_qubits
+        ctkeys = count_keys(num_qubits)
+        local_ops = self._local_measurement_ops()
+
+        settings = []
+        for label, cts in self._data.items():
+            cts = np.array([cts.get(key, 0) for key in ctkeys])
+            freqs = cts / np.sum(cts)
+            if standard_weights is True:
+                weights = self._binomial_weights(cts, beta) ** 2
+            else:
+                weights = np.ones(dim)
+            ops = [local_ops[lbl] for lbl in label]
+            settings.append((ops, freqs, weights))
+
+        def objective(params):
+            factor = params[:dim * rank] + 1j * params[dim * rank:]
+            factor = factor.reshape(dim, rank)
+            trace = np.real(np.vdot(factor, factor))
+            value = 0
+            back = np.zeros_like(factor)
+            weighted = 0
+            for ops, freqs, weights in settings:
+                meas = _apply_local_ops(factor, ops, num_qubits)
+                probs = np.sum(np.abs(meas) ** 2, axis=1) / trace
+                resid = probs - freqs
+                value += np.sum(weights * resid ** 2)
+                grad = 2 * weights * resid
+                weighted += np.sum(grad * probs)
+                back += _apply_local_ops(grad[:, None] * meas,
+                                         [op.T.conj() for op in ops],
+                                         num_qubits)
+            # Gradient with respect to conj(A), converted to real parameters
+            grad = (back - weighted * factor) / trace
+            return value, 2 * np.concatenate([np.real(grad).ravel(),
+                                              np.imag(grad).ravel()])
+
+        rng = np.random.RandomState(seed)
+        params = rng.normal(size=2 * dim * rank)
+        res = minimize(objective, params, jac=True, method='L-BFGS-B',
+                       **kwargs)
+        factor = (res.x[:dim * rank] + 1j * res.x[dim * rank:]).reshape(
+            dim, rank)
+        return factor / np.linalg.norm(factor)
+
+    def _local_measurement_ops(self):
+        """Return the single-qubit measurement maps of each label.
+
+        The rows of the returned 2x2 matrix K are such that the measurement
+        operator of outcome j is the outer product of the j-th row of K
+        with its conjugate.
+        """
+        ret = {}
+        for label in self._meas_basis.measurement_labels:
+            rows = []
+            for outcome in range(2):
+                op = np.array(
+                    self._meas_basis.measurement_matrix(label, outcome),
+                    dtype=complex)
+                vals, vecs = np.linalg.eigh(op)
+                if np.sum(np.abs(vals) > 1e-10) != 1:
+                    raise QiskitError(
+                        "Low-rank fitter requires rank-1 measurement "
+                        "operators.")
+                rows.append(np.sqrt(vals[-1]) * vecs[:, -1].conj())
+            ret[label] = np.array(rows)
+        return ret
+
+
+def _apply_local_ops(factor, ops, num_qubits):
+    """Apply a 2x2 matrix to each qubit of the rows of a factor matrix."""
+    tensor = factor.reshape(num_qubits * [2] + [-1])
+    for qubit, op in enumerate(ops):
+        # Qubit j is the axis num_qubits - 1 - j of the row index
+        axis = num_qubits - 1 - qubit
+        tensor = np.moveaxis(np.tensordot(op, tensor, axes=([1], [axis])),
+                             0, axis)
+    return tensor.reshape(factor.shape)
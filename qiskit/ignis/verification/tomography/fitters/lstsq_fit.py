@@ -135,24 +135,59 @@ def make_positive_semidefinite(mat, epsilon=0):
     # Get the eigenvalues and eigenvectors of rho
     # eigenvalues are sorted in increasing order
     # v[i] <= v[i+1]
-
-    dim = len(mat)
     v, w = la.eigh(mat)
-    for j in range(dim):
-        if v[j] < epsilon:
-            tmp = v[j]
-            v[j] = 0.
-            # Rescale remaining eigenvalues
-            x = 0.
-            for k in range(j + 1, dim):
-                x += tmp / (dim - (j + 1))
-                v[k] = v[k] + tmp / (dim - (j + 1))
+    v = _rescale_eigenvalues(v[None, :], epsilon)[0]
 
     # Build positive matrix from the rescaled eigenvalues
     # and the original eigenvectors
+    return np.dot(w * v, w.conj().T).astype(complex, copy=False)
+
+
+def make_positive_semidefinite_batch(mats, epsilon=0):
+    """
+    Rescale a stack of Hermitian matrices to nearest postive semidefinite
+    matrices.
+
+    This is equivalent to applying `make_positive_semidefinite` to each
+    matrix, but computes all eigendecompositions and rescalings in single
+    vectorized calls.
+
+    Args:
+        mats (array like): an array of hermitian matrices of shape
+            (num_matrices, dim, dim).
+        epsilon (float >=0, optional): the threshold for setting
+            eigenvalues to zero. If epsilon > 0 positive eigenvalues
+            below epislon will also be set to zero (Default 0).
+    Returns:
+        The input matrices rescaled to have non-negative eigenvalues.
+    """
 
-    mat_psd = np.zeros([dim, dim], dtype=complex)
-    for j in range(dim):
-        mat_psd += v[j] * np.outer(w[:, j], np.conj(w[:, j]))
+    if epsilon < 0:
+        raise ValueError('epsilon must be non-negative.')
 
-    return mat_psd
+    v, w = np.linalg.eigh(mats)
+    v = _rescale_eigenvalues(v, epsilon)
+    return np.matmul(w * v[:, None, :],
+                     np.conj(np.swapaxes(w, 1, 2))).astype(complex,
+                                                           copy=False)
+
+
+def _rescale_eigenvalues(v, epsilon):
+    """
+    Rescale rows of increasing eigenvalues to be non-negative.
+
+    Eigenvalues below epsilon are set to zero in increasing order and
+    their value is distributed evenly over the remaining larger
+    eigenvalues. If S_j is the sum of the eigenvalues below index j, the
+    j-th eigenvalue has been shifted by S_j / (dim - j) when it is reached,
+    so the number of zeroed eigenvalues is the first index m with
+    v[m] + S_m / (dim - m) >= epsilon.
+    """
+    dim = v.shape[-1]
+    prefix = np.cumsum(v, axis=-1) - v
+    keep = v + prefix / (dim - np.arange(dim)) >= epsilon
+    num_zero = np.where(np.any(keep, axis=-1), np.argmax(keep, axis=-1), dim)
+    shift = prefix[np.arange(len(prefix)),
+                   np.minimum(num_zero, dim - 1)][:, None]
+    shift = shift / np.maximum(dim - num_zero, 1)[:, None]
+    return np.where(np.arange(dim) >= num_zero[:, None], v + shift, 0.)
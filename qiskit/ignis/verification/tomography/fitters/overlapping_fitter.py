@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""
+Overlapping tomography fitter for k-local reduced density matrices
+"""
+
+import itertools as it
+import numpy as np
+
+from qiskit import QiskitError
+from .base_fitter import TomographyFitter
+
+
+class OverlappingTomographyFitter(TomographyFitter):
+    """Batch fitter for the reduced states of overlapping tomography."""
+
+    def __init__(self,
+                 result,
+                 circuits,
+                 k=2,
+                 meas_basis='Pauli'):
+        """Initialize overlapping tomography fitter with experimental data.
+
+        Args:
+            result (Result): a Qiskit Result object obtained from executing
+                overlapping tomography circuits.
+            circuits (list): a list of circuits or circuit names to extract
+                count information from the result object.
+            k (int): the number of qubits of the reduced states (default: 2).
+            meas_basis (TomographyBasis, str): A function to return measurement
+                operators corresponding to measurement outcomes. See
+                Additional Information (default: 'Pauli')
+        """
+        self._k = k
+        super().__init__(result, circuits, meas_basis, None)
+
+    @property
+    def k(self):
+        """Return the number of qubits of the reduced states."""
+        return self._k
+
+    @property
+    def num_qubits(self):
+        """Return the number of measured qubits."""
+        return len(next(iter(self._data)))
+
+    def subsets(self):
+        """Return all k-qubit subsets of the measured qubits."""
+        return list(it.combinations(range(self.num_qubits), self._k))
+
+    def marginal_data(self, subsets=None):
+        """Return the k-local marginal counts of all subsets.
+
+        Args:
+            subsets (list(tuple(int)) or None): the k-qubit subsets of the
+                measured qubits to marginalize over. If None all subsets are
+                used (default: None).
+
+        Returns:
+            tuple: (subsets, labels, counts) where `labels` is the list of
+            k-qubit measurement labels and `counts` is an integer array of
+            shape (len(subsets), len(labels), 2 ** k) of the marginal counts
+            for each subset, label and measurement outcome.
+        """
+        if subsets is None:
+            subsets = self.subsets()
+        subsets = [tuple(sorted(subset)) for subset in subsets]
+        for subset in subsets:
+            if len(subset) != self._k:
+                raise QiskitError(
+                    "Subset {} does not contain k={} qubits".format(
+                        subset, self._k))
+        qubits = np.array(subsets, dtype=int)
+
+        num_labels = len(self._meas_basis.measurement_labels)
+        num_local = num_labels ** self._k
+        num_outcomes = 2 ** self._k
+        settings, setting_idx, outcomes, values = self._count_arrays()
+
+        # Local setting and outcome index of every count for every subset
+        codes = settings[:, qubits].dot(num_labels ** np.arange(self._k))
+        local_outcomes = np.zeros((len(outcomes), len(subsets)), dtype=int)
+        for j in range(self._k):
+            local_outcomes += ((outcomes[:, None] >> qubits[:, j]) & 1) << j
+        index = (num_outcomes * codes[setting_idx] + local_outcomes +
+                 num_local * num_outcomes * np.arange(len(subsets)))
+        counts = np.asarray(np.bincount(
+            index.ravel(), weights=np.repeat(values, len(subsets)),
+            minlength=len(subsets) * num_local * num_outcomes))
+        counts = counts.reshape(len(subsets), num_local, num_outcomes)
+
+        return subsets, self._local_labels(self._k), counts.astype(int)
+
+    def fit(self, method='auto', standard_weights=True, beta=0.5,
+            subsets=None, **kwargs):
+        """Reconstruct all k-local reduced density matrices.
+
+        The marginal counts of every k-qubit subset are computed in a single
+        vectorized pass over the tomography data, and the basis matrix of the
+        k-qubit measurement settings is shared between all subsets. Each
+        reduced state is then fitted as in `StateTomographyFitter.fit`.
+
+        Args:
+            method (str): The fitter method 'auto', 'cvx' or 'lstsq'.
+            standard_weights (bool, optional): Apply weights to
+                tomography data based on count probability
+                (default: True)
+            beta (float): hedging parameter for converting counts
+                to probabilities (default: 0.5)
+            subsets (list(tuple(int)) or None): the k-qubit subsets of the
+                measured qubits to reconstruct. If None all subsets are
+                reconstructed (default: None).
+            **kwargs (optional): kwargs for fitter method.
+
+        Returns:
+            dict: the fitted reduced density matrix of each subset, keyed by
+            the tuple of measured qubit indices of the subset.
+        """
+        subsets, labels, counts = self.marginal_data(subsets)
+        rhos = self._fit_marginals(labels, counts, method=method,
+                                   standard_weights=standard_weights,
+                                   beta=beta, **kwargs)
+        return dict(zip(subsets, rhos))
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""
+Simultaneous tomography fitter for disjoint qubit subsets
+"""
+
+import numpy as np
+
+from .base_fitter import TomographyFitter
+from ..basis.circuits import _format_registers
+
+
+class SimultaneousTomographyFitter(TomographyFitter):
+    """Batch fitter for the states of simultaneous tomography subsets."""
+
+    def __init__(self,
+                 result,
+                 circuits,
+                 qubit_subsets,
+                 meas_basis='Pauli'):
+        """Initialize simultaneous tomography fitter with experimental data.
+
+        Args:
+            result (Result): a Qiskit Result object obtained from executing
+                simultaneous tomography circuits.
+            circuits (list): a list of circuits or circuit names to extract
+                count information from the result object.
+            qubit_subsets (list): the qubit subsets passed to
+                `simultaneous_tomography_circuits`. Each subset may also be
+                given as an int for its number of qubits.
+            meas_basis (TomographyBasis, str): A function to return measurement
+                operators corresponding to measurement outcomes. See
+                Additional Information (default: 'Pauli')
+        """
+        self._sizes = []
+        for subset in qubit_subsets:
+            if isinstance(subset, int):
+                self._sizes.append(subset)
+            elif isinstance(subset, list):
+                self._sizes.append(len(_format_registers(*subset)))
+            else:
+                self._sizes.append(len(_format_registers(subset)))
+        super().__init__(result, circuits, meas_basis, None)
+
+    @property
+    def subset_sizes(self):
+        """Return the number of qubits of each subset."""
+        return self._sizes
+
+    def marginal_data(self):
+        """Return the marginal counts of each subset.
+
+        Returns:
+            list(tuple): a (labels, counts) pair for each subset where
+            `labels` is the list of local measurement labels and `counts` is
+            an integer array of shape (len(labels), 2 ** size) of the
+            marginal counts for each label and measurement outcome.
+        """
+        num_labels = len(self._meas_basis.measurement_labels)
+        settings, setting_idx, outcomes, values = self._count_arrays()
+
+        ret = []
+        offset = 0
+        for size in self._sizes:
+            num_local = num_labels ** size
+            num_outcomes = 2 ** size
+            codes = settings[:, :size].dot(num_labels ** np.arange(size))
+            local_outcomes = (outcomes >> offset) & (num_outcomes - 1)
+            counts = np.asarray(np.bincount(
+                num_outcomes * codes[setting_idx] + local_outcomes,
+                weights=values, minlength=num_local * num_outcomes))
+            counts = counts.reshape(num_local, num_outcomes).astype(int)
+            ret.append((self._local_labels(size), counts))
+            offset += size
+        return ret
+
+    def fit(self, method='auto', standard_weights=True, beta=0.5, **kwargs):
+        """Reconstruct the density matrix of every qubit subset.
+
+        The counts of each subset are split from the shared circuits and
+        subsets of equal size are fitted as one batch sharing the same basis
+        matrix. Each state is fitted as in `StateTomographyFitter.fit`.
+
+        Args:
+            method (str): The fitter method 'auto', 'cvx' or 'lstsq'.
+            standard_weights (bool, optional): Apply weights to
+                tomography data based on count probability
+                (default: True)
+            beta (float): hedging parameter for converting counts
+                to probabilities (default: 0.5)
+            **kwargs (optional): kwargs for fitter method.
+
+        Returns:
+            list(np.array): the fitted density matrix of each subset in the
+            order of `qubit_subsets`.
+        """
+        marginals = self.marginal_data()
+        rhos = len(marginals) * [None]
+        for size in set(self._sizes):
+            idx = [j for j, val in enumerate(self._sizes) if val == size]
+            labels = marginals[idx[0]][0]
+            counts = np.array([marginals[j][1] for j in idx])
+            fits = self._fit_marginals(labels, counts, method=method,
+                                       standard_weights=standard_weights,
+                                       beta=beta, **kwargs)
+            for j, rho in zip(idx, fits):
+                rhos[j] = rho
+        return rhos
@@ -26,7 +26,8 @@ class StateTomographyFitter(TomographyFitter):
     def __init__(self,
                  result,
                  circuits,
-                 meas_basis='Pauli'):
+                 meas_basis='Pauli',
+                 meas_calibration=None):
         """Initialize state tomography fitter with experimental data.
 
         Args:
@@ -37,8 +38,12 @@ class StateTomographyFitter(TomographyFitter):
             meas_basis (TomographyBasis, str): A function to return measurement
                 operators corresponding to measurement outcomes. See
                 Additional Information (default: 'Pauli')
+            meas_calibration (optional): a measurement error calibration
+                fitter or filter. See `set_measure_calibration`
+                (default: None)
         """
-        super().__init__(result, circuits, meas_basis, None)
+        super().__init__(result, circuits, meas_basis, None,
+                         meas_calibration)
 
     def fit(self, method='auto', standard_weights=True, beta=0.5, **kwargs):
         """Reconstruct a quantum state using CVXPY convex optimization.
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring
+
+import unittest
+
+import qiskit
+from qiskit import QuantumRegister, QuantumCircuit, Aer
+
+import qiskit.ignis.verification.classical_shadows as shadows
+
+
+class TestClassicalShadows(unittest.TestCase):
+
+    def test_labels(self):
+        labels = shadows.random_measurement_labels(4, 50, seed=5)
+        self.assertEqual(len(labels), 50)
+        self.assertTrue(all(len(label) == 4 for label in labels))
+        self.assertEqual(labels,
+                         shadows.random_measurement_labels(4, 50, seed=5))
+
+    def test_ghz_observables(self):
+        qr = QuantumRegister(3)
+        ghz = QuantumCircuit(qr)
+        ghz.h(qr[0])
+        ghz.cx(qr[0], qr[1])
+        ghz.cx(qr[1], qr[2])
+
+        circuits = shadows.classical_shadow_circuits(ghz, qr, 1000, seed=5)
+        self.assertEqual(len({circ.name for circ in circuits}), 1000)
+        job = qiskit.execute(circuits, Aer.get_backend('qasm_simulator'),
+                             shots=4, memory=True, seed_simulator=5)
+
+        expected = {'IZZ': 1, 'ZZI': 1, 'IIZ': 0, 'XXX': 1, 'XYY': -1}
+        fitter = shadows.ClassicalShadowFitter(list(expected))
+        # stream the data in two batches
+        fitter.add_data(job.result(), circuits[:500])
+        fitter.add_data(job.result(), circuits[500:])
+        self.assertEqual(fitter.num_snapshots, 4000)
+        estimates = fitter.fit()
+        for label, value in expected.items():
+            self.assertAlmostEqual(estimates[label], value, delta=0.3)
+
+
+if __name__ == '__main__':
+    unittest.main()
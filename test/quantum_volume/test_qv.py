@@ -21,6 +21,8 @@ Run through Quantum volume
 import unittest
 import os
 import pickle
+import numpy as np
+import qiskit
 import qiskit.ignis.verification.quantum_volume as qv
 
 
@@ -70,6 +72,50 @@ class TestQV(unittest.TestCase):
         qv_success_list = qv_fitter.qv_success()
         self.assertFalse(qv_success_list[0][0])
 
+    def test_qv_ideal_probabilities(self):
+        """ Test the ideal probabilities against the statevector simulator"""
+
+        qubit_lists = [[0, 1, 3], [0, 1, 3, 5], [0, 1, 3, 5, 7]]
+        ntrials = 3
+
+        qv_circs, qv_circs_nomeas = qv.qv_circuits(qubit_lists, ntrials)
+
+        backend = qiskit.Aer.get_backend('statevector_simulator')
+        ideal_results = qiskit.execute(
+            [circ for trial in qv_circs_nomeas for circ in trial],
+            backend).result()
+
+        probabilities = qv.qv_ideal_probabilities(qv_circs_nomeas)
+        parallel_probabilities = qv.qv_ideal_probabilities(
+            qv_circs_nomeas, num_processes=2)
+        for trial in qv_circs_nomeas:
+            for circ in trial:
+                statevector = ideal_results.get_statevector(circ.name)
+                np.testing.assert_allclose(
+                    np.abs(statevector) ** 2, probabilities[circ.name],
+                    atol=1e-10)
+                np.testing.assert_array_equal(
+                    probabilities[circ.name],
+                    parallel_probabilities[circ.name])
+
+        qv_fitter = qv.QVFitter(qubit_lists=qubit_lists)
+        qv_fitter.add_statevectors(ideal_results)
+        qv_fitter_ideal = qv.QVFitter(qubit_lists=qubit_lists)
+        qv_fitter_ideal.add_ideal_circuits(qv_circs_nomeas)
+        self.assertEqual(qv_fitter.heavy_outputs,
+                         qv_fitter_ideal.heavy_outputs,
+                         "Error: the heavy outputs differ")
+
+        exp_results = qiskit.execute(
+            [circ for trial in qv_circs for circ in trial],
+            qiskit.Aer.get_backend('qasm_simulator'), shots=128,
+            seed_simulator=10).result()
+        qv_fitter.add_data(exp_results)
+        qv_fitter_ideal.add_data(exp_results)
+        self.assertEqual(qv_fitter.heavy_output_counts,
+                         qv_fitter_ideal.heavy_output_counts,
+                         "Error: the heavy output counts differ")
+
 
 if __name__ == '__main__':
     unittest.main()
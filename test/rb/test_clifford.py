@@ -29,6 +29,10 @@ import numpy as np
 # Import the clifford_utils functions
 from qiskit.ignis.verification.randomized_benchmarking \
     import CliffordUtils as clutils
+from qiskit.ignis.verification.randomized_benchmarking.clifford_utils \
+    import CliffordTable, _TABLE_GATES
+from qiskit.ignis.verification.randomized_benchmarking \
+    import Clifford, PackedClifford, BatchedClifford, SymplecticCliffordUtils
 
 
 class TestClifford(unittest.TestCase):
@@ -69,6 +73,125 @@ class TestClifford(unittest.TestCase):
         self.assertEqual(expected_file_content, test_tables_content,
                          "Error: tables on 1 and 2 qubits are not the same")
 
+    def test_packaged_table(self):
+        """
+            test: the packaged 2 qubit table equals the generated table
+        """
+        clifford2 = self.clutils.clifford2_gates_table()
+        table = self.clutils.load_tables(2)
+        self.assertIsInstance(table, CliffordTable)
+        self.assertEqual(len(table), len(clifford2))
+        self.assertEqual(dict(table.items()), clifford2)
+        # the returned gate lists can be modified
+        key = next(iter(table))
+        table[key].reverse()
+        self.assertEqual(table[key], clifford2[key])
+        with self.assertRaises(KeyError):
+            _ = table[1]
+
+    def test_packed_clifford(self):
+        """
+            test: the packed Clifford equals the Clifford for random gates
+        """
+        rng = np.random.RandomState(1234)
+        gates_1q = ['x', 'y', 'z', 'h', 's', 'sdg', 'v', 'w']
+        gates_2q = ['cx', 'cz', 'swap']
+        for nq in range(1, 5):
+            for _ in range(self.number_of_tests):
+                cliff = Clifford(nq)
+                packed = PackedClifford(nq)
+                for _ in range(20):
+                    if nq > 1 and rng.randint(2):
+                        gate = gates_2q[rng.randint(len(gates_2q))]
+                        qubits = rng.choice(nq, 2, replace=False)
+                    else:
+                        gate = gates_1q[rng.randint(len(gates_1q))]
+                        qubits = [rng.randint(nq)]
+                    getattr(cliff, gate)(*qubits)
+                    getattr(packed, gate)(*qubits)
+                self.assertEqual(packed.index(), cliff.index())
+                self.assertTrue(np.array_equal(packed.table, cliff.table))
+                self.assertTrue(np.array_equal(packed.phases, cliff.phases))
+                self.assertEqual(
+                    PackedClifford.from_clifford(cliff).index(),
+                    cliff.index())
+                self.assertEqual(packed.to_clifford().index(),
+                                 cliff.index())
+
+    def test_batched_clifford(self):
+        """
+            test: the batched Cliffords equal the Cliffords of each
+            Clifford gate list
+        """
+        rng = np.random.RandomState(4321)
+        for nq, num_cliffords in [(1, 24), (2, 11520)]:
+            batch_size = 30
+            batched = BatchedClifford(nq, batch_size)
+            cliffs = [Clifford(nq) for _ in range(batch_size)]
+            for _ in range(5):
+                idx = rng.randint(num_cliffords, size=batch_size)
+                gatelists = [self.clutils.clifford1_gates(i) if nq == 1
+                             else self.clutils.clifford2_gates(i)
+                             for i in idx]
+                codes = np.zeros((batch_size, 10), dtype=int)
+                for row, gatelist in enumerate(gatelists):
+                    codes[row, :len(gatelist)] = [
+                        _TABLE_GATES.index(gate) + 1 for gate in gatelist]
+                    self.clutils.compose_gates(cliffs[row], gatelist)
+                batched.compose_codes(codes)
+            self.assertEqual(batched.index(),
+                             [cliff.index() for cliff in cliffs])
+            # gates on part of the batch
+            batched.h(0, batch=np.arange(0, batch_size, 2))
+            for cliff in cliffs[::2]:
+                cliff.h(0)
+            self.assertEqual(batched.index(),
+                             [cliff.index() for cliff in cliffs])
+
+    def test_index_algebra(self):
+        """
+            test: the products and inverses of canonical Clifford indices
+            equal the Cliffords of the composed gate lists
+        """
+        rng = np.random.RandomState(2468)
+        for nq, num_cliffords in [(1, 24), (2, 11520)]:
+            gates = self.clutils.clifford1_gates if nq == 1 \
+                else self.clutils.clifford2_gates
+            idx1 = rng.randint(num_cliffords, size=200)
+            idx2 = rng.randint(num_cliffords, size=200)
+            products = self.clutils.compose_indices(nq, idx1, idx2)
+            inverses = self.clutils.inverse_index(nq, idx1)
+            for j in range(200):
+                cliff = self.clutils.compose_gates(
+                    Clifford(nq), gates(idx1[j]) + gates(idx2[j]))
+                self.assertEqual(self.clutils.compose_gates(
+                    Clifford(nq), gates(products[j])).index(), cliff.index())
+                self.assertEqual(
+                    self.clutils.index_from_gates(nq, gates(idx1[j])),
+                    idx1[j])
+            self.assertTrue(np.all(self.clutils.compose_indices(
+                nq, idx1, inverses) == 0))
+            self.assertTrue(np.all(self.clutils.compose_indices(
+                nq, inverses, idx1) == 0))
+
+    def test_symplectic_clifford(self):
+        """
+            test: the table-free random n-qubit Cliffords are inverted by
+            their synthesized inverse gates
+        """
+        sutils = SymplecticCliffordUtils()
+        rng = np.random.RandomState(1357)
+        for nq in range(1, 6):
+            for _ in range(self.number_of_tests):
+                gatelist = sutils.random_gates(nq, rng)
+                cliff = sutils.clifford_from_gates(nq, gatelist)
+                sutils.compose_gates(
+                    cliff, sutils.clifford_inverse_gates(cliff))
+                self.assertEqual(cliff.index(), Clifford(nq).index())
+                cliff = sutils.clifford_from_gates(
+                    nq, gatelist + sutils.find_inverse_gates(nq, gatelist))
+                self.assertEqual(cliff.index(), Clifford(nq).index())
+
     def test_random_and_inverse(self):
         """
             test: generating a pseudo-random Clifford using tables
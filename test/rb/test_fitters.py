@@ -23,7 +23,10 @@ import unittest
 import numpy as np
 
 from qiskit.ignis.verification.randomized_benchmarking import \
-    RBFitter, InterleavedRBFitter, PurityRBFitter
+    RBFitter, InterleavedRBFitter, PurityRBFitter, fit_rb_decays
+from qiskit.ignis.verification.randomized_benchmarking.fitters import \
+    _pattern_count_vectors, _walsh_hadamard
+from qiskit.ignis.utils import ResultIndex
 
 
 class TestFitters(unittest.TestCase):
@@ -159,6 +162,99 @@ class TestFitters(unittest.TestCase):
                                tst['expected']['fit'][i]['epc_err']),
                     'Incorrect EPC error in test no. ' + str(tst_index))
 
+    def test_result_index(self):
+        """ Test the result index of the fitters """
+
+        results_file = os.path.join(os.path.dirname(__file__),
+                                    'test_fitter_results_1.pkl')
+        with open(results_file, 'rb') as f:
+            results_list = pickle.load(f)
+
+        index = ResultIndex(results_list)
+        for result in results_list:
+            for experiment in result.results:
+                name = experiment.header.name
+                self.assertEqual(index.locations(name)[0][0], result)
+                self.assertEqual(index.counts(name), result.get_counts(name))
+
+        # add the first seed again, so that its counts are merged over two
+        # results
+        index.add_results(results_list[0])
+        self.assertEqual(len(index.results), len(results_list) + 1)
+        for experiment in results_list[0].results:
+            name = experiment.header.name
+            counts = results_list[0].get_counts(name)
+            self.assertEqual(len(index.locations(name)), 2)
+            self.assertEqual(index.counts(name),
+                             {key: 2 * val for key, val in counts.items()})
+        self.assertNotIn('not a circuit', index)
+        self.assertEqual(index.counts('not a circuit'), {})
+
+    def test_incremental_fitters(self):
+        """ Test that adding data updates the fitters incrementally """
+
+        results_file = os.path.join(os.path.dirname(__file__),
+                                    'test_fitter_results_1.pkl')
+        with open(results_file, 'rb') as f:
+            results_list = pickle.load(f)
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [2, 42, 82, 122, 162, 202, 242, 282, 322, 362]])
+        rb_pattern = [[0, 1], [2]]
+
+        rb_fit = RBFitter(results_list, xdata, rb_pattern)
+
+        inc_fit = RBFitter(None, xdata, rb_pattern)
+        for result in results_list:
+            inc_fit.add_data(result)
+        self.assertEqual(inc_fit.raw_data, rb_fit.raw_data)
+        for fit, inc in zip(rb_fit.fit, inc_fit.fit):
+            self.assertTrue(np.allclose(fit['params'], inc['params'],
+                                        rtol=1e-4))
+
+        # the data added without a fit is used by the next update, and
+        # merged with the data of the same circuits in the new results
+        inc_fit.add_data(results_list[:2], rerun_fit=False)
+        inc_fit.add_data(results_list[2:], rerun_fit=True)
+        self.assertEqual(inc_fit.raw_data, rb_fit.raw_data)
+        inc_fit.calc_data()
+        self.assertEqual(inc_fit.raw_data, rb_fit.raw_data)
+
+    def test_batched_fitters(self):
+        """ Test the batched fit of all the patterns """
+
+        results_file = os.path.join(os.path.dirname(__file__),
+                                    'test_fitter_results_1.pkl')
+        with open(results_file, 'rb') as f:
+            results_list = pickle.load(f)
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [2, 42, 82, 122, 162, 202, 242, 282, 322, 362]])
+        rb_pattern = [[0, 1], [2]]
+
+        rb_fit = RBFitter(results_list, xdata, rb_pattern)
+        # fit from the log-linear guesses
+        batched_fit = RBFitter(None, xdata, rb_pattern)
+        batched_fit.add_data(results_list, rerun_fit=False)
+        batched_fit.calc_data()
+        batched_fit.calc_statistics()
+        batched_fit.fit_data_batched(num_bootstrap=50, seed=10)
+
+        for fit, batched in zip(rb_fit.fit, batched_fit.fit):
+            self.assertTrue(np.allclose(fit['params'], batched['params'],
+                                        rtol=1e-4))
+            self.assertTrue(np.allclose(fit['params_err'],
+                                        batched['params_err'], rtol=1e-3))
+            self.assertAlmostEqual(fit['epc'], batched['epc'], places=6)
+            self.assertEqual(batched['bootstrap_params'].shape, (50, 3))
+            self.assertTrue(np.all(batched['bootstrap_epc'] > 0))
+
+        # a batch of decays without noise
+        lengths = np.arange(1, 200, 20)
+        params = np.array([[0.5, 0.99, 0.5], [0.7, 0.95, 0.25],
+                           [0.6, 0.999, 0.4]])
+        ydata = params[:, 0:1] * params[:, 1:2] ** lengths + params[:, 2:3]
+        fit_params, _ = fit_rb_decays(lengths, ydata, num_qubits=[1, 2, 1])
+        self.assertTrue(np.allclose(fit_params, params, atol=1e-6))
+
     def test_interleaved_fitters(self):
         """ Test the interleaved fitters """
 
@@ -534,6 +630,47 @@ class TestFitters(unittest.TestCase):
                     'Incorrect PEPC error in purity data test no. '
                     + str(tst_index))
 
+    def test_purity_correlators(self):
+        """ Test the count vectors and Walsh-Hadamard transform of the
+        purity fitter against explicit sums """
+
+        # two registers, and patterns of 2, 1 and 2 qubits
+        pattern_sizes = [2, 1, 2]
+        rng = np.random.RandomState(7)
+        counts = {}
+        for outcome in range(32):
+            bits = '{0:05b}'.format(outcome)
+            counts[bits[:2] + ' ' + bits[2:]] = int(rng.randint(100))
+
+        count_vecs = _pattern_count_vectors(counts, pattern_sizes)
+        self.assertEqual([len(vec) for vec in count_vecs], [4, 2, 4])
+        startind = 0
+        for size, vec in zip(pattern_sizes, count_vecs):
+            expected = np.zeros(2 ** size)
+            for key, val in counts.items():
+                bits = key.replace(' ', '')[::-1][startind:startind + size]
+                expected[int(bits[::-1], 2)] += val
+            np.testing.assert_array_equal(vec, expected)
+            startind += size
+
+            # Z-correlators of the pattern
+            expected = [sum((-1) ** bin(i & j).count('1') * vec[j]
+                            for j in range(2 ** size))
+                        for i in range(2 ** size)]
+            np.testing.assert_allclose(_walsh_hadamard(vec), expected)
+
+        # transforms of a stack of vectors
+        vecs = rng.randint(100, size=(3, 8))
+        expected = [[sum((-1) ** bin(i & j).count('1') * vec[j]
+                         for j in range(8))
+                     for i in range(8)] for vec in vecs]
+        np.testing.assert_allclose(_walsh_hadamard(vecs), expected)
+
+        # the Z-correlator dictionaries are deprecated
+        rbfit_purity = PurityRBFitter(None, 9, [[1, 10, 20]], [[0, 1]])
+        with self.assertWarns(DeprecationWarning):
+            rbfit_purity.add_zdict_ops()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -28,6 +28,11 @@ from ddt import ddt, data, unpack
 
 import qiskit
 import qiskit.ignis.verification.randomized_benchmarking as rb
+from qiskit.circuit import Parameter
+from qiskit.extensions.standard import (HGate, XGate, YGate, CnotGate,
+                                        U1Gate, U3Gate)
+from qiskit.providers.aer.noise import NoiseModel
+from qiskit.providers.aer.noise.errors import depolarizing_error
 
 
 @ddt
@@ -580,6 +585,165 @@ class TestRB(unittest.TestCase):
         self.assertEqual(circ_index, len(rb_circs),
                          "Error: additional circuits exist")
 
+    def test_rb_rand_seed(self):
+        """Test that seeded sequences do not depend on the other seeds
+        or on the number of processes."""
+
+        rb_opts = {'length_vector': [1, 3, 5],
+                   'rb_pattern': [[0, 1], [2]],
+                   'interleaved_gates': [['cx 0 1'], ['x 0']],
+                   'rand_seed': 42}
+        rb_circs, _, rb_interleaved_circs = rb.randomized_benchmarking_seq(
+            nseeds=3, **rb_opts)
+        rb_parallel_circs, _, rb_parallel_interleaved_circs = \
+            rb.randomized_benchmarking_seq(nseeds=3, num_processes=2,
+                                           **rb_opts)
+        rb_offset_circs, _, _ = rb.randomized_benchmarking_seq(
+            nseeds=1, seed_offset=2, **rb_opts)
+        self.assertEqual(rb_circs, rb_parallel_circs)
+        self.assertEqual(rb_interleaved_circs,
+                         rb_parallel_interleaved_circs)
+        self.assertEqual(rb_circs[2], rb_offset_circs[0])
+        self.assertNotEqual(rb_circs[0], rb_circs[1])
+
+    def test_rb_symplectic(self):
+        """Test that table-free Clifford RB sequences of more than 2 qubits
+        return the ground state."""
+
+        nq = 4
+        shots = 100
+        rb_opts = {'length_vector': [1, 3],
+                   'rb_pattern': [[0, 1, 2], [3]],
+                   'length_multiplier': [1, 2],
+                   'interleaved_gates': [['cx 0 1', 'h 2'], ['s 0']],
+                   'group_gates': 'symplectic',
+                   'rand_seed': 7}
+        rb_circs, _, rb_interleaved_circs = rb.randomized_benchmarking_seq(
+            nseeds=2, **rb_opts)
+        backend = qiskit.Aer.get_backend('qasm_simulator')
+        basis_gates = ['u1', 'u2', 'u3', 'cx']
+        for circs, is_interleaved in [(rb_circs, False),
+                                      (rb_interleaved_circs, True)]:
+            for seed_circs in circs:
+                result = qiskit.execute(seed_circs, backend=backend,
+                                        basis_gates=basis_gates,
+                                        shots=shots,
+                                        seed_simulator=42).result()
+                for circ, vec_len in zip(seed_circs,
+                                         rb_opts['length_vector']):
+                    self.verify_circuit(circ, nq, rb_opts, vec_len, result,
+                                        shots, is_interleaved)
+
+        with self.assertRaises(ValueError):
+            rb.randomized_benchmarking_seq(rb_pattern=[[0, 1, 2]])
+
+    def test_rb_basis_gates(self):
+        """Test that rb sequences emitted in the u basis return the ground
+        state without transpiling them, and that their gates per Clifford
+        are counted from the circuits and from the native decomposition of
+        their Cliffords."""
+
+        basis_gates = ['u1', 'u2', 'u3', 'cx']
+        qubits = [0, 1, 2]
+        shots = 100
+        rb_opts = {'nseeds': 2, 'length_vector': [1, 4],
+                   'rb_pattern': [[0, 2], [1]], 'length_multiplier': [1, 2],
+                   'basis_gates': basis_gates, 'rand_seed': 5}
+        rb_circs, xdata = rb.randomized_benchmarking_seq(**rb_opts)
+        backend = qiskit.Aer.get_backend('qasm_simulator')
+        for seed_circs in rb_circs:
+            for circ in seed_circs:
+                self.assertTrue(
+                    {op.name for op, _, _ in circ.data} <=
+                    set(basis_gates + ['barrier', 'measure']))
+            qobj = qiskit.assemble(seed_circs, shots=shots)
+            result = backend.run(qobj).result()
+            for circ in seed_circs:
+                self.assertEqual(result.get_counts(circ), {'000': shots})
+
+        gpc = rb.rb_utils.gates_per_clifford(rb_circs, xdata[0], basis_gates,
+                                             qubits)
+        qobjs = [qiskit.assemble(seed_circs) for seed_circs in rb_circs]
+        self.assertTrue(np.allclose(
+            gpc, rb.rb_utils.gates_per_clifford(qobjs, xdata[0],
+                                                basis_gates, qubits)))
+        # arguments which do not change the gates are accepted
+        self.assertTrue(np.allclose(
+            gpc, rb.rb_utils.gates_per_clifford(
+                None, xdata[0], basis_gates, qubits,
+                rb_opts=dict(rb_opts, align_cliffs=True, num_processes=2))))
+        # the 1-qubit Cliffords of qubit 1 have no cx gate
+        self.assertEqual(gpc[1][3], 0)
+        self.assertGreater(gpc[0][3], 0)
+
+        # the sequences of the circuits are only known from rand_seed
+        for opts in [dict(rb_opts, rand_seed=None),
+                     dict(rb_opts, is_purity=True),
+                     dict(rb_opts, interleaved_gates=[['x 0'], ['x 0']])]:
+            with self.assertRaises(ValueError):
+                rb.rb_utils.gates_per_clifford(None, xdata[0], basis_gates,
+                                               qubits, rb_opts=opts)
+
+    def test_rb_decomposition_table(self):
+        """Test that rb sequences emitted with a decomposition table return
+        the ground state and have their own gate instances."""
+
+        table = {'h': [(HGate(), [0])], 's': [(U1Gate(np.pi / 2), [0])],
+                 'sdg': [(U1Gate(-np.pi / 2), [0])],
+                 'v': [(U1Gate(-np.pi / 2), [0]), (HGate(), [0])],
+                 'w': [(HGate(), [0]), (U1Gate(np.pi / 2), [0])],
+                 'x': [(XGate(), [0])], 'y': [(YGate(), [0])],
+                 'z': [(U1Gate(np.pi), [0])], 'cx': [(CnotGate(), [0, 1])]}
+        shots = 100
+        rb_circs, _ = rb.randomized_benchmarking_seq(
+            nseeds=1, length_vector=[1, 3], rb_pattern=[[0, 1]],
+            basis_gates=table, rand_seed=3)
+        table_gates = [gate for gates in table.values()
+                       for gate, _ in gates]
+        for circ in rb_circs[0]:
+            for op, _, _ in circ.data:
+                for gate in table_gates:
+                    self.assertIsNot(op, gate)
+                    self.assertIsNot(op.params, gate.params)
+        result = qiskit.execute(rb_circs[0],
+                                qiskit.Aer.get_backend('qasm_simulator'),
+                                shots=shots, seed_simulator=1).result()
+        for circ in rb_circs[0]:
+            self.assertEqual(result.get_counts(circ), {'00': shots})
+
+        # the table instructions cannot have unbound parameters
+        table['h'] = [(U3Gate(Parameter('theta'), 0, np.pi), [0])]
+        with self.assertRaises(ValueError):
+            rb.randomized_benchmarking_seq(rb_pattern=[[0, 1]],
+                                           basis_gates=table)
+
+    def test_adaptive_rb(self):
+        """Test that the adaptive rb driver chooses its batches from the
+        candidate lengths and stops at the target uncertainty."""
+
+        noise_model = NoiseModel()
+        noise_model.add_all_qubit_quantum_error(
+            depolarizing_error(0.01, 1), ['u1', 'u2', 'u3'])
+        candidate_lengths = np.arange(1, 200, 10)
+        adaptive_rb = rb.AdaptiveRB(
+            qiskit.Aer.get_backend('qasm_simulator'),
+            length_vector=[1, 10, 30, 60],
+            candidate_lengths=candidate_lengths, nseeds=2, max_seeds=8,
+            target_rel_err=0.2, shots=200, rand_seed=5,
+            run_config={'noise_model': noise_model,
+                        'basis_gates': ['u1', 'u2', 'u3'],
+                        'seed_simulator': 3})
+        fit = adaptive_rb.run()
+
+        self.assertTrue(adaptive_rb.converged)
+        self.assertLessEqual(adaptive_rb.seeds, 8)
+        self.assertEqual(adaptive_rb.batches[0]['lengths'], [1, 10, 30, 60])
+        for batch in adaptive_rb.batches[1:]:
+            self.assertTrue(set(batch['lengths']) <= set(candidate_lengths))
+        self.assertLessEqual(fit[0]['epc_err'], 0.2 * fit[0]['epc'])
+        self.assertGreater(fit[0]['epc'], 0.001)
+        self.assertLess(fit[0]['epc'], 0.01)
+
     def test_rb_utils(self):
         """Test some of the utility calculations, e.g. coherence limit."""
 
@@ -606,6 +770,60 @@ class TestRB(unittest.TestCase):
         self.assertAlmostEqual(twoq_epc, 0.0446283, 6,
                                "Error: 2Q EPC Calculation")
 
+    @staticmethod
+    def count_gates_loop(qobj, basis, qubits):
+        """Count the gates of a qobj instruction by instruction."""
+        ngates = np.zeros([len(qobj.experiments), len(qubits), len(basis)],
+                          dtype=int)
+        for i, experiment in enumerate(qobj.experiments):
+            for instr in experiment.instructions:
+                if instr.name in basis:
+                    for qind, qubit in enumerate(qubits):
+                        if qubit in instr.qubits:
+                            ngates[i][qind][basis.index(instr.name)] += 1
+        return ngates
+
+    def test_count_gates(self):
+        """Test the gate counts of qobjs and circuits against the counts
+        of their instructions one at a time."""
+
+        basis = ['u1', 'u2', 'u3', 'cx']
+        qubits = [0, 1, 2]
+        rb_circs, xdata = rb.randomized_benchmarking_seq(
+            nseeds=3, length_vector=[1, 3, 6], rb_pattern=[[0, 2], [1]],
+            basis_gates=basis, rand_seed=11)
+        qobjs = [qiskit.assemble(seed_circs) for seed_circs in rb_circs]
+        for seed_circs, qobj in zip(rb_circs, qobjs):
+            expected = self.count_gates_loop(qobj, basis, qubits)
+            np.testing.assert_array_equal(
+                rb.rb_utils.count_gates(qobj, basis, qubits), expected)
+            np.testing.assert_array_equal(
+                rb.rb_utils.count_gates(seed_circs, basis, qubits), expected)
+
+        # gates per Clifford of several seeds
+        ngates = sum(np.sum(self.count_gates_loop(qobj, basis, qubits),
+                            axis=0) for qobj in qobjs)
+        expected = ngates / (len(qobjs) * np.sum(xdata[0] + 1))
+        for qobj_list in [qobjs, rb_circs]:
+            np.testing.assert_allclose(
+                rb.rb_utils.gates_per_clifford(qobj_list, xdata[0], basis,
+                                               qubits), expected)
+
+        # qubits of several registers are numbered across the registers
+        qr_a = qiskit.QuantumRegister(2, 'a')
+        qr_b = qiskit.QuantumRegister(2, 'b')
+        circ = qiskit.QuantumCircuit(qr_a, qr_b)
+        circ.u1(0.1, qr_a[0])
+        circ.u2(0.2, 0.3, qr_b[0])
+        circ.u2(0.2, 0.3, qr_b[1])
+        circ.cx(qr_a[1], qr_b[0])
+        circ.measure_all()
+        for count_qubits in [[0, 1], [0, 1, 2, 3], [3, 2]]:
+            np.testing.assert_array_equal(
+                rb.rb_utils.count_gates(circ, basis, count_qubits),
+                self.count_gates_loop(qiskit.assemble(circ), basis,
+                                      count_qubits))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring
+
+import unittest
+
+import numpy
+import qiskit
+from qiskit import QuantumRegister, QuantumCircuit, Aer
+from qiskit.quantum_info import Pauli
+
+import qiskit.ignis.verification.tomography as tomo
+from qiskit.ignis.verification.tomography.basis.circuits import \
+    _pauli_expectations, _pauli_label
+
+
+def run_direct_fidelity(circuit, qubits, target):
+    circuits, paulis = tomo.direct_fidelity_circuits(
+        circuit, qubits, target, 200, seed=11)
+    job = qiskit.execute(circuits, Aer.get_backend('qasm_simulator'),
+                         shots=2000, seed_simulator=11)
+    fitter = tomo.DirectFidelityFitter(job.result(), circuits, target, paulis)
+    return len(circuits), fitter.fit()
+
+
+class TestDirectFidelity(unittest.TestCase):
+
+    def setUp(self):
+        self.qr = QuantumRegister(3)
+        self.ghz = QuantumCircuit(self.qr)
+        self.ghz.h(self.qr[0])
+        self.ghz.cx(self.qr[0], self.qr[1])
+        self.ghz.cx(self.qr[1], self.qr[2])
+        job = qiskit.execute(self.ghz,
+                             Aer.get_backend('statevector_simulator'))
+        self.psi = job.result().get_statevector(self.ghz)
+
+    def test_pauli_expectations(self):
+        rho = numpy.outer(self.psi, self.psi.conj())
+        expvals = _pauli_expectations(rho)
+        for x in range(8):
+            for z in range(8):
+                op = Pauli.from_label(_pauli_label(x, z, 3)).to_matrix()
+                self.assertAlmostEqual(expvals[x, z],
+                                       numpy.real(numpy.trace(rho.dot(op))))
+
+    def test_ghz_fidelity(self):
+        num_circuits, fid = run_direct_fidelity(self.ghz, self.qr, self.psi)
+        # GHZ has 8 non-zero Pauli expectation values
+        self.assertLessEqual(num_circuits, 8)
+        self.assertAlmostEqual(fid, 1, places=1)
+
+    def test_orthogonal_fidelity(self):
+        circ = self.ghz.copy()
+        circ.z(self.qr[0])
+        _, fid = run_direct_fidelity(circ, self.qr, self.psi)
+        self.assertAlmostEqual(fid, 0, delta=0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring
+
+import unittest
+
+import numpy
+import qiskit
+from qiskit import QuantumRegister, QuantumCircuit, Aer
+from qiskit.quantum_info import state_fidelity
+
+import qiskit.ignis.verification.tomography as tomo
+
+
+class TestLowRankTomography(unittest.TestCase):
+
+    def test_random_labels(self):
+        labels = tomo.basis.random_tomography_labels(3, 27, seed=2)
+        self.assertEqual(len(set(labels)), 27)
+        with self.assertRaises(qiskit.QiskitError):
+            tomo.basis.random_tomography_labels(2, 10)
+
+    def test_ghz_5_qubits(self):
+        qr = QuantumRegister(5)
+        circ = QuantumCircuit(qr)
+        circ.h(qr[0])
+        for j in range(4):
+            circ.cx(qr[j], qr[j + 1])
+        circ.u3(0.3, 0.2, 0.1, qr[2])
+        job = qiskit.execute(circ, Aer.get_backend('statevector_simulator'))
+        psi = job.result().get_statevector(circ)
+
+        # 40 of the 243 Pauli measurement settings
+        labels = tomo.basis.random_tomography_labels(5, 40, seed=1)
+        qst = tomo.state_tomography_circuits(circ, qr, meas_labels=labels)
+        job = qiskit.execute(qst, Aer.get_backend('qasm_simulator'),
+                             shots=2000, seed_simulator=1)
+        fitter = tomo.LowRankTomographyFitter(job.result(), qst)
+
+        factor = fitter.fit_factor(rank=1, seed=0)
+        self.assertEqual(factor.shape, (32, 1))
+        self.assertAlmostEqual(numpy.linalg.norm(factor), 1)
+        rho = fitter.fit(rank=1, seed=0)
+        self.assertAlmostEqual(numpy.real(numpy.trace(rho)), 1)
+        self.assertGreater(state_fidelity(psi, rho), 0.95)
+
+
+if __name__ == '__main__':
+    unittest.main()
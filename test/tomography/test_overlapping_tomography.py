@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring
+
+import itertools as it
+import unittest
+
+import numpy
+import qiskit
+from qiskit import QuantumRegister, QuantumCircuit, Aer
+from qiskit.quantum_info import state_fidelity
+
+import qiskit.ignis.verification.tomography as tomo
+
+
+def reduced_state(psi, qubits):
+    """Partial trace of a statevector onto the given (sorted) qubits."""
+    num_qubits = int(numpy.log2(len(psi)))
+    # axis j of the tensor is qubit num_qubits - 1 - j
+    axes = [num_qubits - 1 - q for q in reversed(qubits)]
+    rest = [j for j in range(num_qubits) if j not in axes]
+    tensor = numpy.reshape(psi, num_qubits * [2])
+    tensor = numpy.transpose(tensor, axes + rest)
+    tensor = numpy.reshape(tensor, (2 ** len(qubits), -1))
+    return tensor.dot(tensor.conj().T)
+
+
+class TestOverlappingTomography(unittest.TestCase):
+
+    def test_labels_cover_all_subsets(self):
+        for num_qubits, k in [(4, 2), (5, 3)]:
+            labels = tomo.basis.overlapping_measurement_labels(
+                num_qubits, k, seed=42)
+            self.assertEqual(len(labels), len(set(labels)))
+            for subset in it.combinations(range(num_qubits), k):
+                local = {tuple(label[q] for q in subset) for label in labels}
+                self.assertEqual(len(local), 3 ** k)
+
+    def test_invalid_k(self):
+        with self.assertRaises(qiskit.QiskitError):
+            tomo.basis.overlapping_measurement_labels(3, 4)
+
+    def test_pair_states_4_qubits(self):
+        qr = QuantumRegister(4)
+        circ = QuantumCircuit(qr)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.u3(0.7, 0, 0, qr[2])
+        circ.cx(qr[2], qr[3])
+        circ.h(qr[3])
+
+        job = qiskit.execute(circ, Aer.get_backend('statevector_simulator'))
+        psi = job.result().get_statevector(circ)
+
+        qst = tomo.overlapping_tomography_circuits(circ, qr, k=2, seed=7)
+        job = qiskit.execute(qst, Aer.get_backend('qasm_simulator'),
+                             shots=5000, seed_simulator=7)
+        fitter = tomo.OverlappingTomographyFitter(job.result(), qst, k=2)
+        rhos = fitter.fit(method='lstsq')
+        self.assertEqual(sorted(rhos), fitter.subsets())
+        for subset, rho in rhos.items():
+            fid = state_fidelity(reduced_state(psi, subset), rho)
+            self.assertAlmostEqual(fid, 1, places=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
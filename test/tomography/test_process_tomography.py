@@ -15,13 +15,17 @@
 # pylint: disable=missing-docstring
 
 import unittest
+from ast import literal_eval
 
 import qiskit
 from qiskit import QuantumRegister, QuantumCircuit, Aer
+from qiskit.circuit import Parameter
 from qiskit.quantum_info import state_fidelity
 from qiskit.tools.qi.qi import outer
 
 import qiskit.ignis.verification.tomography as tomo
+from qiskit.ignis.verification.tomography.basis.paulibasis import (
+    pauli_measurement_circuit, pauli_preparation_circuit)
 
 
 def run_circuit_and_tomography(circuit, qubits):
@@ -52,5 +56,47 @@ class TestProcessTomography(unittest.TestCase):
         self.assertAlmostEqual(F_bell_mle, 1, places=1)
 
 
+class TestProcessTomographyCircuits(unittest.TestCase):
+
+    def setUp(self):
+        self.qr = QuantumRegister(2)
+        self.theta = Parameter('theta')
+        self.circ = QuantumCircuit(self.qr)
+        self.circ.h(self.qr[0])
+        self.circ.rz(self.theta, self.qr[1])
+        self.circ.cx(self.qr[0], self.qr[1])
+
+    def test_circuits_match_reference(self):
+        qpt = tomo.process_tomography_circuits(self.circ, self.qr)
+        self.assertEqual(len(qpt), 144)
+        for circ in qpt:
+            pl, ml = literal_eval(circ.name)
+            clbits = circ.cregs[0]
+            prep = QuantumCircuit(*circ.qregs, *circ.cregs)
+            for j in range(2):
+                prep += pauli_preparation_circuit(pl[j], self.qr[j])
+            prep.barrier(self.qr)
+            prep += self.circ
+            meas = QuantumCircuit(*circ.qregs, *circ.cregs)
+            meas.barrier(self.qr)
+            for j in range(2):
+                meas += pauli_measurement_circuit(ml[j], self.qr[j],
+                                                  clbits[j])
+            self.assertEqual(circ, prep + meas)
+            self.assertEqual(circ.parameters, {self.theta})
+
+    def test_lazy_generator(self):
+        qpt = tomo.process_tomography_circuits(self.circ, self.qr)
+        lazy = tomo.process_tomography_circuits(self.circ, self.qr,
+                                                lazy=True)
+        self.assertFalse(isinstance(lazy, list))
+        lazy = list(lazy)
+        self.assertEqual([circ.name for circ in lazy],
+                         [circ.name for circ in qpt])
+        for circ1, circ2 in zip(qpt, lazy):
+            self.assertEqual([inst.name for inst, _, _ in circ1.data],
+                             [inst.name for inst, _, _ in circ2.data])
+
+
 if __name__ == '__main__':
     unittest.main()
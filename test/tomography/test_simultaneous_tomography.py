@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring
+
+import unittest
+
+import numpy
+import qiskit
+from qiskit import QuantumRegister, QuantumCircuit, Aer
+from qiskit.quantum_info import state_fidelity
+
+import qiskit.ignis.verification.tomography as tomo
+
+
+class TestSimultaneousTomography(unittest.TestCase):
+
+    def test_disjoint_subsets(self):
+        qr = QuantumRegister(5)
+        circ = QuantumCircuit(qr)
+        # Bell state on (0, 3), single qubit state on 1, product on (4, 2)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[3])
+        circ.u3(1, 1, 1, qr[1])
+        circ.x(qr[4])
+        circ.h(qr[2])
+        subsets = [[qr[0], qr[3]], [qr[1]], [qr[4], qr[2]]]
+
+        qst = tomo.simultaneous_tomography_circuits(circ, subsets)
+        self.assertEqual(len(qst), 9)
+        job = qiskit.execute(qst, Aer.get_backend('qasm_simulator'),
+                             shots=5000, seed_simulator=3)
+        fitter = tomo.SimultaneousTomographyFitter(job.result(), qst,
+                                                   subsets)
+        rhos = fitter.fit(method='lstsq')
+
+        bell = numpy.array([1, 0, 0, 1]) / numpy.sqrt(2)
+        single = numpy.array([numpy.cos(0.5),
+                              numpy.exp(1j) * numpy.sin(0.5)])
+        # qubit 4 in |1> is the first qubit of the last subset
+        product = numpy.kron(numpy.array([1, 1]) / numpy.sqrt(2),
+                             numpy.array([0, 1]))
+        for psi, rho in zip([bell, single, product], rhos):
+            self.assertAlmostEqual(state_fidelity(psi, rho), 1, places=1)
+
+    def test_overlapping_subsets(self):
+        qr = QuantumRegister(3)
+        circ = QuantumCircuit(qr)
+        with self.assertRaises(qiskit.QiskitError):
+            tomo.simultaneous_tomography_circuits(
+                circ, [[qr[0], qr[1]], [qr[1], qr[2]]])
+
+
+if __name__ == '__main__':
+    unittest.main()
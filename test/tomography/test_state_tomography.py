@@ -21,8 +21,38 @@ import qiskit
 from qiskit import QuantumRegister, QuantumCircuit, Aer
 from qiskit.quantum_info import state_fidelity
 
+from qiskit.providers.aer.noise import NoiseModel
+from qiskit.providers.aer.noise.errors import ReadoutError
+
 import qiskit.ignis.verification.tomography as tomo
 import qiskit.ignis.verification.tomography.fitters.cvx_fit as cvx_fit
+import qiskit.ignis.verification.tomography.fitters.lstsq_fit as lstsq_fit
+from qiskit.ignis.mitigation.measurement import (complete_meas_cal,
+                                                 tensored_meas_cal,
+                                                 CompleteMeasFitter,
+                                                 TensoredMeasFitter)
+
+
+def loop_positive_semidefinite(mat, epsilon=0):
+    # Reference implementation of the wizard eigenvalue rescaling
+    dim = len(mat)
+    v, w = numpy.linalg.eigh(mat)
+    for j in range(dim):
+        if v[j] < epsilon:
+            tmp = v[j]
+            v[j] = 0.
+            for k in range(j + 1, dim):
+                v[k] = v[k] + tmp / (dim - (j + 1))
+    mat_psd = numpy.zeros([dim, dim], dtype=complex)
+    for j in range(dim):
+        mat_psd += v[j] * numpy.outer(w[:, j], numpy.conj(w[:, j]))
+    return mat_psd
+
+
+def random_hermitian(dim, seed):
+    rng = numpy.random.RandomState(seed)
+    mat = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+    return (mat + mat.conj().T) / 2
 
 
 def run_circuit_and_tomography(circuit, qubits):
@@ -56,6 +86,25 @@ class TestFitter(unittest.TestCase):
             rho = cvx_fit.cvx_fit(p, A, trace=trace_value)
             self.assertAlmostEqual(numpy.trace(rho), trace_value, places=3)
 
+    def test_make_positive_semidefinite(self):
+        for seed in range(5):
+            mat = random_hermitian(8, seed)
+            for epsilon in [0, 0.5]:
+                numpy.testing.assert_allclose(
+                    lstsq_fit.make_positive_semidefinite(mat, epsilon),
+                    loop_positive_semidefinite(mat, epsilon), atol=1e-10)
+        # All eigenvalues below epsilon
+        numpy.testing.assert_allclose(
+            lstsq_fit.make_positive_semidefinite(-numpy.eye(4)),
+            numpy.zeros((4, 4)))
+
+    def test_make_positive_semidefinite_batch(self):
+        mats = numpy.array([random_hermitian(4, seed) for seed in range(6)])
+        psd = lstsq_fit.make_positive_semidefinite_batch(mats, 0.1)
+        for mat, mat_psd in zip(mats, psd):
+            numpy.testing.assert_allclose(
+                mat_psd, loop_positive_semidefinite(mat, 0.1), atol=1e-10)
+
 
 class TestStateTomography(unittest.TestCase):
 
@@ -111,6 +160,76 @@ class TestStateTomography(unittest.TestCase):
         F_bell_mle = state_fidelity(psi, rho_mle)
         self.assertAlmostEqual(F_bell_mle, 1, places=1)
 
+    def test_parameterized_template(self):
+        q2 = QuantumRegister(2)
+        bell = QuantumCircuit(q2)
+        bell.h(q2[0])
+        bell.cx(q2[0], q2[1])
+        psi = numpy.array([1, 0, 0, 1]) / numpy.sqrt(2)
+
+        template, bindings = tomo.state_tomography_template(bell, q2)
+        self.assertEqual(len(template.parameters), 6)
+        self.assertEqual(len(bindings), 9)
+        # Transpile once and bind every label
+        template = qiskit.transpile(template, basis_gates=['u3', 'cx'])
+        qst = tomo.bind_tomography_template(template, bindings)
+        self.assertTrue(all(not circ.parameters for circ in qst))
+        job = qiskit.execute(qst, Aer.get_backend('qasm_simulator'),
+                             shots=5000)
+        fitter = tomo.StateTomographyFitter(job.result(), list(bindings))
+        rho = fitter.fit(method='lstsq')
+        self.assertAlmostEqual(state_fidelity(psi, rho), 1, places=1)
+
+
+class TestReadoutCalibratedTomography(unittest.TestCase):
+
+    def setUp(self):
+        self.qr = QuantumRegister(2)
+        self.bell = QuantumCircuit(self.qr)
+        self.bell.h(self.qr[0])
+        self.bell.cx(self.qr[0], self.qr[1])
+        self.psi = numpy.array([1, 0, 0, 1]) / numpy.sqrt(2)
+
+        self.noise_model = NoiseModel()
+        self.noise_model.add_readout_error(
+            ReadoutError([[0.9, 0.1], [0.25, 0.75]]), [0])
+        self.noise_model.add_readout_error(
+            ReadoutError([[0.95, 0.05], [0.15, 0.85]]), [1])
+
+    def execute(self, circuits):
+        return qiskit.execute(circuits, Aer.get_backend('qasm_simulator'),
+                              noise_model=self.noise_model, shots=10000,
+                              seed_simulator=5).result()
+
+    def test_complete_calibration(self):
+        cal_circs, state_labels = complete_meas_cal(qr=self.qr)
+        meas_fitter = CompleteMeasFitter(self.execute(cal_circs),
+                                         state_labels)
+        qst = tomo.state_tomography_circuits(self.bell, self.qr)
+        result = self.execute(qst)
+
+        rho_raw = tomo.StateTomographyFitter(result, qst).fit(
+            method='lstsq')
+        for calibration in [meas_fitter, meas_fitter.filter]:
+            rho = tomo.StateTomographyFitter(
+                result, qst, meas_calibration=calibration).fit(
+                    method='lstsq')
+            self.assertAlmostEqual(state_fidelity(self.psi, rho), 1,
+                                   places=1)
+            self.assertGreater(state_fidelity(self.psi, rho),
+                               state_fidelity(self.psi, rho_raw) + 0.1)
+
+    def test_tensored_calibration(self):
+        cal_circs, mit_pattern = tensored_meas_cal(
+            mit_pattern=[[0], [1]], qr=self.qr)
+        meas_fitter = TensoredMeasFitter(self.execute(cal_circs),
+                                         mit_pattern=mit_pattern)
+        qst = tomo.state_tomography_circuits(self.bell, self.qr)
+        fitter = tomo.StateTomographyFitter(self.execute(qst), qst,
+                                            meas_calibration=meas_fitter)
+        rho = fitter.fit(method='lstsq')
+        self.assertAlmostEqual(state_fidelity(self.psi, rho), 1, places=1)
+
 
 if __name__ == '__main__':
     unittest.main()